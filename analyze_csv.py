@@ -6,6 +6,7 @@ E-commerce Review Analysis PoC - Custom CSV Version
 3. 개선 액션 제안 생성
 """
 
+import argparse
 import os
 import sys
 
@@ -18,25 +19,29 @@ from core.utils.analysis_workflow import (
     summarize_results,
 )
 from core.utils.cli_helpers import (
+    add_chunked_arguments,
     filter_and_check_negative,
+    load_negative_chunked_and_check,
     print_analysis_complete,
     print_section,
     require_openai_key,
 )
 
 
-def validate_csv_path():
-    """Validate CLI args and return the CSV path."""
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_csv.py <path_to_csv_file>")
-        print("\nExample:")
-        print("  python analyze_csv.py APPLE_iPhone_SE.csv")
-        sys.exit(1)
-    return sys.argv[1]
+def parse_args():
+    """Parse CLI args (CSV path + streaming options)."""
+    parser = argparse.ArgumentParser(
+        description="E-commerce Review Analysis PoC - Custom CSV",
+        epilog="Example:\n  python analyze_csv.py APPLE_iPhone_SE.csv",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("csv_path", help="path_to_csv_file (Ratings, Reviews 컬럼)")
+    add_chunked_arguments(parser)
+    return parser.parse_args()
 
 
-def load_reviews(csv_path, loader):
-    """Load reviews from custom CSV file."""
+def load_reviews(csv_path, loader, load=None):
+    """Load reviews from custom CSV file (or run `load` with the same error handling)."""
     if not os.path.exists(csv_path):
         print(f"\n[Error] File not found: {csv_path}")
         sys.exit(1)
@@ -45,7 +50,7 @@ def load_reviews(csv_path, loader):
     print_section("Step 1: Loading Data")
 
     try:
-        df = loader.load_custom_csv(csv_path)
+        df = load() if load is not None else loader.load_custom_csv(csv_path)
     except Exception as e:  # pylint: disable=broad-except
         print(f"\n[Error] Error loading data: {e}")
         sys.exit(1)
@@ -53,24 +58,36 @@ def load_reviews(csv_path, loader):
 
 
 def main():
-    csv_path = validate_csv_path()
+    args = parse_args()
+    csv_path = args.csv_path
     require_openai_key()
 
     loader = DataLoader()
     analyzer = ReviewAnalyzer()
 
-    df = load_reviews(csv_path, loader)
-    negative_df = filter_and_check_negative(loader, df)
+    if args.chunked:
+        negative_df, stats = load_reviews(csv_path, loader, lambda: load_negative_chunked_and_check(
+            loader, loader.iter_custom_csv(csv_path, chunk_size=args.chunk_size)
+        ))
+        df, total_reviews = None, stats['total_reviews']
+    else:
+        df = load_reviews(csv_path, loader)
+        negative_df = filter_and_check_negative(loader, df)
+        total_reviews = len(df)
     recent_df, comparison_df = split_by_period(negative_df, loader)
     recent_categorization, comparison_categorization = analyze_periods(
         analyzer, recent_df, comparison_df, allow_empty_comparison=True
     )
+    # No series: custom CSV dates are synthetic, so the daily surge detector would track noise
     top_issues, emerging_issues = summarize_results(
         analyzer, recent_categorization, comparison_categorization
     )
 
-    generate_and_print_action_plan(analyzer, top_issues, emerging_issues)
-    print_analysis_complete(df, negative_df, f"분석 파일: {csv_path}")
+    scope = os.path.splitext(os.path.basename(csv_path))[0]
+    generate_and_print_action_plan(analyzer, top_issues, emerging_issues, scope=scope)
+    print_analysis_complete(
+        df, negative_df, f"분석 파일: {csv_path}", total_reviews=total_reviews
+    )
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -12,10 +13,24 @@ if PROJECT_ROOT not in sys.path:
 from backend.routers import (  # pylint: disable=wrong-import-position
     analysis,
     data,
+    metrics,
     reply,
 )
+from core.utils.openai_client import (  # pylint: disable=wrong-import-position
+    aclose_async_client,
+)
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    yield
+    # 공유 AsyncOpenAI 커넥션 풀 정리
+    await aclose_async_client()
 
-app = FastAPI(title="Review Analysis Dashboard API", version="1.0.0")
+
+app = FastAPI(
+    title="Review Analysis Dashboard API", version="1.0.0", lifespan=lifespan
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,6 +43,7 @@ app.add_middleware(
 app.include_router(data.router, prefix="/api/data", tags=["data"])
 app.include_router(analysis.router, prefix="/api/analysis", tags=["analysis"])
 app.include_router(reply.router, prefix="/api/reply", tags=["reply"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
 
 
 @app.get("/api/health")
@@ -1,4 +1,3 @@
-import asyncio
 import glob as g
 import json
 import logging
@@ -23,8 +22,8 @@ async def run_analysis():
 
     try:
         rating_threshold = analysis_settings.get("rating_threshold", 3)
-        result = await asyncio.to_thread(
-            run_full_analysis, csv_path, rating_threshold=rating_threshold
+        result = await run_full_analysis(
+            csv_path, rating_threshold=rating_threshold
         )
         return result
     except Exception as e:
@@ -3,7 +3,6 @@ import os
 import tempfile
 from pathlib import Path
 
-import pandas as pd
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 from pydantic import BaseModel, Field
 
@@ -13,6 +12,7 @@ from backend.services.crawler_service import (
     save_reviews_to_csv,
 )
 from backend.services.priority_service import score_and_sort
+from core.data_loader import TEXT_DTYPE, read_csv_fast, read_csv_header
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -49,7 +49,7 @@ async def upload_csv(file: UploadFile = File(...)):
         tmp_path = tmp.name
 
     try:
-        df = pd.read_csv(tmp_path)
+        columns = read_csv_header(tmp_path)
     except Exception as exc:
         os.unlink(tmp_path)
         raise HTTPException(
@@ -58,10 +58,10 @@ async def upload_csv(file: UploadFile = File(...)):
 
     # Ratings/Reviews 또는 rating/review_text 컬럼 확인
     has_custom = (
-        "Ratings" in df.columns and "Reviews" in df.columns
+        "Ratings" in columns and "Reviews" in columns
     )
     has_eval = (
-        "review_text" in df.columns and "rating" in df.columns
+        "review_text" in columns and "rating" in columns
     )
 
     if not has_custom and not has_eval:
@@ -72,6 +72,18 @@ async def upload_csv(file: UploadFile = File(...)):
             "'rating'/'review_text' 컬럼이 필요합니다.",
         )
 
+    # 분석에 쓰는 두 컬럼만 파싱
+    rating_col, text_col = ("Ratings", "Reviews") if has_custom else ("rating", "review_text")
+    try:
+        df = read_csv_fast(
+            tmp_path, usecols=[rating_col, text_col], dtype={text_col: TEXT_DTYPE}
+        )
+    except Exception as exc:
+        os.unlink(tmp_path)
+        raise HTTPException(
+            400, "CSV 파일을 파싱할 수 없습니다."
+        ) from exc
+
     # evaluation_dataset 형식이면 Ratings/Reviews로 변환
     if has_eval and not has_custom:
         df = df.rename(
@@ -100,7 +112,11 @@ def use_sample_data():
 
     # 컬럼명 변환하여 임시 파일로 저장
     try:
-        df = pd.read_csv(sample_path)
+        df = read_csv_fast(
+            sample_path,
+            usecols=["rating", "review_text"],
+            dtype={"review_text": TEXT_DTYPE},
+        )
     except Exception as exc:
         logger.exception("샘플 데이터 파싱 실패")
         raise HTTPException(
@@ -205,7 +221,7 @@ def get_reviews(
             "먼저 CSV 파일을 업로드하거나 크롤링해주세요.",
         )
 
-    df = pd.read_csv(csv_path).fillna("")
+    df = read_csv_fast(csv_path, dtype={"Reviews": TEXT_DTYPE}).fillna("")
     total = len(df)
 
     # 페이지네이션
@@ -236,7 +252,7 @@ def get_prioritized_reviews(
             "먼저 CSV 파일을 업로드하거나 크롤링해주세요.",
         )
 
-    df = pd.read_csv(csv_path).fillna("")
+    df = read_csv_fast(csv_path, dtype={"Reviews": TEXT_DTYPE}).fillna("")
     threshold = analysis_settings["rating_threshold"]
 
     # 부정 리뷰만 필터링
@@ -0,0 +1,48 @@
+"""LLM 사용량/지연 메트릭 API (Prometheus 텍스트 형식)"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.utils.llm_cache import cache_stats
+from core.utils.llm_metrics import render_prometheus
+from core.utils.rate_limiter import get_rate_limiter
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _extra_metrics():
+    """(gauges, counters): 시점 값은 gauge, 단조 증가하는 누적 값은 counter"""
+    gauges, counters = {}, {}
+    limiter = get_rate_limiter()
+    if limiter is not None:
+        stats = limiter.stats()
+        for key, name, help_text in [
+            ("acquired", "acquired_total", "LLM calls that passed the rate limiter"),
+            ("waited", "waited_total", "LLM calls that had to queue in the rate limiter"),
+            ("wait_seconds_total", "wait_seconds_total",
+             "Total rate limiter queue wait in seconds"),
+        ]:
+            counters[f"llm_rate_limit_{name}"] = (help_text, stats[key])
+        gauges["llm_rate_limit_wait_seconds_max"] = (
+            "Longest rate limiter queue wait in seconds", stats["wait_seconds_max"]
+        )
+
+    cache = cache_stats()
+    if cache is not None:
+        gauges["llm_response_cache_entries"] = (
+            "Entries in the LLM response cache", cache["entries"]
+        )
+        gauges["llm_response_cache_bytes"] = (
+            "Size of the LLM response cache in bytes", cache["bytes"]
+        )
+    return gauges, counters
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics():
+    gauges, counters = _extra_metrics()
+    return PlainTextResponse(
+        render_prometheus(gauges, counters), media_type=PROMETHEUS_CONTENT_TYPE
+    )
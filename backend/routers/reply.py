@@ -1,9 +1,10 @@
 """리뷰 답변 생성 API"""
 
-import asyncio
+import json
 import logging
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from core.reply_generator import ReplyGenerator
@@ -33,8 +34,7 @@ async def generate_reply(request: SingleReplyRequest):
     """단일 리뷰에 대한 맞춤 답변 생성"""
     try:
         generator = ReplyGenerator()
-        result = await asyncio.to_thread(
-            generator.generate_single,
+        result = await generator.generate_single_async(
             request.review_text,
             request.rating,
             request.category,
@@ -45,19 +45,43 @@ async def generate_reply(request: SingleReplyRequest):
         raise HTTPException(500, "답변 생성 중 오류가 발생했습니다.") from None
 
 
+MAX_BATCH_REVIEWS = 50
+
+
+def _check_batch_size(request: BatchReplyRequest):
+    if len(request.reviews) > MAX_BATCH_REVIEWS:
+        raise HTTPException(400, f"최대 {MAX_BATCH_REVIEWS}건까지 일괄 생성 가능합니다.")
+
+
 @router.post("/generate-batch")
 async def generate_batch_replies(request: BatchReplyRequest):
     """다건 리뷰에 대한 답변 일괄 생성"""
-    if len(request.reviews) > 50:
-        raise HTTPException(400, "최대 50건까지 일괄 생성 가능합니다.")
+    _check_batch_size(request)
 
     try:
         generator = ReplyGenerator()
         reviews_dicts = [r.model_dump() for r in request.reviews]
-        results = await asyncio.to_thread(
-            generator.generate_batch, reviews_dicts
-        )
+        results = await generator.generate_batch_async(reviews_dicts)
         return {"replies": results}
     except Exception:
         logger.exception("일괄 답변 생성 실패")
         raise HTTPException(500, "일괄 답변 생성 중 오류가 발생했습니다.") from None
+
+
+@router.post("/generate-batch/stream")
+async def stream_batch_replies(request: BatchReplyRequest):
+    """다건 리뷰 답변을 완성되는 대로 NDJSON(한 줄에 답변 하나)으로 전송"""
+    _check_batch_size(request)
+    reviews_dicts = [r.model_dump() for r in request.reviews]
+
+    async def _lines():
+        try:
+            async for reply in ReplyGenerator().stream_batch_async(reviews_dicts):
+                yield json.dumps(reply, ensure_ascii=False) + "\n"
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("스트리밍 답변 생성 실패")
+            yield json.dumps(
+                {"error": "일괄 답변 생성 중 오류가 발생했습니다."}, ensure_ascii=False
+            ) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from collections import Counter
 
 from backend.services.priority_service import score_and_sort
 from backend.services.progress import update as update_progress
@@ -8,8 +8,6 @@ from core.data_loader import DataLoader
 
 logger = logging.getLogger(__name__)
 
-MAX_REVIEW_SAMPLE = 200
-
 
 def _compute_stats(df, negative_df, rating_threshold):
     """통계 및 평점 분포 계산"""
@@ -29,54 +27,71 @@ def _compute_stats(df, negative_df, rating_threshold):
     }
 
 
-def _categorize_periods(loader, analyzer, negative_df):
-    """기간별 LLM 분류 수행 (최대 200건 샘플링)"""
+def _stream_progress(step, start, end, parts=1):
+    """
+    스트리밍 분류 항목이 도착할 때마다 start~end 구간에서 진행률 갱신
+
+    동시에 도는 분류 parts개가 구간 하나를 공유한다. 반환값은 분류별 콜백 목록이며,
+    진행률은 전체 (완료 항목 / 요청 항목) 비율이다.
+    """
+    done = [0] * parts
+    totals = [0] * parts
+
+    def _callback(index):
+        def _on_progress(part_done, part_total):
+            done[index], totals[index] = part_done, part_total
+            all_done, all_total = sum(done), sum(totals)
+            percent = start + (end - start) * all_done // max(all_total, 1)
+            update_progress(f"{step} ({all_done}/{all_total})", min(percent, end))
+
+        return _on_progress
+
+    return [_callback(index) for index in range(parts)]
+
+
+async def _categorize_periods(loader, analyzer, negative_df):
+    """기간별 LLM 분류 수행 (층화 표본 또는 전수 map-reduce, 두 기간 동시 실행)"""
     update_progress("기간별 데이터 분할 중", 30)
     recent_df, comparison_df = loader.split_by_period(
         negative_df
     )
 
-    recent_reviews = (
-        recent_df["review_text"].dropna().tolist()
-    )
-    if not recent_reviews:
+    if recent_df["review_text"].dropna().empty:
         logger.warning(
             "최근 기간 리뷰가 없어 emerging issues 감지가 "
             "제한됩니다."
         )
 
-    update_progress("최근 리뷰 GPT 분류 중", 35)
-    recent_cat = (
-        analyzer.categorize_issues(
-            recent_reviews[:MAX_REVIEW_SAMPLE]
-        )
-        if recent_reviews
-        else {"categories": []}
-    )
-
-    update_progress("이전 리뷰 GPT 분류 중", 55)
-    comparison_reviews = (
-        comparison_df["review_text"].dropna().tolist()
+    update_progress("최근/이전 리뷰 GPT 분류 중", 35)
+    recent_progress, comparison_progress = _stream_progress(
+        "최근/이전 리뷰 GPT 분류 중", 35, 75, parts=2
     )
-    comparison_cat = (
-        analyzer.categorize_issues(
-            comparison_reviews[:MAX_REVIEW_SAMPLE]
-        )
-        if comparison_reviews
-        else {"categories": []}
+    recent_cat, comparison_cat = await asyncio.gather(
+        analyzer.categorize_period_async(recent_df, on_progress=recent_progress),
+        analyzer.categorize_period_async(comparison_df, on_progress=comparison_progress),
     )
 
     return recent_cat, comparison_cat
 
 
-def run_full_analysis(
+def _score_priority_reviews(negative_df):
+    """우선순위 상위 20개 부정 리뷰 (CPU 전용, LLM 대기와 겹쳐 스레드에서 실행)"""
+    negative_reviews_raw = (
+        negative_df.fillna("").rename(
+            columns={"review_text": "Reviews", "rating": "Ratings"}
+        ).to_dict(orient="records")
+    )
+    return score_and_sort(negative_reviews_raw)[:20]
+
+
+async def run_full_analysis(
     csv_path: str, rating_threshold: int = 3
 ) -> dict:
     loader = DataLoader()
     analyzer = ReviewAnalyzer()
 
     update_progress("데이터 로딩 중", 22)
-    df = loader.load_custom_csv(csv_path)
+    df = await asyncio.to_thread(loader.load_custom_csv, csv_path)
 
     update_progress("부정 리뷰 필터링 중", 25)
     negative_df = loader.filter_negative_reviews(
@@ -94,43 +109,42 @@ def run_full_analysis(
             "recommendations": ["부정 리뷰가 없습니다."],
         }
 
-    recent_cat, comparison_cat = _categorize_periods(
-        loader, analyzer, negative_df
+    # 우선순위 스코어링은 LLM 분류/개선안 생성을 기다리는 동안 스레드에서 진행
+    priority_task = asyncio.create_task(
+        asyncio.to_thread(_score_priority_reviews, negative_df)
     )
+    try:
+        recent_cat, comparison_cat = await _categorize_periods(
+            loader, analyzer, negative_df
+        )
 
-    update_progress("Top 이슈 분석 중", 75)
-    top_issues = analyzer.get_top_issues(
-        recent_cat, top_n=3
-    )
-    all_cats = [
-        item["category"]
-        for item in recent_cat.get("categories", [])
-    ]
-
-    update_progress("급증 이슈 탐지 중", 78)
-    emerging_issues = analyzer.detect_emerging_issues(
-        recent_cat, comparison_cat
-    )
+        update_progress("Top 이슈 분석 중", 75)
+        top_issues = analyzer.get_top_issues(
+            recent_cat, top_n=3
+        )
 
-    update_progress("AI 개선 액션 생성 중", 80)
-    recommendations = analyzer.generate_action_plan(
-        top_issues, emerging_issues,
-        categorization_result=recent_cat,
-    )
+        update_progress("급증 이슈 탐지 중", 78)
+        emerging_issues = analyzer.detect_emerging_issues(
+            recent_cat, comparison_cat
+        )
 
-    update_progress("우선순위 스코어링 중", 90)
-    negative_reviews_raw = (
-        negative_df.fillna("").rename(
-            columns={"review_text": "Reviews", "rating": "Ratings"}
-        ).to_dict(orient="records")
-    )
-    priority_reviews = score_and_sort(negative_reviews_raw)[:20]
+        update_progress("AI 개선 액션 생성 중", 80)
+        recommendations = await analyzer.generate_action_plan_async(
+            top_issues, emerging_issues,
+            categorization_result=recent_cat,
+            scope=csv_path,
+        )
+
+        update_progress("우선순위 스코어링 중", 90)
+        priority_reviews = await priority_task
+    finally:
+        priority_task.cancel()  # 중간에 실패했을 때만 의미 있음 (완료된 task는 무시)
 
     update_progress("완료", 100)
     return {
         "stats": stats,
         "top_issues": top_issues,
-        "all_categories": dict(Counter(all_cats)),
+        "all_categories": analyzer.get_category_counts(recent_cat),
         "emerging_issues": emerging_issues,
         "recommendations": recommendations,
         "priority_reviews": priority_reviews,
@@ -1,8 +1,49 @@
-from collections import Counter
+import asyncio
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 
+from core import config
+from core.categorization_result import CategorizationResult
+from core.utils.action_plan_cache import (
+    get_action_plan_cache,
+    issue_profile,
+    profile_key,
+)
+from core.utils.category_series import (
+    attach_days,
+    daily_category_counts,
+    get_category_series_store,
+    is_exact,
+)
+from core.utils.compact_categories import (
+    COMPACT_KEY,
+    decode_categories,
+    decode_category_item,
+)
+from core.utils.dedup import group_duplicates
 from core.utils.json_utils import extract_json_from_text
-from core.utils.openai_client import call_openai_json, get_client
-from core.utils.prompt_templates import build_zero_shot_prompt, format_reviews
+from core.utils.label_store import get_label_store, review_hash
+from core.utils.local_classifier import get_local_classifier
+from core.utils.openai_client import (
+    call_openai_json,
+    call_openai_json_async,
+    get_client,
+    stream_openai_json_items_async,
+)
+from core.utils.prompt_templates import (
+    build_compact_prompt,
+    build_zero_shot_prompt,
+    format_reviews,
+)
+from core.utils.sampling import (
+    STRATUM_KEY,
+    attach_strata,
+    estimate_category_totals,
+    stratified_sample,
+)
+from core.utils.token_budget import count_tokens, pack_reviews
 
 SYSTEM_PROMPT_ANALYST = (
     "당신은 이커머스 고객 피드백을 분석하고 "
@@ -14,78 +55,399 @@ SYSTEM_PROMPT_CONSULTANT = (
     "반드시 한국어로 응답하세요."
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _build_categorization_prompt(reviews_text, review_count):
+    if config.LLM_COMPACT_OUTPUT:
+        return build_compact_prompt(
+            reviews_text, review_count, brief_issue=config.LLM_COMPACT_BRIEF_ISSUE
+        )
+    return build_zero_shot_prompt(reviews_text, review_count)
+
+
+def _output_tokens_per_review():
+    if not config.LLM_COMPACT_OUTPUT:
+        return config.LLM_CATEGORY_TOKENS_PER_REVIEW
+    if config.LLM_COMPACT_BRIEF_ISSUE:
+        return config.LLM_COMPACT_TOKENS_PER_REVIEW
+    return config.LLM_COMPACT_CODE_TOKENS_PER_REVIEW
+
+
+def _prompt_overhead_tokens():
+    return (
+        count_tokens(_build_categorization_prompt("", 0))
+        + count_tokens(SYSTEM_PROMPT_ANALYST)
+    )
+
+
+class _PromptChunk:
+    """One categorization request: packed reviews and their label-store hashes"""
+
+    def __init__(self, hashes, batch):
+        self.hashes = hashes
+        self.prompt = _build_categorization_prompt(format_reviews(batch.reviews), len(batch))
+        self.input_tokens = batch.input_tokens
+        self.output_tokens = batch.output_tokens
+
+
+class _CategorizationPlan:
+    """Per-review memo lookup for one categorize_issues call.
+
+    Reviews already in the label store are resolved up front, then the
+    local classifier (if any) labels the misses it is confident about; the
+    remaining unique misses are collapsed into near-duplicate clusters (config.DEDUP_ENABLED)
+    and only one representative per cluster is packed into up to max_chunks
+    prompts within the token budget. Each answer is fanned out to every
+    cluster member, so counts keep the full cluster weight, and merged back
+    in the original order (review_number is renumbered over the whole
+    input). Misses that did not fit in any chunk are left out of the result.
+    """
+
+    def __init__(self, reviews, label_store, labeler, max_chunks=1, classifier=None):
+        self.label_store = label_store
+        self.labeler = labeler
+        self.hashes = [review_hash(text) for text in reviews]
+        self.labels = (
+            label_store.get_many(self.hashes, labeler) if label_store else {}
+        )
+
+        first_seen = {}
+        for text_hash, text in zip(self.hashes, reviews):
+            if text_hash not in self.labels:
+                first_seen.setdefault(text_hash, text)
+        self.texts = dict(first_seen)
+
+        if classifier is not None and first_seen:
+            local_labels = classifier.label_confident(first_seen)
+            self.labels.update(local_labels)
+            first_seen = {h: t for h, t in first_seen.items() if h not in local_labels}
+            logger.info(
+                "categorize_issues: local classifier labeled %d/%d unlabeled reviews",
+                len(local_labels), len(self.texts),
+            )
+
+        miss_hashes = list(first_seen)
+        miss_texts = list(first_seen.values())
+        if config.DEDUP_ENABLED and len(miss_texts) > 1:
+            representatives, members = group_duplicates(miss_texts)
+        else:
+            representatives = list(range(len(miss_texts)))
+            members = [[i] for i in representatives]
+        self.members = {
+            miss_hashes[rep]: [miss_hashes[i] for i in group]
+            for rep, group in zip(representatives, members)
+        }
+        miss_hashes = [miss_hashes[rep] for rep in representatives]
+        batches = pack_reviews(
+            [miss_texts[rep] for rep in representatives],
+            overhead_tokens=_prompt_overhead_tokens(),
+            output_tokens_per_review=_output_tokens_per_review(),
+        )
+        self.chunks = [
+            _PromptChunk([miss_hashes[i] for i in batch.indices], batch)
+            for batch in islice(batches, max_chunks)
+        ]
+        if self.chunks:
+            logger.info(
+                "categorize_issues: packed %d/%d unlabeled review clusters "
+                "(%d unique reviews) into %d request(s) (~%d input / ~%d output tokens)",
+                self.miss_count, len(miss_hashes), len(first_seen), len(self.chunks),
+                sum(chunk.input_tokens for chunk in self.chunks),
+                sum(chunk.output_tokens for chunk in self.chunks),
+            )
+
+    @property
+    def miss_count(self):
+        return sum(len(chunk.hashes) for chunk in self.chunks)
+
+    def add_llm_result(self, chunk, llm_result):
+        """Map review_number in a miss-only chunk prompt back to every member hash"""
+        new_labels = {}
+        for item in llm_result.get('categories', []):
+            number = item.get('review_number')
+            if (
+                not isinstance(number, int)
+                or not 1 <= number <= len(chunk.hashes)
+                or 'category' not in item
+            ):
+                logger.warning("Ignoring malformed categorization item: %s", item)
+                continue
+            label = {
+                'category': item['category'],
+                'brief_issue': item.get('brief_issue', ''),
+            }
+            for member_hash in self.members[chunk.hashes[number - 1]]:
+                new_labels[member_hash] = label
+
+        if self.label_store and new_labels:
+            self.label_store.put_many(new_labels, self.labeler, texts=self.texts)
+        self.labels.update(new_labels)
+
+    def result(self):
+        categories = [
+            {'review_number': i, **self.labels[text_hash]}
+            for i, text_hash in enumerate(self.hashes, 1)
+            if text_hash in self.labels
+        ]
+        return CategorizationResult(categories)
+
 
 class ReviewAnalyzer:
     def __init__(self):
         self.client = get_client()
 
-    def categorize_issues(self, reviews_text_list, sample_size=200):
-        """Categorize issues from reviews using LLM"""
-        # Sample reviews to avoid token limits
+    def _plan_categorization(self, reviews_text_list, sample_size, full_corpus):
+        # The token budget decides how many reviews fit; sample_size is an optional hard cap
         sampled_reviews = (
             reviews_text_list[:sample_size]
-            if len(reviews_text_list) > sample_size
+            if sample_size is not None
             else reviews_text_list
         )
+        if full_corpus is None:
+            full_corpus = config.CATEGORIZE_FULL_CORPUS
+        label_store = get_label_store()
+        return _CategorizationPlan(
+            sampled_reviews,
+            label_store,
+            config.LLM_MODEL,
+            max_chunks=None if full_corpus else 1,
+            classifier=get_local_classifier(label_store, config.LLM_MODEL),
+        )
 
-        reviews_text = format_reviews(sampled_reviews)
-        prompt = build_zero_shot_prompt(reviews_text, len(sampled_reviews))
+    def _parse_categorization(self, content):
+        result = extract_json_from_text(content)
+        if result is None:
+            raise ValueError("Failed to parse categorization JSON response.")
+        return decode_categories(result)
 
+    def _categorize_chunk(self, chunk):
         content = call_openai_json(
             self.client,
-            prompt,
+            chunk.prompt,
             system_prompt=SYSTEM_PROMPT_ANALYST,
+            call_site="categorize_issues",
         )
-        result = extract_json_from_text(content)
-        if result is None:
-            raise ValueError("Failed to parse categorization JSON response.")
+        return self._parse_categorization(content)
+
+    async def _categorize_chunk_async(self, chunk, on_item=None):
+        if on_item is None:
+            content = await call_openai_json_async(
+                chunk.prompt,
+                system_prompt=SYSTEM_PROMPT_ANALYST,
+                call_site="categorize_issues",
+            )
+            return self._parse_categorization(content)
+
+        items = []
+        async for row in stream_openai_json_items_async(
+            chunk.prompt,
+            COMPACT_KEY if config.LLM_COMPACT_OUTPUT else 'categories',
+            system_prompt=SYSTEM_PROMPT_ANALYST,
+            call_site="categorize_issues",
+        ):
+            item = decode_category_item(row)
+            if item is not None:
+                items.append(item)
+                on_item()
+        return {'categories': items}
+
+    def categorize_issues(self, reviews_text_list, sample_size=None, full_corpus=None):
+        """Categorize issues from reviews using LLM (only reviews not labeled before)
+
+        Reviews the local classifier is confident about never reach the LLM.
+        Unlabeled reviews are packed into one request up to
+        config.LLM_INPUT_TOKEN_BUDGET / LLM_OUTPUT_TOKEN_BUDGET. With
+        full_corpus (default: config.CATEGORIZE_FULL_CORPUS) every review is
+        packed into as many requests as needed, categorized concurrently
+        (map) and merged into one result (reduce).
+        """
+        plan = self._plan_categorization(reviews_text_list, sample_size, full_corpus)
+        if len(plan.chunks) == 1:
+            plan.add_llm_result(plan.chunks[0], self._categorize_chunk(plan.chunks[0]))
+        elif plan.chunks:
+            workers = min(config.LLM_MAP_REDUCE_CONCURRENCY, len(plan.chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._categorize_chunk, chunk): chunk
+                    for chunk in plan.chunks
+                }
+                for future in as_completed(futures):
+                    try:
+                        plan.add_llm_result(futures[future], future.result())
+                    except ValueError:
+                        logger.warning("Skipping categorization chunk with unparsable response")
+        return plan.result()
+
+    async def categorize_issues_async(
+        self, reviews_text_list, sample_size=None, on_progress=None, full_corpus=None
+    ):
+        """Async version of categorize_issues for the event loop (backend)
+
+        With on_progress(done, total) the completions are streamed and the
+        callback fires as each categorized review arrives. Planning (label
+        store lookups, local classifier (re)training, dedup and packing) runs
+        in a worker thread so it never blocks the event loop.
+        """
+        plan = await asyncio.to_thread(
+            self._plan_categorization, reviews_text_list, sample_size, full_corpus
+        )
+        if not plan.chunks:
+            return plan.result()
+
+        progress = {'done': 0}
+
+        def _on_item():
+            progress['done'] += 1
+            on_progress(progress['done'], plan.miss_count)
+
+        on_item = _on_item if on_progress is not None else None
+        if len(plan.chunks) == 1:
+            chunk = plan.chunks[0]
+            plan.add_llm_result(chunk, await self._categorize_chunk_async(chunk, on_item))
+            return plan.result()
+
+        semaphore = asyncio.Semaphore(config.LLM_MAP_REDUCE_CONCURRENCY)
+
+        async def _run(chunk):
+            async with semaphore:
+                try:
+                    result = await self._categorize_chunk_async(chunk, on_item)
+                except ValueError:
+                    logger.warning("Skipping categorization chunk with unparsable response")
+                    return
+            plan.add_llm_result(chunk, result)
+
+        await asyncio.gather(*(_run(chunk) for chunk in plan.chunks))
+        return plan.result()
+
+    def _sample_period(self, period_df, full_corpus):
+        period_df = period_df.dropna(subset=['review_text'])
+        if full_corpus is None:
+            full_corpus = config.CATEGORIZE_FULL_CORPUS
+        if full_corpus or len(period_df) <= config.CATEGORIZATION_SAMPLE_SIZE:
+            return period_df, None
+
+        hashes = [review_hash(text) for text in period_df['review_text']]
+        label_store = get_label_store()
+        if label_store and label_store.count_labeled(hashes, config.LLM_MODEL) == len(set(hashes)):
+            # Every review already has a stored label: exact counts, no LLM call
+            return period_df, None
+        return stratified_sample(
+            period_df, config.CATEGORIZATION_SAMPLE_SIZE, order_keys=hashes
+        )
+
+    @staticmethod
+    def _annotate_period(result, sample, population):
+        if population:
+            attach_strata(result, sample[STRATUM_KEY].tolist(), population)
+        if 'created_at' in sample.columns:
+            attach_days(result, sample['created_at'])
         return result
 
+    def categorize_period(self, period_df, full_corpus=None):
+        """Categorize a period's reviews (DataFrame with review_text, rating, created_at)
+
+        Unless the full corpus is categorized, a stratified sample of
+        config.CATEGORIZATION_SAMPLE_SIZE reviews is sent and the result
+        carries the strata needed for population estimates. The sample is
+        hash-ordered, so re-running with another rating threshold or window
+        mostly picks reviews that already have stored labels; a period whose
+        reviews are all labeled is aggregated from the label store alone.
+        Items also carry the review day for the daily category series.
+        """
+        sample, population = self._sample_period(period_df, full_corpus)
+        if sample.empty:
+            return CategorizationResult()
+        result = self.categorize_issues(sample['review_text'].tolist(), full_corpus=full_corpus)
+        return self._annotate_period(result, sample, population)
+
+    async def categorize_period_async(self, period_df, on_progress=None, full_corpus=None):
+        """Async version of categorize_period for the event loop (backend)"""
+        # Hashing and the label-store lookup scale with the period size
+        sample, population = await asyncio.to_thread(
+            self._sample_period, period_df, full_corpus
+        )
+        if sample.empty:
+            return CategorizationResult()
+        result = await self.categorize_issues_async(
+            sample['review_text'].tolist(), on_progress=on_progress, full_corpus=full_corpus
+        )
+        return self._annotate_period(result, sample, population)
+
+    @staticmethod
+    def get_category_counts(categorization_result):
+        """{category: count} in first-seen order
+
+        For a stratified sample, counts are rounded population estimates
+        (the same counts get_top_issues reports), not raw sample counts.
+        """
+        result = CategorizationResult.of(categorization_result)
+        if not result.get('population'):
+            return result.counts()
+        estimates, _ = estimate_category_totals(result)
+        return {
+            category: round(estimates[category]['estimate'])
+            for category in result.category_names
+        }
+
     def get_top_issues(self, categorization_result, top_n=3):
-        """Extract top N issues from categorization result"""
-        categories = categorization_result.get('categories', [])
-        category_list = [item['category'] for item in categories]
+        """Extract top N issues from categorization result
 
-        # Count occurrences
-        category_counts = Counter(category_list)
-        top_issues = category_counts.most_common(top_n)
+        For a stratified sample, issues are ranked by the population
+        estimate: count is the estimated population count (consistent with
+        percentage) and sample_count / count_ci / percentage_ci are added.
+        """
+        result = CategorizationResult.of(categorization_result)
+        sampled = bool(result.get('population'))
+        estimates, population_size = estimate_category_totals(result)
 
-        # Get example reviews for each top issue
+        top_issues = sorted(
+            result.category_names,
+            key=lambda category: estimates[category]['estimate'],
+            reverse=True,
+        )[:top_n]
+
+        counts = self.get_category_counts(result)
         top_issues_with_examples = []
-        for category, count in top_issues:
-            examples = [
-                item['brief_issue']
-                for item in categories
-                if item['category'] == category
-            ][:3]  # Get up to 3 examples
-
-            top_issues_with_examples.append({
+        for category in top_issues:
+            estimate = estimates[category]
+            issue = {
                 'category': category,
-                'count': count,
-                'percentage': round(count / len(categories) * 100, 1),
-                'examples': examples
-            })
+                'count': counts[category],
+                'percentage': round(estimate['estimate'] / population_size * 100, 1),
+                'examples': result.examples(category, 3)
+            }
+            if sampled:
+                issue['sample_count'] = result.count(category)
+                issue['count_ci'] = [round(estimate['ci_low']), round(estimate['ci_high'])]
+                issue['percentage_ci'] = [
+                    round(estimate['ci_low'] / population_size * 100, 1),
+                    round(estimate['ci_high'] / population_size * 100, 1),
+                ]
+            top_issues_with_examples.append(issue)
 
         return top_issues_with_examples
 
     def detect_emerging_issues(self, recent_categorization, comparison_categorization):
-        """Detect issues that are increasing in the recent period"""
-        recent_categories = [
-            item['category'] for item in recent_categorization.get('categories', [])
-        ]
-        comparison_categories = [
-            item['category']
-            for item in comparison_categorization.get('categories', [])
-        ]
+        """Detect issues that are increasing in the recent period
 
-        recent_counts = Counter(recent_categories)
-        comparison_counts = Counter(comparison_categories)
+        Stratified samples are compared on population estimates
+        (with recent_ci / comparison_ci) rather than raw sample counts.
+        """
+        recent_estimates, _ = estimate_category_totals(recent_categorization)
+        comparison_estimates, _ = estimate_category_totals(comparison_categorization)
+        sampled = bool(
+            recent_categorization.get('population')
+            or comparison_categorization.get('population')
+        )
 
         # Calculate increase rate for each category
         emerging = []
-        for category in recent_counts:
-            recent_count = recent_counts[category]
-            comparison_count = comparison_counts.get(category, 0)
+        for category, recent in recent_estimates.items():
+            recent_count = round(recent['estimate'])
+            comparison = comparison_estimates.get(category)
+            comparison_count = round(comparison['estimate']) if comparison else 0
 
             # Calculate rate (avoiding division by zero)
             if comparison_count == 0:
@@ -98,43 +460,86 @@ class ReviewAnalyzer:
 
             # Only consider if there's an increase
             if increase_rate > 0.2:  # At least 20% increase
-                emerging.append({
+                issue = {
                     'category': category,
                     'recent_count': recent_count,
                     'comparison_count': comparison_count,
                     'increase_rate': round(increase_rate * 100, 1)
-                })
+                }
+                if sampled:
+                    issue['recent_ci'] = [round(recent['ci_low']), round(recent['ci_high'])]
+                    issue['comparison_ci'] = (
+                        [round(comparison['ci_low']), round(comparison['ci_high'])]
+                        if comparison else [0, 0]
+                    )
+                emerging.append(issue)
 
         # Sort by increase rate
         emerging.sort(key=lambda x: x['increase_rate'], reverse=True)
 
         return emerging[:3]  # Return top 3 emerging issues
 
-    def generate_action_plan(  # pylint: disable=too-many-locals
+    def update_issue_series(self, series, *categorizations):
+        """Persist daily category counts and run the incremental surge detector
+
+        Only days after the last processed one are fed to the detector, so
+        each run costs O(categories) per new day regardless of history.
+        Needs real review dates: custom CSVs (and so the backend upload
+        path) only have synthetic created_at values and are not fed.
+        The detector assumes Poisson counts, so only exact (full corpus or
+        fully labeled) categorizations are recorded; if any period was
+        sampled nothing is stored and no surges are reported.
+
+        Args:
+            series: Product/dataset key the counts belong to
+            categorizations: categorize_period results (items carry 'day')
+
+        Returns:
+            Newly detected surges with p-values, most significant first
+        """
+        store = get_category_series_store()
+        if store is None:
+            return []
+        if not all(is_exact(categorization) for categorization in categorizations):
+            logger.info(
+                "Skipping daily series for %s: sampled counts are not exact "
+                "(set CATEGORIZE_FULL_CORPUS=1)", series
+            )
+            return []
+        # The boundary day can appear in both periods: sum, don't overwrite
+        daily = defaultdict(lambda: defaultdict(float))
+        for categorization in categorizations:
+            for day, counts in daily_category_counts(categorization).items():
+                for category, count in counts.items():
+                    daily[day][category] += count
+        store.record_counts(series, {day: dict(counts) for day, counts in daily.items()})
+        surges = store.update_detector(series)
+        surges.sort(key=lambda surge: surge['p_value'])
+        return surges
+
+    def _build_action_plan_prompt(
         self, top_issues, emerging_issues, categorization_result=None
     ):
-        """Generate actionable recommendations based on analysis"""
         top_issues_text = ""
         for issue in top_issues:
             examples_text = "\n".join(
                 f"    - \"{ex}\"" for ex in issue.get('examples', [])
             )
+            count_text = f"{issue['count']}건"
+            if 'sample_count' in issue:
+                count_text += f" 추정, 표본 {issue['sample_count']}건 기준"
             top_issues_text += (
-                f"\n### {issue['category']} ({issue['count']}건, {issue['percentage']}%)\n"
+                f"\n### {issue['category']} ({count_text}, {issue['percentage']}%)\n"
                 f"  고객 원문 예시:\n{examples_text}\n"
             )
 
         # 카테고리별 실제 리뷰 원문 수집
         review_context = ""
         if categorization_result:
-            categories = categorization_result.get('categories', [])
-            top_category_names = [issue['category'] for issue in top_issues]
-            for cat_name in top_category_names:
-                cat_reviews = [
-                    item['brief_issue']
-                    for item in categories
-                    if item['category'] == cat_name
-                ][:5]
+            result = CategorizationResult.of(categorization_result)
+            for issue in top_issues:
+                cat_name = issue['category']
+                cat_reviews = result.examples(cat_name, 5)
                 if cat_reviews:
                     review_context += f"\n[{cat_name}] 고객 불만 상세:\n"
                     review_context += "\n".join(f"  - {r}" for r in cat_reviews)
@@ -178,13 +583,69 @@ class ReviewAnalyzer:
   ]
 }}
 """
+        return prompt
+
+    def _parse_action_plan(self, content):
+        result = extract_json_from_text(content)
+        if result is None:
+            raise ValueError("Failed to parse recommendations JSON response.")
+        return result.get('recommendations', [])
+
+    def _action_plan_cache_entry(self, top_issues, emerging_issues, scope):
+        """(cache, key, profile) for the action-plan cache; cache is None when disabled"""
+        cache = get_action_plan_cache()
+        if cache is None:
+            return None, None, None
+        profile = issue_profile(top_issues, emerging_issues)
+        template = SYSTEM_PROMPT_CONSULTANT + self._build_action_plan_prompt([], [])
+        return cache, profile_key(scope, config.LLM_MODEL, template, profile), profile
+
+    def generate_action_plan(
+        self, top_issues, emerging_issues, categorization_result=None, scope=None
+    ):
+        """
+        Generate actionable recommendations based on analysis
+
+        The last plan generated for the same scope is reused while the top and
+        emerging issues have not changed materially (see core.utils.action_plan_cache).
+        """
+        cache, key, profile = self._action_plan_cache_entry(top_issues, emerging_issues, scope)
+        cached = cache.get(key, profile) if cache is not None else None
+        if cached is not None:
+            return cached
 
+        prompt = self._build_action_plan_prompt(
+            top_issues, emerging_issues, categorization_result
+        )
         content = call_openai_json(
             self.client,
             prompt,
             system_prompt=SYSTEM_PROMPT_CONSULTANT,
+            call_site="generate_action_plan",
         )
-        result = extract_json_from_text(content)
-        if result is None:
-            raise ValueError("Failed to parse recommendations JSON response.")
-        return result.get('recommendations', [])
+        recommendations = self._parse_action_plan(content)
+        if cache is not None:
+            cache.set(key, profile, recommendations)
+        return recommendations
+
+    async def generate_action_plan_async(
+        self, top_issues, emerging_issues, categorization_result=None, scope=None
+    ):
+        """Async version of generate_action_plan for the event loop (backend)"""
+        cache, key, profile = self._action_plan_cache_entry(top_issues, emerging_issues, scope)
+        cached = cache.get(key, profile) if cache is not None else None
+        if cached is not None:
+            return cached
+
+        prompt = self._build_action_plan_prompt(
+            top_issues, emerging_issues, categorization_result
+        )
+        content = await call_openai_json_async(
+            prompt,
+            system_prompt=SYSTEM_PROMPT_CONSULTANT,
+            call_site="generate_action_plan",
+        )
+        recommendations = self._parse_action_plan(content)
+        if cache is not None:
+            cache.set(key, profile, recommendations)
+        return recommendations
@@ -0,0 +1,79 @@
+"""Indexed categorization result shared by all aggregations."""
+
+from array import array
+from itertools import islice
+
+
+class CategorizationResult(dict):
+    """``{'categories': [...]}`` plus a per-category index built in one pass.
+
+    Category names are interned to small integer ids; each id keeps the
+    positions of its items, so counts, top-N and example lookups are O(k)
+    in the number of categories instead of rescanning every item. It is a
+    dict so existing ``result['categories']`` consumers keep working; the
+    index reflects the items at construction time.
+    """
+
+    def __init__(self, categories=None, population=None):
+        super().__init__(categories=list(categories or []))
+        if population:
+            self['population'] = population
+        self.category_names = []
+        self._ids = {}
+        self._codes = array('I')
+        self._indices = []
+        for position, item in enumerate(self['categories']):
+            category_id = self._ids.get(item['category'])
+            if category_id is None:
+                category_id = len(self.category_names)
+                self._ids[item['category']] = category_id
+                self.category_names.append(item['category'])
+                self._indices.append(array('I'))
+            self._codes.append(category_id)
+            self._indices[category_id].append(position)
+
+    @classmethod
+    def of(cls, result):
+        """Return result itself if already indexed, otherwise index it once"""
+        if isinstance(result, cls):
+            return result
+        return cls(result.get('categories', []), result.get('population'))
+
+    @property
+    def total(self):
+        return len(self._codes)
+
+    def count(self, category):
+        category_id = self._ids.get(category)
+        return 0 if category_id is None else len(self._indices[category_id])
+
+    def counts(self):
+        """{category: count} in first-seen order"""
+        return {
+            name: len(indices)
+            for name, indices in zip(self.category_names, self._indices)
+        }
+
+    def most_common(self, n=None):
+        """[(category, count)] by count, ties in first-seen order (like Counter)"""
+        ranked = sorted(self.counts().items(), key=lambda pair: pair[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def items_for(self, category):
+        category_id = self._ids.get(category)
+        if category_id is None:
+            return []
+        items = self['categories']
+        return [items[position] for position in self._indices[category_id]]
+
+    def examples(self, category, limit=3):
+        """brief_issue of the first ``limit`` items in a category that have one
+
+        Items without a summary (e.g. labeled by the local classifier) are skipped.
+        """
+        category_id = self._ids.get(category)
+        if category_id is None:
+            return []
+        items = self['categories']
+        briefs = (items[position].get('brief_issue') for position in self._indices[category_id])
+        return list(islice((brief for brief in briefs if brief), limit))
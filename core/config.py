@@ -4,8 +4,22 @@ from dotenv import load_dotenv
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# OpenAI 호환 서버 주소 (None이면 api.openai.com; 로컬 스탠드인 서버 테스트용)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
 DATA_PATH = "data"
 
+# Processed Olist frame cached under DATA_PATH/cache/datasets (Feather if pyarrow is
+# installed, else pickle); rebuilt when the source CSVs' size/mtime/hash change
+DATASET_CACHE_ENABLED = os.getenv("DATASET_CACHE_ENABLED", "1") != "0"
+
+# Kaggle dataset + local checksum-verified registry under DATA_PATH/datasets;
+# DATASET_OFFLINE=1 never downloads (fails if no verified copy is registered)
+OLIST_DATASET_HANDLE = "olistbr/brazilian-ecommerce"
+DATASET_OFFLINE = os.getenv("DATASET_OFFLINE", "0") == "1"
+
+# Rows per chunk for the streaming (--chunked) loaders
+LOADER_CHUNK_ROWS = int(os.getenv("LOADER_CHUNK_ROWS", "100000"))
+
 # Analysis parameters
 NEGATIVE_RATING_THRESHOLD = 3
 RECENT_PERIOD_DAYS = 30
@@ -14,3 +28,106 @@ COMPARISON_PERIOD_DAYS = 60
 # LLM settings
 LLM_MODEL = "gpt-4o-mini"
 LLM_TEMPERATURE = 0.3
+
+# Prompt packing: reviews are packed into each categorization request up to these
+# token budgets (long reviews are cut at sentence boundaries)
+LLM_INPUT_TOKEN_BUDGET = int(os.getenv("LLM_INPUT_TOKEN_BUDGET", "16000"))
+LLM_OUTPUT_TOKEN_BUDGET = int(os.getenv("LLM_OUTPUT_TOKEN_BUDGET", "8000"))
+LLM_REVIEW_MAX_TOKENS = 250
+LLM_CATEGORY_TOKENS_PER_REVIEW = 40
+
+# Opt-in compact categorization output: {"c": [[review_number, category code, brief_issue]]}
+# (brief_issue only with LLM_COMPACT_BRIEF_ISSUE), decoded back to the usual dicts
+LLM_COMPACT_OUTPUT = os.getenv("LLM_COMPACT_OUTPUT", "0") == "1"
+LLM_COMPACT_BRIEF_ISSUE = os.getenv("LLM_COMPACT_BRIEF_ISSUE", "1") != "0"
+LLM_COMPACT_TOKENS_PER_REVIEW = 25
+LLM_COMPACT_CODE_TOKENS_PER_REVIEW = 8
+
+# Map-reduce categorization: pack every review into as many requests as needed
+# (instead of one budget-sized request) and run them with bounded parallelism
+CATEGORIZE_FULL_CORPUS = os.getenv("CATEGORIZE_FULL_CORPUS", "0") == "1"
+LLM_MAP_REDUCE_CONCURRENCY = int(os.getenv("LLM_MAP_REDUCE_CONCURRENCY", "8"))
+
+# Stratified sampling (rating x date bucket x length bucket) when not categorizing
+# the full corpus; counts are scaled back to population estimates with CIs
+CATEGORIZATION_SAMPLE_SIZE = int(os.getenv("CATEGORIZATION_SAMPLE_SIZE", "200"))
+SAMPLING_DATE_BUCKETS = 4
+SAMPLING_LENGTH_BUCKETS = 3
+SAMPLING_CONFIDENCE_Z = 1.96
+
+# Near-duplicate collapsing before categorization / batch replies: one
+# representative per cluster (normalized-text hash, then MinHash/LSH + Jaccard)
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "1") != "0"
+DEDUP_JACCARD_THRESHOLD = 0.8
+DEDUP_MINHASH_PERMUTATIONS = 64
+DEDUP_LSH_BANDS = 16
+DEDUP_MIN_FUZZY_CHARS = 20  # shorter texts only collapse on an exact normalized match
+
+# Local-model-first cascade: a TF-IDF (char n-gram) + logistic regression classifier
+# trained on the evaluation set and stored LLM labels answers the reviews it is
+# confident about; only reviews below the threshold go to the LLM
+LOCAL_CLASSIFIER_ENABLED = os.getenv("LOCAL_CLASSIFIER_ENABLED", "1") != "0"
+LOCAL_CLASSIFIER_THRESHOLD = float(os.getenv("LOCAL_CLASSIFIER_THRESHOLD", "0.85"))
+LOCAL_CLASSIFIER_SEED_PATH = os.path.join("evaluation", "evaluation_dataset.csv")
+LOCAL_CLASSIFIER_MIN_SAMPLES = 100
+LOCAL_CLASSIFIER_RETRAIN_EVERY = 500  # new stored LLM labels before retraining
+
+# OpenAI HTTP connection pool (process-wide, keep-alive)
+LLM_MAX_CONNECTIONS = 100
+LLM_MAX_KEEPALIVE_CONNECTIONS = 20
+LLM_KEEPALIVE_EXPIRY = 30.0
+
+# LLM response cache (SQLite, content-addressed; LLM_CACHE_ENABLED=0 to bypass)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") != "0"
+LLM_CACHE_PATH = os.path.join(DATA_PATH, "cache", "llm_responses.sqlite3")
+LLM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+LLM_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Record mode: append every call_openai_json request/response to this JSONL file
+# (replay it with `python -m core.utils.fake_openai_server --replay <path>`)
+LLM_RECORD_PATH = os.getenv("LLM_RECORD_PATH")
+
+# generate_action_plan result cache: reused while the top/emerging issue categories
+# are the same and counts/percentages stay within these bands of the cached run
+ACTION_PLAN_CACHE_ENABLED = os.getenv("ACTION_PLAN_CACHE_ENABLED", "1") != "0"
+ACTION_PLAN_CACHE_PATH = os.path.join(DATA_PATH, "cache", "action_plans.sqlite3")
+ACTION_PLAN_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+ACTION_PLAN_COUNT_TOLERANCE = float(os.getenv("ACTION_PLAN_COUNT_TOLERANCE", "0.1"))
+ACTION_PLAN_PERCENT_TOLERANCE = float(os.getenv("ACTION_PLAN_PERCENT_TOLERANCE", "2.0"))
+
+# Per-review label store (reviews labeled once are not sent to the LLM again)
+LABEL_STORE_ENABLED = os.getenv("LABEL_STORE_ENABLED", "1") != "0"
+LABEL_STORE_PATH = os.path.join(DATA_PATH, "cache", "review_labels.sqlite3")
+
+# Persisted daily per-category counts + incremental surge detector (EWMA Poisson
+# p-value and one-sided CUSUM, O(categories) per new day)
+CATEGORY_SERIES_ENABLED = os.getenv("CATEGORY_SERIES_ENABLED", "1") != "0"
+CATEGORY_SERIES_PATH = os.path.join(DATA_PATH, "cache", "category_series.sqlite3")
+EMERGING_EWMA_ALPHA = 0.1
+EMERGING_RATE_FLOOR = 0.1  # expected daily count for categories not seen yet
+EMERGING_P_VALUE = 0.01
+EMERGING_CUSUM_K = 0.5  # slack, in standard deviations per day
+EMERGING_CUSUM_H = 5.0
+EMERGING_WARMUP_DAYS = 7
+EMERGING_MIN_DAILY_COUNT = 3
+
+# Shared OpenAI rate limiter (token buckets, shared by threads and coroutines)
+LLM_RATE_LIMIT_ENABLED = os.getenv("LLM_RATE_LIMIT_ENABLED", "1") != "0"
+LLM_RATE_LIMIT_RPM = int(os.getenv("LLM_RATE_LIMIT_RPM", "500"))
+LLM_RATE_LIMIT_TPM = int(os.getenv("LLM_RATE_LIMIT_TPM", "200000"))
+LLM_ESTIMATED_COMPLETION_TOKENS = 1000
+
+# LLM call resilience: per-call timeout, retries with jittered backoff, hedging
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 30.0
+LLM_HEDGING_ENABLED = os.getenv("LLM_HEDGING_ENABLED", "0") == "1"
+LLM_HEDGE_MAX_WORKERS = 16
+
+# Batch API execution mode for experiment scripts (--batch)
+LLM_BATCH_DIR = os.path.join(DATA_PATH, "batches")
+LLM_BATCH_COMPLETION_WINDOW = "24h"
+LLM_BATCH_POLL_SECONDS = float(os.getenv("LLM_BATCH_POLL_SECONDS", "30"))
+LLM_BATCH_MAX_WAIT_SECONDS = 24 * 60 * 60
+LLM_BATCH_MAX_REQUESTS = 50000
@@ -1,51 +1,218 @@
+import bisect
+import logging
 import os
+import time
 from datetime import datetime, timedelta
 
 import kagglehub
+import numpy as np
 import pandas as pd
 
 from core import config
+from core.utils.dataset_cache import load_cached_frame
+from core.utils.dataset_registry import get_dataset_registry
+
+try:
+    import pyarrow  # pylint: disable=unused-import
+    CSV_ENGINE = "pyarrow"
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    CSV_ENGINE = "c"
+    TEXT_DTYPE = "string"
+
+logger = logging.getLogger(__name__)
+
+OLIST_REVIEWS_FILE = "olist_order_reviews_dataset.csv"
+OLIST_ORDERS_FILE = "olist_orders_dataset.csv"
+# Bump when the merge/cleanup in _build_olist_reviews changes (invalidates the cache)
+OLIST_CACHE_VERSION = 2
+_OLIST_REVIEW_COLUMNS = {
+    'usecols': ['review_id', 'order_id', 'review_score', 'review_comment_message'],
+    'dtype': {
+        'review_id': TEXT_DTYPE,
+        'order_id': TEXT_DTYPE,
+        'review_comment_message': TEXT_DTYPE,
+    },
+}
+
+
+def read_csv_header(csv_path):
+    """Column names of a CSV without parsing its rows"""
+    return list(pd.read_csv(csv_path, nrows=0).columns)
+
+
+def read_csv_fast(csv_path, usecols=None, dtype=None, parse_dates=None):
+    """
+    Shared CSV ingestion: multithreaded pyarrow parsing when pyarrow is installed
+
+    Args:
+        csv_path: CSV file path
+        usecols: columns to read (None reads every column)
+        dtype: explicit {column: dtype} (e.g. TEXT_DTYPE for review text)
+        parse_dates: columns converted to datetime64 after parsing
+
+    Logs rows and MB/s so slow exports show up in the logs.
+    """
+    started = time.perf_counter()
+    df = pd.read_csv(csv_path, engine=CSV_ENGINE, usecols=usecols, dtype=dtype)
+    for column in parse_dates or ():
+        df[column] = pd.to_datetime(df[column], errors="coerce")
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    size_mb = os.path.getsize(csv_path) / (1024 * 1024)
+    logger.info(
+        "parsed %s (%s engine): %d rows, %.1f MB in %.2fs (%.1f MB/s)",
+        os.path.basename(csv_path), CSV_ENGINE, len(df), size_mb, elapsed, size_mb / elapsed,
+    )
+    return df
+
+
+def iter_csv_chunks(csv_path, chunk_size=None, usecols=None, dtype=None):
+    """
+    Stream a CSV in chunks of at most chunk_size rows (default: config.LOADER_CHUNK_ROWS)
+
+    The pyarrow engine cannot stream, so chunks are parsed with the C engine;
+    peak memory stays proportional to one chunk.
+    """
+    chunk_size = chunk_size or config.LOADER_CHUNK_ROWS
+    started = time.perf_counter()
+    rows = 0
+    with pd.read_csv(
+        csv_path, usecols=usecols, dtype=dtype, chunksize=chunk_size
+    ) as reader:
+        for chunk in reader:
+            rows += len(chunk)
+            yield chunk
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    size_mb = os.path.getsize(csv_path) / (1024 * 1024)
+    logger.info(
+        "streamed %s in %d-row chunks: %d rows, %.1f MB in %.2fs (%.1f MB/s)",
+        os.path.basename(csv_path), chunk_size, rows, size_mb, elapsed, size_mb / elapsed,
+    )
+
+
+def window_edges(end, window_days, count):
+    """count consecutive window_days-long windows ending at `end` -> count + 1 ascending edges"""
+    end = pd.Timestamp(end)
+    return [end - timedelta(days=window_days * (count - i)) for i in range(count + 1)]
+
+
+def window_bounds(created_at, edges, include_end=True):
+    """
+    Positional [start, stop) row ranges of consecutive windows over a sorted column
+
+    Window i holds edges[i] <= created_at < edges[i + 1]; with include_end the last
+    window also holds created_at == edges[-1]. created_at must be sorted (ascending
+    or descending, NaT last as sort_values leaves it). Boundaries are found with
+    searchsorted, so each window costs O(log n) and no rows are scanned or copied.
+    """
+    values = created_at.to_numpy()
+    # NaT은 정렬 후 맨 뒤에 모이므로 이진 탐색으로 유효 구간 길이만 구함
+    n_valid = bisect.bisect_left(range(len(values)), True, key=lambda i: np.isnat(values[i]))
+    valid = values[:n_valid]
+    descending = n_valid > 1 and valid[0] > valid[-1]
+    ascending_values = valid[::-1] if descending else valid
+
+    positions = []
+    for i, edge in enumerate(edges):
+        side = "right" if include_end and i == len(edges) - 1 else "left"
+        positions.append(int(ascending_values.searchsorted(
+            np.datetime64(pd.Timestamp(edge).as_unit(np.datetime_data(values.dtype)[0])),
+            side=side,
+        )))
+
+    bounds = list(zip(positions, positions[1:]))
+    if descending:
+        bounds = [(n_valid - stop, n_valid - start) for start, stop in bounds]
+    return bounds
+
+
+def compact_ratings(ratings):
+    """int8 ratings when every value is a whole number, float32 otherwise (e.g. 4.5 or blanks)"""
+    numeric = pd.to_numeric(ratings, errors="coerce")
+    values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+    if (
+        len(values)
+        and not np.isnan(values).any()
+        and np.array_equal(values, np.round(values))
+        and values.min() >= np.iinfo(np.int8).min
+        and values.max() <= np.iinfo(np.int8).max
+    ):
+        return numeric.astype("int8")
+    return numeric.astype("float32")
 
 class DataLoader:
     def __init__(self):
         self.data_path = config.DATA_PATH
         os.makedirs(self.data_path, exist_ok=True)
 
-    def download_dataset(self):
-        """Download Olist Brazilian E-commerce dataset from Kaggle"""
+    def download_dataset(self, offline=None):
+        """
+        Download Olist Brazilian E-commerce dataset from Kaggle
+
+        A checksum-verified copy under DATA_PATH/datasets is used without touching
+        the network (see core.utils.dataset_registry); fresh downloads are registered
+        there. In offline mode (config.DATASET_OFFLINE) a missing or corrupted copy
+        raises FileNotFoundError instead of downloading.
+        """
+        offline = config.DATASET_OFFLINE if offline is None else offline
+        handle = config.OLIST_DATASET_HANDLE
+        registry = get_dataset_registry(self.data_path)
+
+        path = registry.verified_path(handle)
+        if path is not None:
+            print(f"Using verified local dataset: {path}")
+            return path
+        if offline:
+            raise FileNotFoundError(
+                f"No verified local copy of {handle} (offline mode). Register one with: "
+                f"python -m core.utils.dataset_registry register {handle} <dataset_dir>"
+            )
+
         print("Downloading dataset from Kaggle...")
-        path = kagglehub.dataset_download("olistbr/brazilian-ecommerce")
-        print(f"Dataset downloaded to: {path}")
+        downloaded = kagglehub.dataset_download(handle)
+        print(f"Dataset downloaded to: {downloaded}")
+        path = registry.register(handle, downloaded)
+        print(f"Registered verified local copy: {path}")
         return path
 
+    @staticmethod
+    def _custom_columns(csv_path):
+        columns = read_csv_header(csv_path)
+        if 'Ratings' not in columns or 'Reviews' not in columns:
+            raise ValueError("CSV must have 'Ratings' and 'Reviews' columns")
+        return {'usecols': ['Ratings', 'Reviews'], 'dtype': {'Reviews': TEXT_DTYPE}}
+
+    @staticmethod
+    def _process_custom_chunk(df, offset, base_date):
+        """Custom CSV rows starting at row `offset` -> analysis columns (unsorted)"""
+        processed_df = df.rename(columns={
+            'Ratings': 'rating',
+            'Reviews': 'review_text'
+        })
+        processed_df['rating'] = compact_ratings(processed_df['rating'])
+
+        # Add synthetic review_id and created_at
+        positions = np.arange(offset, offset + len(processed_df))
+        processed_df['review_id'] = positions + 1
+        # Create synthetic dates (spread over last 60 days)
+        processed_df['created_at'] = pd.Timestamp(base_date) - pd.to_timedelta(
+            positions % 60, unit='D'
+        )
+
+        # Filter out reviews without text
+        return processed_df[processed_df['review_text'].notna()].copy()
+
     def load_custom_csv(self, csv_path):
         """Load custom CSV file with reviews"""
         print(f"Loading custom CSV from: {csv_path}")
 
-        df = pd.read_csv(csv_path)
-
-        # Check if required columns exist
-        if 'Ratings' in df.columns and 'Reviews' in df.columns:
-            # Custom CSV format (like iPhone SE reviews)
-            processed_df = df[['Ratings', 'Reviews']].copy()
-            processed_df.rename(columns={
-                'Ratings': 'rating',
-                'Reviews': 'review_text'
-            }, inplace=True)
-
-            # Add synthetic review_id and created_at
-            processed_df['review_id'] = range(1, len(processed_df) + 1)
-            # Create synthetic dates (spread over last 60 days)
-            base_date = datetime.now()
-            processed_df['created_at'] = [
-                base_date - timedelta(days=i % 60)
-                for i in range(len(processed_df))
-            ]
-        else:
-            raise ValueError("CSV must have 'Ratings' and 'Reviews' columns")
-
-        # Filter out reviews without text
-        processed_df = processed_df[processed_df['review_text'].notna()].copy()
+        # Custom CSV format (like iPhone SE reviews)
+        read_options = self._custom_columns(csv_path)
+        processed_df = self._process_custom_chunk(
+            read_csv_fast(csv_path, **read_options), 0, datetime.now()
+        )
 
         # Sort by date
         processed_df.sort_values('created_at', ascending=False, inplace=True)
@@ -56,16 +223,28 @@ class DataLoader:
 
         return processed_df
 
-    def load_reviews(self, dataset_path=None):
-        """Load and merge review data with necessary information"""
-        if dataset_path is None:
-            dataset_path = self.download_dataset()
-
-        # Load reviews
-        reviews_df = pd.read_csv(os.path.join(dataset_path, "olist_order_reviews_dataset.csv"))
+    def iter_custom_csv(self, csv_path, chunk_size=None):
+        """Stream a custom CSV as processed (unsorted) chunks, see load_custom_csv"""
+        read_options = self._custom_columns(csv_path)
+        base_date = datetime.now()
+        offset = 0
+        for chunk in iter_csv_chunks(csv_path, chunk_size, **read_options):
+            yield self._process_custom_chunk(chunk, offset, base_date)
+            offset += len(chunk)
+
+    @staticmethod
+    def _read_olist_orders(dataset_path):
+        return read_csv_fast(
+            os.path.join(dataset_path, OLIST_ORDERS_FILE),
+            usecols=['order_id', 'order_purchase_timestamp'],
+            dtype={'order_id': TEXT_DTYPE},
+            parse_dates=['order_purchase_timestamp'],
+        )
 
-        # Load orders to get timestamp information
-        orders_df = pd.read_csv(os.path.join(dataset_path, "olist_orders_dataset.csv"))
+    @staticmethod
+    def _merge_olist(reviews_df, orders_df):
+        """Olist reviews (+ order timestamps) -> analysis columns (unsorted)"""
+        reviews_df['review_score'] = compact_ratings(reviews_df['review_score'])
 
         # Merge reviews with orders to get order_purchase_timestamp
         merged_df = reviews_df.merge(
@@ -92,11 +271,63 @@ class DataLoader:
         processed_df['created_at'] = pd.to_datetime(processed_df['created_at'])
 
         # Filter out reviews without text
-        processed_df = processed_df[processed_df['review_text'].notna()].copy()
+        return processed_df[processed_df['review_text'].notna()].copy()
+
+    def _build_olist_reviews(self, dataset_path):
+        """Merge the raw Olist reviews/orders CSVs into the analysis frame"""
+        # Load reviews
+        reviews_df = read_csv_fast(
+            os.path.join(dataset_path, OLIST_REVIEWS_FILE), **_OLIST_REVIEW_COLUMNS
+        )
+
+        # Load orders to get timestamp information
+        processed_df = self._merge_olist(reviews_df, self._read_olist_orders(dataset_path))
 
         # Sort by date
         processed_df.sort_values('created_at', ascending=False, inplace=True)
         processed_df.reset_index(drop=True, inplace=True)
+        return processed_df
+
+    def iter_olist_reviews(self, dataset_path=None, chunk_size=None):
+        """
+        Stream the Olist reviews as processed (unsorted) chunks, see load_reviews
+
+        Only the two-column order timestamp table is held in memory in full.
+        """
+        if dataset_path is None:
+            dataset_path = self.download_dataset()
+
+        orders_df = self._read_olist_orders(dataset_path)
+        for chunk in iter_csv_chunks(
+            os.path.join(dataset_path, OLIST_REVIEWS_FILE), chunk_size, **_OLIST_REVIEW_COLUMNS
+        ):
+            yield self._merge_olist(chunk, orders_df)
+
+    def load_reviews(self, dataset_path=None):
+        """
+        Load and merge review data with necessary information
+
+        The merged frame is cached under DATA_PATH (see core.utils.dataset_cache)
+        and rebuilt automatically when the source CSVs change.
+        """
+        if dataset_path is None:
+            dataset_path = self.download_dataset()
+
+        if config.DATASET_CACHE_ENABLED:
+            processed_df, cached = load_cached_frame(
+                os.path.join(self.data_path, "cache", "datasets"),
+                "olist_reviews",
+                [
+                    os.path.join(dataset_path, OLIST_REVIEWS_FILE),
+                    os.path.join(dataset_path, OLIST_ORDERS_FILE),
+                ],
+                lambda: self._build_olist_reviews(dataset_path),
+                version=OLIST_CACHE_VERSION,
+            )
+            if cached:
+                print("Loaded merged reviews from dataset cache")
+        else:
+            processed_df = self._build_olist_reviews(dataset_path)
 
         print(f"\nLoaded {len(processed_df)} reviews with text")
         print(
@@ -107,16 +338,106 @@ class DataLoader:
 
         return processed_df
 
-    def filter_negative_reviews(self, df, threshold=None):
+    def filter_negative_reviews(self, df, threshold=None, verbose=True):
         """Filter negative reviews based on rating threshold"""
         if threshold is None:
             threshold = config.NEGATIVE_RATING_THRESHOLD
 
         negative_df = df[df['rating'] <= threshold].copy()
-        print(f"\nFiltered {len(negative_df)} negative reviews (rating <= {threshold})")
+        if verbose:
+            print(f"\nFiltered {len(negative_df)} negative reviews (rating <= {threshold})")
 
         return negative_df
 
+    def iter_negative_reviews(self, chunks, threshold=None, stats=None):
+        """
+        Filter streamed chunks (iter_custom_csv / iter_olist_reviews) down to negative reviews
+
+        Args:
+            chunks: processed review chunks
+            threshold: rating threshold (default: config.NEGATIVE_RATING_THRESHOLD)
+            stats: optional dict filled with 'total_reviews' and the
+                'first_date'/'last_date' seen across all chunks (positives included)
+        """
+        if stats is not None:
+            stats.update(total_reviews=0, first_date=None, last_date=None)
+        for chunk in chunks:
+            if stats is not None and len(chunk):
+                stats['total_reviews'] += len(chunk)
+                first, last = chunk['created_at'].min(), chunk['created_at'].max()
+                if pd.notna(first):
+                    if stats['first_date'] is not None:
+                        first = min(first, stats['first_date'])
+                        last = max(last, stats['last_date'])
+                    stats['first_date'], stats['last_date'] = first, last
+            negative_df = self.filter_negative_reviews(chunk, threshold, verbose=False)
+            if len(negative_df):
+                yield negative_df
+
+    def load_negative_reviews_chunked(self, chunks, threshold=None):
+        """
+        Collect the negative reviews of a streamed file without loading it whole
+
+        Returns:
+            (negative reviews sorted by date, stats from iter_negative_reviews)
+        """
+        if threshold is None:
+            threshold = config.NEGATIVE_RATING_THRESHOLD
+
+        stats = {}
+        parts = list(self.iter_negative_reviews(chunks, threshold, stats))
+        if parts:
+            negative_df = pd.concat(parts, ignore_index=True)
+        else:
+            negative_df = pd.DataFrame(
+                columns=['review_id', 'review_text', 'rating', 'created_at']
+            )
+        negative_df.sort_values('created_at', ascending=False, inplace=True)
+        negative_df.reset_index(drop=True, inplace=True)
+
+        print(f"\nStreamed {stats['total_reviews']} reviews with text")
+        print(f"Filtered {len(negative_df)} negative reviews (rating <= {threshold})")
+        return negative_df, stats
+
+    @staticmethod
+    def _sorted_by_date(df):
+        """df itself if created_at is sorted (either direction, NaT last), else a sorted copy"""
+        dated = df['created_at'].iloc[:df['created_at'].notna().sum()]
+        if dated.notna().all() and (dated.is_monotonic_decreasing or dated.is_monotonic_increasing):
+            return df
+        return df.sort_values('created_at', ascending=False, kind='stable')
+
+    def split_windows(self, df, edges, include_end=True):
+        """
+        Split df into consecutive windows edges[i] <= created_at < edges[i + 1]
+
+        Returns one slice per window (no per-window copy; see window_bounds).
+        Frames from the loaders are already sorted by created_at; anything
+        else is sorted once first.
+        """
+        df = self._sorted_by_date(df)
+        return [
+            df.iloc[start:stop]
+            for start, stop in window_bounds(df['created_at'], edges, include_end)
+        ]
+
+    def split_consecutive_windows(self, df, window_days, count, end=None):
+        """
+        N consecutive window_days-long windows (e.g. daily/weekly buckets) ending at `end`
+
+        Args:
+            end: last window's (inclusive) end, default: the latest created_at
+
+        Returns:
+            [(window_start, frame), ...] oldest first
+        """
+        if end is None:
+            end = df['created_at'].max()
+            if pd.isna(end):
+                raise ValueError("No dated reviews to split into windows")
+        edges = window_edges(end, window_days, count)
+        return list(zip(edges, self.split_windows(df, edges)))
+
     def split_by_period(self, df, recent_days=None, comparison_days=None):
         """Split data into recent and comparison periods"""
         if recent_days is None:
@@ -126,16 +447,16 @@ class DataLoader:
 
         # Get the most recent date in the dataset
         max_date = df['created_at'].max()
+        if pd.isna(max_date):
+            raise ValueError("No dated reviews to split into periods")
 
         # Define periods
         recent_start = max_date - timedelta(days=recent_days)
         comparison_start = max_date - timedelta(days=comparison_days)
 
-        recent_df = df[df['created_at'] >= recent_start].copy()
-        comparison_df = df[
-            (df['created_at'] >= comparison_start) &
-            (df['created_at'] < recent_start)
-        ].copy()
+        comparison_df, recent_df = self.split_windows(
+            df, [comparison_start, recent_start, max_date]
+        )
 
         print(f"\nRecent period ({recent_days} days): {len(recent_df)} reviews")
         print(
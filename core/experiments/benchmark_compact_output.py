@@ -0,0 +1,178 @@
+"""
+압축 분류 출력 형식 벤치마크
+표준 JSON({"categories": [...]})과 압축 형식({"c": [[번호, 코드, brief_issue]]})의
+출력 토큰 수와 categorize_issues 지연 비교
+
+기본은 로컬 스탠드인 서버로 오프라인 측정한다 (출력 토큰당 디코딩 지연 --token-latency로
+출력 길이에 비례하는 지연을 모사). --live면 실제 OpenAI API로 측정한다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+
+import pandas as pd
+from openai import OpenAI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core import config  # pylint: disable=wrong-import-position
+from core.analyzer import ReviewAnalyzer  # pylint: disable=wrong-import-position
+from core.utils.cli_helpers import (  # pylint: disable=wrong-import-position
+    require_openai_key,
+)
+from core.utils.fake_openai_server import (  # pylint: disable=wrong-import-position
+    FakeOpenAIServer,
+    synthetic_responder,
+)
+from core.utils.llm_metrics import snapshot  # pylint: disable=wrong-import-position
+from core.utils.openai_client import get_client  # pylint: disable=wrong-import-position
+
+FORMATS = (
+    ("standard", {"LLM_COMPACT_OUTPUT": False}),
+    ("compact", {"LLM_COMPACT_OUTPUT": True, "LLM_COMPACT_BRIEF_ISSUE": True}),
+    ("compact_no_brief", {"LLM_COMPACT_OUTPUT": True, "LLM_COMPACT_BRIEF_ISSUE": False}),
+)
+
+# 매 실행이 실제로 LLM을 호출하도록 캐시/라벨 재사용/중복 제거/로컬 분류기를 끔
+ISOLATION = {
+    "LLM_CACHE_ENABLED": False,
+    "LABEL_STORE_ENABLED": False,
+    "LOCAL_CLASSIFIER_ENABLED": False,
+    "DEDUP_ENABLED": False,
+}
+
+SYNTHETIC_REVIEWS = (
+    "주문한 지 2주가 지났는데 아직도 배송 중이라고 나옵니다",
+    "한 번 사용했는데 바로 고장났어요 품질이 너무 별로입니다",
+    "주문한 색상과 다른 제품이 왔어요",
+    "박스가 찢어진 채로 도착했고 제품에도 흠집이 있네요",
+    "사이즈가 표기보다 한 치수 작아요",
+    "구성품 중 충전기가 빠져 있었습니다",
+    "상품 설명과 재질이 완전히 달라요",
+    "문의를 남겼는데 일주일째 답변이 없습니다",
+)
+
+
+@contextmanager
+def _config_overrides(overrides):
+    previous = {name: getattr(config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(config, name, value)
+
+
+def _categorize_usage():
+    """지금까지 categorize_issues 호출의 (입력 토큰, 출력 토큰) 합계"""
+    rows = [row for row in snapshot() if row['call_site'] == 'categorize_issues']
+    return (
+        sum(row['prompt_tokens']['sum'] for row in rows),
+        sum(row['completion_tokens']['sum'] for row in rows),
+    )
+
+
+def load_reviews(path, count):
+    """평가 데이터셋(있으면)의 리뷰 count개, 없으면 합성 리뷰"""
+    if path and os.path.exists(path):
+        texts = pd.read_csv(path)['review_text'].dropna().tolist()
+    else:
+        texts = []
+    if not texts:
+        texts = [
+            f"{SYNTHETIC_REVIEWS[i % len(SYNTHETIC_REVIEWS)]} (주문 {i})" for i in range(count)
+        ]
+    return texts[:count]
+
+
+def run_format(analyzer, reviews, overrides, repeats):
+    """한 출력 형식으로 repeats번 분류해 지연 중앙값과 실행당 토큰 수 측정"""
+    seconds = []
+    prompt_before, completion_before = _categorize_usage()
+    with _config_overrides(overrides):
+        for _ in range(repeats):
+            started = time.perf_counter()
+            result = analyzer.categorize_issues(reviews)
+            seconds.append(time.perf_counter() - started)
+    prompt_after, completion_after = _categorize_usage()
+    return {
+        'seconds': round(statistics.median(seconds), 3),
+        'prompt_tokens': round((prompt_after - prompt_before) / repeats),
+        'completion_tokens': round((completion_after - completion_before) / repeats),
+        'categorized': len(result['categories']),
+    }
+
+
+def print_results(rows):
+    print(f"\n{'Format':<18} {'Latency':<10} {'Prompt':<9} {'Completion':<11} "
+          f"{'Saved':<8} {'Categorized':<11}")
+    print("-" * 72)
+    for row in rows:
+        print(f"{row['format']:<18} {row['seconds']:>7.2f}s  {row['prompt_tokens']:>7}  "
+              f"{row['completion_tokens']:>9}   {row['completion_saved_pct']:>5.1f}%  "
+              f"{row['categorized']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='압축 분류 출력 형식 벤치마크')
+    parser.add_argument('--reviews', type=int, default=200, help='분류할 리뷰 수')
+    parser.add_argument('--repeats', type=int, default=3, help='형식별 반복 횟수')
+    parser.add_argument('--dataset', default='evaluation/evaluation_dataset.csv',
+                        help='리뷰 CSV (review_text 컬럼, 없으면 합성 리뷰)')
+    parser.add_argument('--token-latency', type=float, default=0.01,
+                        help='오프라인 서버의 출력 토큰당 디코딩 지연(초)')
+    parser.add_argument('--live', action='store_true', help='실제 OpenAI API로 측정')
+    args = parser.parse_args()
+
+    reviews = load_reviews(args.dataset, args.reviews)
+    analyzer = ReviewAnalyzer()
+    with ExitStack() as stack:
+        stack.enter_context(_config_overrides(ISOLATION))
+        if args.live:
+            require_openai_key()
+            analyzer.client = get_client()
+        else:
+            server = stack.enter_context(
+                FakeOpenAIServer(synthetic_responder, token_latency=args.token_latency)
+            )
+            analyzer.client = OpenAI(base_url=server.base_url, api_key="test", max_retries=0)
+
+        rows = []
+        for name, overrides in FORMATS:
+            print(f"⏱  {name} 측정 중 ({len(reviews)}개 리뷰 x {args.repeats}회)...")
+            rows.append({'format': name, **run_format(analyzer, reviews, overrides, args.repeats)})
+
+    baseline = rows[0]
+    for row in rows:
+        row['completion_saved_pct'] = round(
+            (1 - row['completion_tokens'] / max(baseline['completion_tokens'], 1)) * 100, 1
+        )
+        row['latency_saved_pct'] = round(
+            (1 - row['seconds'] / max(baseline['seconds'], 1e-9)) * 100, 1
+        )
+    print_results(rows)
+
+    os.makedirs('results', exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = f'results/compact_output_benchmark_{timestamp}.json'
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'mode': 'live' if args.live else 'offline',
+            'reviews': len(reviews),
+            'repeats': args.repeats,
+            'token_latency': None if args.live else args.token_latency,
+            'results': rows,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 벤치마크 결과 저장: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
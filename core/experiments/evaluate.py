@@ -7,16 +7,114 @@ import argparse
 import json
 import os
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support
+from sklearn.model_selection import KFold
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core import config  # pylint: disable=wrong-import-position
 from core.analyzer import ReviewAnalyzer  # pylint: disable=wrong-import-position
+from core.utils.cli_helpers import (  # pylint: disable=wrong-import-position
+    add_no_cache_argument,
+    apply_no_cache_argument,
+    print_llm_cache_stats,
+)
+from core.utils.label_store import (  # pylint: disable=wrong-import-position
+    get_label_store,
+    review_hash,
+)
+from core.utils.llm_metrics import (  # pylint: disable=wrong-import-position
+    snapshot,
+    write_run_report,
+)
+from core.utils.local_classifier import (  # pylint: disable=wrong-import-position
+    LocalClassifier,
+)
+
+CASCADE_THRESHOLDS = (0.0, 0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 1.01)
+CASCADE_FOLDS = 5
+
+
+def _categorize_tokens():
+    """지금까지 categorize_issues 호출에 쓴 (입력 + 출력) 토큰 수"""
+    return sum(
+        row['prompt_tokens']['sum'] + row['completion_tokens']['sum']
+        for row in snapshot()
+        if row['call_site'] == 'categorize_issues'
+    )
+
+
+@contextmanager
+def _llm_only():
+    """로컬 분류기 끄기: 평가셋이 분류기 시드라 켜 두면 자기 정답으로 학습한 모델이 예측한다"""
+    enabled = config.LOCAL_CLASSIFIER_ENABLED
+    config.LOCAL_CLASSIFIER_ENABLED = False
+    try:
+        yield
+    finally:
+        config.LOCAL_CLASSIFIER_ENABLED = enabled
+
+
+def cascade_curve(y_true, local_predictions, llm_predictions, llm_cost, thresholds):
+    """
+    임계값별 cascade 정확도/비용/지연 곡선
+
+    확신도가 임계값 이상이면 로컬 예측, 아니면 LLM 예측을 쓴다. LLM 토큰과 지연은
+    LLM으로 보낸 리뷰 비율에 비례한다고 보고 전량 LLM 실행 값에서 추정한다.
+
+    Args:
+        local_predictions: 리뷰별 (category, 확신도) 또는 None(로컬 예측 없음)
+        llm_cost: {'tokens', 'seconds', 'local_seconds'} 전량 LLM / 전량 로컬 실행 값
+    """
+    curve = []
+    for threshold in thresholds:
+        use_local = [
+            pred is not None and pred[1] >= threshold for pred in local_predictions
+        ]
+        y_pred = [
+            local[0] if local_ok else llm
+            for local, llm, local_ok in zip(local_predictions, llm_predictions, use_local)
+        ]
+        llm_share = 1 - sum(use_local) / len(use_local) if use_local else 0.0
+        curve.append({
+            'threshold': threshold,
+            'llm_share': round(llm_share, 4),
+            'accuracy': round(accuracy_score(y_true, y_pred), 4),
+            'llm_tokens': round(llm_cost['tokens'] * llm_share),
+            'latency_seconds': round(
+                llm_cost['seconds'] * llm_share + llm_cost['local_seconds'], 3
+            ),
+        })
+    return curve
+
+
+def _print_cascade_curve(curve):
+    print(f"\n{'Threshold':<11} {'LLM share':<11} {'Accuracy':<10} "
+          f"{'Tokens':<10} {'Latency':<8}")
+    print("-" * 60)
+    for row in curve:
+        print(f"{row['threshold']:<11.2f} "
+              f"{row['llm_share']*100:>7.1f}%   "
+              f"{row['accuracy']*100:>6.2f}%   "
+              f"{row['llm_tokens']:>8}   "
+              f"{row['latency_seconds']:>6.2f}s")
+
+
+def _save_cascade_curve(curve):
+    os.makedirs('results', exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    curve_file = f'results/cascade_curve_{timestamp}.json'
+    with open(curve_file, 'w', encoding='utf-8') as f:
+        json.dump(curve, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Cascade 곡선 저장: {curve_file}")
+
 
 class Evaluator:
     def __init__(self, ground_truth_file='evaluation/evaluation_dataset.csv'):
@@ -38,9 +136,10 @@ class Evaluator:
         return df
 
     def predict_categories(self, reviews_text_list):
-        """AI로 카테고리 예측"""
+        """AI로 카테고리 예측 (LLM만; 로컬 분류기는 evaluate_cascade에서 교차 검증으로 평가)"""
         print("\n🤖 AI 예측 중...")
-        categorization = self.analyzer.categorize_issues(reviews_text_list)
+        with _llm_only():
+            categorization = self.analyzer.categorize_issues(reviews_text_list)
 
         # 예측 결과를 리뷰 순서대로 정렬
         predictions = {}
@@ -147,6 +246,12 @@ class Evaluator:
                 json.dump(errors, f, indent=2, ensure_ascii=False)
             print(f"💾 에러 케이스 저장: {errors_file}")
 
+        # LLM 사용량/지연 리포트 저장
+        usage_file = write_run_report(
+            f'results/llm_usage_{mode}_{timestamp}.json', extra={'mode': mode}
+        )
+        print(f"💾 LLM 사용량 저장: {usage_file}")
+
     def print_results(self, metrics, errors):
         """결과 출력"""
         print("\n" + "="*80)
@@ -178,6 +283,68 @@ class Evaluator:
                 print(f"      Text: {error['review_text'][:100]}...")
                 print(f"      True: {error['true_label']} → Predicted: {error['predicted_label']}")
 
+    def local_out_of_fold(self, reviews, labels):
+        """
+        교차 검증으로 얻은 리뷰별 로컬 분류기 예측 (category, 확신도)
+
+        각 fold는 나머지 fold의 수동 라벨 + 라벨 저장소의 LLM 라벨(평가셋 리뷰 제외)로 학습한다.
+        """
+        store = get_label_store()
+        eval_hashes = {review_hash(text) for text in reviews}
+        stored = [
+            (text, category)
+            for text, category in (store.labeled_examples(config.LLM_MODEL) if store else [])
+            if review_hash(text) not in eval_hashes
+        ]
+
+        predictions = [None] * len(reviews)
+        folds = KFold(n_splits=min(CASCADE_FOLDS, len(reviews)), shuffle=True, random_state=42)
+        for train_idx, test_idx in folds.split(reviews):
+            classifier = LocalClassifier.train(
+                [text for text, _ in stored] + [reviews[i] for i in train_idx],
+                [category for _, category in stored] + [labels[i] for i in train_idx],
+            )
+            if classifier is None:
+                continue
+            fold_predictions = classifier.predict([reviews[i] for i in test_idx])
+            for i, prediction in zip(test_idx, fold_predictions):
+                predictions[i] = prediction
+        return predictions
+
+    def evaluate_cascade(self, thresholds=CASCADE_THRESHOLDS):
+        """로컬 분류기 → LLM cascade의 임계값별 정확도/비용/지연 곡선"""
+        print("="*80)
+        print("  Cascade 임계값 평가")
+        print("="*80)
+
+        df = self.load_ground_truth()
+        if df is None:
+            return None
+
+        reviews = df['review_text'].tolist()
+        y_true = df['manual_label'].str.strip().tolist()
+
+        print("\n1. 로컬 분류기 교차 검증 중...")
+        started = time.perf_counter()
+        local_predictions = self.local_out_of_fold(reviews, y_true)
+        local_seconds = (time.perf_counter() - started) / CASCADE_FOLDS
+
+        print("\n2. 전량 LLM 예측 중...")
+        tokens_before = _categorize_tokens()
+        started = time.perf_counter()
+        llm_predictions = self.predict_categories(reviews)
+        llm_cost = {
+            'tokens': _categorize_tokens() - tokens_before,
+            'seconds': time.perf_counter() - started,
+            'local_seconds': local_seconds,
+        }
+
+        curve = cascade_curve(y_true, local_predictions, llm_predictions, llm_cost, thresholds)
+
+        _print_cascade_curve(curve)
+        _save_cascade_curve(curve)
+        return curve
+
     def evaluate(self, mode='baseline'):
         """전체 평가 실행"""
         print("="*80)
@@ -222,6 +389,7 @@ class Evaluator:
         print("\n" + "="*80)
         print("  평가 완료!")
         print("="*80)
+        print_llm_cache_stats()
 
         return metrics, errors
 
@@ -230,10 +398,17 @@ def main():
     parser = argparse.ArgumentParser(description='리뷰 분석 시스템 평가')
     parser.add_argument('--mode', type=str, default='baseline',
                         help='평가 모드 (baseline, improved, final)')
+    parser.add_argument('--cascade-curve', action='store_true',
+                        help='로컬 분류기 cascade의 임계값별 정확도/비용/지연 곡선 출력')
+    add_no_cache_argument(parser)
     args = parser.parse_args()
+    apply_no_cache_argument(args)
 
     evaluator = Evaluator()
-    evaluator.evaluate(mode=args.mode)
+    if args.cascade_curve:
+        evaluator.evaluate_cascade()
+    else:
+        evaluator.evaluate(mode=args.mode)
 
 
 if __name__ == "__main__":
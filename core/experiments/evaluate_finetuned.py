@@ -9,26 +9,31 @@ import os
 import sys
 
 import pandas as pd
-from openai import OpenAI
 from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from core import config  # pylint: disable=wrong-import-position
-from core.utils.review_categories import CATEGORIES_BULLETS_FINETUNE  # pylint: disable=wrong-import-position
-
-ALLOWED_CATEGORIES = {
-    "delivery_delay",
-    "wrong_item",
-    "poor_quality",
-    "damaged_packaging",
-    "size_issue",
-    "missing_parts",
-    "not_as_described",
-    "customer_service",
-    "price_issue",
-    "other",
-}
+from core.utils.cli_helpers import (  # pylint: disable=wrong-import-position
+    add_batch_argument,
+    add_no_cache_argument,
+    apply_no_cache_argument,
+)
+from core.utils.llm_batch import (  # pylint: disable=wrong-import-position
+    batch_request,
+    run_batch,
+)
+from core.utils.llm_metrics import (  # pylint: disable=wrong-import-position
+    write_run_report,
+)
+from core.utils.openai_client import (  # pylint: disable=wrong-import-position
+    call_openai_json,
+    get_client,
+)
+from core.utils.review_categories import (  # pylint: disable=wrong-import-position
+    CATEGORIES_BULLETS_FINETUNE,
+    EVALUATION_CATEGORY_KEYS,
+)
+
 
 class FinetunedEvaluator:
     def __init__(self, model_name):
@@ -36,11 +41,11 @@ class FinetunedEvaluator:
         Args:
             model_name: Fine-tuned 모델 이름 (예: ft:gpt-4o-mini:custom:review-classifier:xxx)
         """
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = get_client()
         self.model_name = model_name
 
-    def categorize_single(self, review_text):
-        """단일 리뷰 분류"""
+    def _build_prompts(self, review_text):
+        """(system_prompt, prompt)"""
         system_prompt = (
             "You are an e-commerce feedback analyst expert at analyzing customer "
             "reviews and categorizing their primary complaints.\n\n"
@@ -49,27 +54,16 @@ class FinetunedEvaluator:
             "Return a JSON object only with this schema:\n"
             "{\"category\": \"<one of the categories above>\"}"
         )
-
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": (
-                        "Categorize this review. Reply with JSON only, exactly "
-                        "{\"category\": \"...\"}.\n"
-                        "Example: \"Package arrived late\" -> "
-                        "{\"category\": \"delivery_delay\"}\n"
-                        f"Review: {review_text}"
-                    ),
-                }
-            ],
-            temperature=0.0,  # Deterministic
-            response_format={"type": "json_object"},
+        prompt = (
+            "Categorize this review. Reply with JSON only, exactly "
+            "{\"category\": \"...\"}.\n"
+            "Example: \"Package arrived late\" -> "
+            "{\"category\": \"delivery_delay\"}\n"
+            f"Review: {review_text}"
         )
+        return system_prompt, prompt
 
-        raw_content = response.choices[0].message.content
+    def _parse_category(self, raw_content):
         try:
             parsed = json.loads(raw_content)
         except json.JSONDecodeError as exc:
@@ -83,20 +77,48 @@ class FinetunedEvaluator:
             raise ValueError(f"Invalid category value: {category}")
 
         category_norm = category.strip().lower()
-        if category_norm not in ALLOWED_CATEGORIES:
+        if category_norm not in EVALUATION_CATEGORY_KEYS:
             raise ValueError(f"Invalid category value: {category}")
 
         return category_norm
 
-    def _run_predictions(self, df):
+    def categorize_single(self, review_text):
+        """단일 리뷰 분류"""
+        system_prompt, prompt = self._build_prompts(review_text)
+        raw_content = call_openai_json(
+            self.client,
+            prompt,
+            system_prompt=system_prompt,
+            model=self.model_name,
+            temperature=0.0,  # Deterministic
+            call_site="evaluate_finetuned",
+        )
+        return self._parse_category(raw_content)
+
+    def _submit_batch(self, df):
+        """전체 리뷰를 Batch API로 한 번에 분류 (custom_id = 행 번호)"""
+        lines = []
+        for i, review_text in enumerate(df['review_text'], start=1):
+            system_prompt, prompt = self._build_prompts(review_text)
+            lines.append(batch_request(
+                i, prompt, system_prompt=system_prompt, model=self.model_name, temperature=0.0
+            ))
+        print(f"   Batch API 제출: {len(lines)}개 요청 (완료까지 대기)")
+        return run_batch(self.client, lines, call_site="evaluate_finetuned_batch")
+
+    def _run_predictions(self, df, batch=False):
         predictions = []
         failures = []
         failure_previews = []
+        batch_results = self._submit_batch(df) if batch else None
 
         for i, (_, row) in enumerate(df.iterrows(), start=1):
             print(f"   [{i}/{len(df)}] 예측 중...", end='\r')
             try:
-                pred = self.categorize_single(row['review_text'])
+                if batch_results is not None:
+                    pred = self._parse_category(batch_results.content(str(i)))
+                else:
+                    pred = self.categorize_single(row['review_text'])
                 predictions.append(pred)
             except Exception as e:  # pylint: disable=broad-except
                 # Keep evaluation running even if a single review fails.
@@ -168,8 +190,14 @@ class FinetunedEvaluator:
                 print(f"\n   {i}. {error['review_preview']}")
                 print(f"      True: {error['true']} → Predicted: {error['predicted']}")
 
-    def evaluate(self, ground_truth_file):  # pylint: disable=too-many-locals
-        """전체 평가 실행"""
+    def evaluate(self, ground_truth_file, batch=False):  # pylint: disable=too-many-locals
+        """
+        전체 평가 실행
+
+        Args:
+            ground_truth_file: Ground Truth CSV 경로
+            batch: True면 리뷰별 동기 호출 대신 Batch API로 한 번에 제출
+        """
         print("="*80)
         print(f"  Fine-tuned 모델 평가: {self.model_name}")
         print("="*80 + "\n")
@@ -182,13 +210,13 @@ class FinetunedEvaluator:
         df['manual_label'] = df['manual_label'].astype(str).str.strip().str.lower()
         valid_mask = df['manual_label'].ne('') & df['manual_label'].ne('nan')
         df = df[valid_mask & df['manual_label'].notna()]
-        df = df[df['manual_label'].isin(ALLOWED_CATEGORIES)]
+        df = df[df['manual_label'].isin(EVALUATION_CATEGORY_KEYS)]
 
         print(f"   ✓ {len(df)}개 리뷰 로드\n")
 
         # 예측 실행
         print("🤖 Fine-tuned 모델로 예측 중...")
-        predictions, failures, failure_previews = self._run_predictions(df)
+        predictions, failures, failure_previews = self._run_predictions(df, batch=batch)
         print("\n   ✓ 완료!\n")
 
         # 평가
@@ -214,6 +242,10 @@ class FinetunedEvaluator:
         output_file = 'results/finetuned_evaluation.json'
         self._save_results(results, output_file)
         print(f"\n💾 결과 저장: {output_file}")
+        usage_file = write_run_report(
+            'results/llm_usage_finetuned_evaluation.json', extra={'model': self.model_name}
+        )
+        print(f"💾 LLM 사용량 저장: {usage_file}")
 
         return results
 
@@ -261,11 +293,14 @@ def main():
                         help='Ground Truth CSV 파일')
     parser.add_argument('--compare', type=str,
                         help='비교할 Base 모델 결과 파일 (예: results/baseline_metrics.json)')
+    add_no_cache_argument(parser)
+    add_batch_argument(parser)
     args = parser.parse_args()
+    apply_no_cache_argument(args)
 
     # 평가 실행
     evaluator = FinetunedEvaluator(args.model)
-    evaluator.evaluate(args.ground_truth)
+    evaluator.evaluate(args.ground_truth, batch=args.batch)
 
     # 비교 (선택사항)
     if args.compare:
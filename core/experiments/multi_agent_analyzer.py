@@ -3,50 +3,58 @@ Level 4-1: 멀티 에이전트 시스템
 Self-Consistency를 통한 정확도 향상
 """
 
+import argparse
 import json
 import os
 import sys
 from collections import Counter
 
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from core import config  # pylint: disable=wrong-import-position
+from core.utils.cli_helpers import add_batch_argument  # pylint: disable=wrong-import-position
 from core.utils.json_utils import extract_json_from_text  # pylint: disable=wrong-import-position
+from core.utils.llm_batch import batch_request, run_batch  # pylint: disable=wrong-import-position
+from core.utils.openai_client import call_openai_json, get_client  # pylint: disable=wrong-import-position
 from core.utils.prompt_templates import SINGLE_REVIEW_JSON_FORMAT  # pylint: disable=wrong-import-position
 from core.utils.review_categories import CATEGORIES_BULLETS  # pylint: disable=wrong-import-position
 
+AGENT_TEMPERATURE = 0.3
+CONSENSUS_TEMPERATURE = 0.2
+CONSENSUS_SYSTEM_PROMPT = "You are a senior e-commerce analyst making final decisions."
+
+
 class ClassificationAgent:
     """리뷰 분류 전문 에이전트"""
 
     def __init__(self, agent_id, perspective="general"):
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = get_client()
         self.model = config.LLM_MODEL
         self.agent_id = agent_id
         self.perspective = perspective
 
-    def categorize(self, review_text):
-        """리뷰 분류"""
+    def system_prompt(self):
         if self.perspective == "general":
-            system_prompt = (
+            return (
                 "You are a general e-commerce review analyst. "
                 "Focus on the overall customer experience."
             )
-        elif self.perspective == "operational":
-            system_prompt = (
+        if self.perspective == "operational":
+            return (
                 "You are an operations specialist. "
                 "Focus on delivery, packaging, and fulfillment issues."
             )
-        elif self.perspective == "product":
-            system_prompt = (
+        if self.perspective == "product":
+            return (
                 "You are a product quality specialist. "
                 "Focus on product quality, description accuracy, and functionality."
             )
-        else:
-            system_prompt = "You are an e-commerce review analyst."
+        return "You are an e-commerce review analyst."
 
-        prompt = (
+    def build_prompt(self, review_text):
+        return (
             "Analyze this customer review and categorize the PRIMARY issue.\n\n"
             f'Review: "{review_text}"\n\n'
             "Categories:\n"
@@ -58,16 +66,15 @@ class ClassificationAgent:
             f"{SINGLE_REVIEW_JSON_FORMAT}"
         )
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+    def batch_request(self, custom_id, review_text):
+        """categorize()와 같은 요청을 Batch API 입력 줄로 구성"""
+        return batch_request(
+            custom_id, self.build_prompt(review_text), system_prompt=self.system_prompt(),
+            model=self.model, temperature=AGENT_TEMPERATURE,
         )
-        result = extract_json_from_text(response.choices[0].message.content)
+
+    def parse_response(self, content):
+        result = extract_json_from_text(content)
         if result is None:
             raise ValueError("Failed to parse JSON response from API.")
         if not isinstance(result, dict) or "category" not in result:
@@ -76,12 +83,24 @@ class ClassificationAgent:
 
         return result
 
+    def categorize(self, review_text):
+        """리뷰 분류"""
+        content = call_openai_json(
+            self.client,
+            self.build_prompt(review_text),
+            system_prompt=self.system_prompt(),
+            model=self.model,
+            temperature=AGENT_TEMPERATURE,
+            call_site="multi_agent_classify",
+        )
+        return self.parse_response(content)
+
 
 class CoordinatorAgent:
     """여러 에이전트의 결과를 종합하는 조정자"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = get_client()
         self.model = config.LLM_MODEL
 
     def aggregate_votes(self, predictions):
@@ -131,8 +150,7 @@ class CoordinatorAgent:
             'total_weight': sum(weighted_votes.values())
         }
 
-    def llm_consensus(self, review_text, predictions):
-        """LLM을 사용한 최종 판단"""
+    def build_consensus_prompt(self, review_text, predictions):
         predictions_text = "\n".join(
             [
                 (
@@ -144,7 +162,7 @@ class CoordinatorAgent:
             ]
         )
 
-        prompt = (
+        return (
             "You are a senior analyst reviewing classifications from multiple junior analysts.\n\n"
             f'Review: "{review_text}"\n\n'
             "Analyst predictions:\n"
@@ -161,26 +179,34 @@ class CoordinatorAgent:
             "}\n"
         )
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a senior e-commerce analyst making final decisions.",
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
+    def consensus_batch_request(self, custom_id, review_text, predictions):
+        """llm_consensus()와 같은 요청을 Batch API 입력 줄로 구성"""
+        return batch_request(
+            custom_id, self.build_consensus_prompt(review_text, predictions),
+            system_prompt=CONSENSUS_SYSTEM_PROMPT, model=self.model,
+            temperature=CONSENSUS_TEMPERATURE,
         )
 
-        result = extract_json_from_text(response.choices[0].message.content)
+    def parse_consensus(self, content):
+        result = extract_json_from_text(content)
         if result is None:
             raise ValueError("Failed to parse consensus JSON response.")
         if not isinstance(result, dict) or "final_category" not in result:
             raise ValueError("JSON response missing required key: final_category.")
         return result
 
+    def llm_consensus(self, review_text, predictions):
+        """LLM을 사용한 최종 판단"""
+        content = call_openai_json(
+            self.client,
+            self.build_consensus_prompt(review_text, predictions),
+            system_prompt=CONSENSUS_SYSTEM_PROMPT,
+            model=self.model,
+            temperature=CONSENSUS_TEMPERATURE,
+            call_site="multi_agent_consensus",
+        )
+        return self.parse_consensus(content)
+
 
 class MultiAgentAnalyzer:
     """멀티 에이전트 분석 시스템"""
@@ -221,37 +247,113 @@ class MultiAgentAnalyzer:
             return None
 
         # 합의 방법에 따라 최종 결정
-        if self.consensus_method == 'vote':
-            result = self.coordinator.aggregate_votes(predictions)
-        elif self.consensus_method == 'weighted':
-            result = self.coordinator.weighted_consensus(predictions)
-        elif self.consensus_method == 'llm':
+        if self.consensus_method == 'llm':
             result = self.coordinator.llm_consensus(review_text, predictions)
         else:
-            result = self.coordinator.aggregate_votes(predictions)
+            result = self._local_consensus(predictions)
 
         result['individual_predictions'] = predictions
         print(f"  → 최종 결정: {result.get('final_category', 'N/A')}")
 
         return result
 
-    def analyze_batch(self, reviews_list):
-        """여러 리뷰 배치 분석"""
+    def _local_consensus(self, predictions):
+        """LLM 호출이 필요 없는 합의 방법 ('vote', 'weighted')"""
+        if self.consensus_method == 'weighted':
+            return self.coordinator.weighted_consensus(predictions)
+        return self.coordinator.aggregate_votes(predictions)
+
+    def _collect_predictions_batch(self, reviews_list):
+        """모든 (리뷰, 에이전트) 분류 요청을 Batch API 하나로 제출"""
+        lines = [
+            agent.batch_request(f"{idx}:{agent.agent_id}", review)
+            for idx, review in enumerate(reviews_list)
+            for agent in self.agents
+        ]
+        print(f"\nBatch API 제출: 에이전트 분류 {len(lines)}개 요청 (완료까지 대기)")
+        batch_results = run_batch(
+            self.coordinator.client, lines, call_site="multi_agent_classify_batch"
+        )
+
+        predictions_by_review = []
+        for idx in range(len(reviews_list)):
+            predictions = []
+            for agent in self.agents:
+                try:
+                    content = batch_results.content(f"{idx}:{agent.agent_id}")
+                    predictions.append(agent.parse_response(content))
+                except (RuntimeError, ValueError) as e:
+                    print(f"  [{idx+1}] Agent {agent.agent_id} 에러: {e}")
+            predictions_by_review.append(predictions)
+        return predictions_by_review
+
+    def _analyze_batch_api(self, reviews_list):
+        """analyze_batch의 Batch API 버전 (llm 합의는 두 번째 배치로 제출)"""
+        predictions_by_review = self._collect_predictions_batch(reviews_list)
+
+        consensus_results = None
+        if self.consensus_method == 'llm':
+            lines = [
+                self.coordinator.consensus_batch_request(idx, reviews_list[idx], predictions)
+                for idx, predictions in enumerate(predictions_by_review)
+                if predictions
+            ]
+            print(f"Batch API 제출: LLM 합의 {len(lines)}개 요청 (완료까지 대기)")
+            consensus_results = run_batch(
+                self.coordinator.client, lines, call_site="multi_agent_consensus_batch"
+            )
+
+        results = []
+        for idx, (review, predictions) in enumerate(zip(reviews_list, predictions_by_review)):
+            if not predictions:
+                continue
+            if consensus_results is not None:
+                try:
+                    result = self.coordinator.parse_consensus(consensus_results.content(str(idx)))
+                except (RuntimeError, ValueError) as e:
+                    print(f"  [{idx+1}] 합의 에러: {e}")
+                    continue
+            else:
+                result = self._local_consensus(predictions)
+            result['individual_predictions'] = predictions
+            results.append(self._result_row(review, result))
+        return results
+
+    def _result_row(self, review_text, result):
+        return {
+            'review_text': review_text,
+            'final_category': result.get('final_category'),
+            'details': result
+        }
+
+    def analyze_batch(self, reviews_list, batch=False):
+        """
+        여러 리뷰 배치 분석
+
+        Args:
+            reviews_list: 리뷰 텍스트 목록
+            batch: True면 리뷰별 동기 호출 대신 Batch API로 한 번에 제출
+        """
+        if batch:
+            return self._analyze_batch_api(reviews_list)
+
         results = []
         for idx, review in enumerate(reviews_list):
             print(f"\n[{idx+1}/{len(reviews_list)}]", end=" ")
             result = self.analyze_review(review)
             if result:
-                results.append({
-                    'review_text': review,
-                    'final_category': result.get('final_category'),
-                    'details': result
-                })
+                results.append(self._result_row(review, result))
         return results
 
 
 def main():
     """데모 실행"""
+    parser = argparse.ArgumentParser(description='멀티 에이전트 리뷰 분석')
+    parser.add_argument('--consensus', choices=['vote', 'weighted', 'llm'], default='vote',
+                        help='합의 방법')
+    add_batch_argument(parser)
+    args = parser.parse_args()
+
     print("="*80)
     print("  멀티 에이전트 리뷰 분석 시스템")
     print("="*80)
@@ -265,9 +367,9 @@ def main():
     ]
 
     # 멀티 에이전트 분석
-    analyzer = MultiAgentAnalyzer(num_agents=3, consensus_method='vote')
+    analyzer = MultiAgentAnalyzer(num_agents=3, consensus_method=args.consensus)
 
-    results = analyzer.analyze_batch(test_reviews)
+    results = analyzer.analyze_batch(test_reviews, batch=args.batch)
 
     # 결과 출력
     print("\n" + "="*80)
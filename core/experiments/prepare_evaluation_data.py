@@ -13,6 +13,10 @@ import pandas as pd
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from core.data_loader import DataLoader  # pylint: disable=wrong-import-position
+from core.utils.cli_helpers import (  # pylint: disable=wrong-import-position
+    add_offline_argument,
+    apply_offline_argument,
+)
 
 
 def main():
@@ -43,7 +47,9 @@ def main():
         default=os.path.join("evaluation", "evaluation_dataset.csv"),
         help="Output CSV path",
     )
+    add_offline_argument(parser)
     args = parser.parse_args()
+    apply_offline_argument(args)
 
     loader = DataLoader()
     print("\n1. Loading data...")
@@ -3,6 +3,7 @@ Level 2: 프롬프트 엔지니어링 실험
 Zero-shot, Few-shot, CoT, Temperature 등 다양한 전략 비교
 """
 
+import argparse
 from datetime import datetime
 import json
 import os
@@ -13,7 +14,15 @@ from openai import OpenAIError
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from core.experiments.evaluate import Evaluator  # pylint: disable=wrong-import-position
+from core.utils.cli_helpers import (  # pylint: disable=wrong-import-position
+    add_batch_argument,
+    add_no_cache_argument,
+    apply_no_cache_argument,
+    print_llm_cache_stats,
+)
 from core.utils.json_utils import extract_json_from_text  # pylint: disable=wrong-import-position
+from core.utils.llm_batch import batch_request, run_batch  # pylint: disable=wrong-import-position
+from core.utils.llm_metrics import write_run_report  # pylint: disable=wrong-import-position
 from core.utils.openai_client import call_openai_json, get_client  # pylint: disable=wrong-import-position
 from core.utils.prompt_templates import build_zero_shot_prompt, format_reviews  # pylint: disable=wrong-import-position
 
@@ -33,36 +42,39 @@ class PromptExperiments:
         self.client = get_client()
         self.evaluator = Evaluator()
 
+    def _parse_result(self, content):
+        result = extract_json_from_text(content)
+        if result is None:
+            raise ValueError("Failed to parse JSON response.")
+        return result
+
     def _safe_call(self, prompt, system_prompt, temperature=0.3):
-        """?????? OpenAI API ???"""
+        """OpenAI API 호출 후 JSON 파싱 (실패 시 RuntimeError)"""
         try:
             content = call_openai_json(
                 self.client,
                 prompt,
                 system_prompt=system_prompt,
                 temperature=temperature,
+                call_site="prompt_experiment",
             )
-            result = extract_json_from_text(content)
-            if result is None:
-                raise ValueError("Failed to parse JSON response.")
-            return result
+            return self._parse_result(content)
         except (OpenAIError, json.JSONDecodeError, ValueError) as e:
             raise RuntimeError(f"API call failed: {e}") from e
 
-    def categorize_zero_shot(self, reviews_text_list, temperature=0.3):
-        """실험 1: Zero-shot (현재 방식)"""
-        print("\n🔬 실험 1: Zero-shot")
-
+    def _zero_shot_request(self, reviews_text_list, temperature=0.3):
         sampled_reviews = reviews_text_list[:min(100, len(reviews_text_list))]
         reviews_text = format_reviews(sampled_reviews)
         prompt = build_zero_shot_prompt(reviews_text, len(sampled_reviews))
+        return {'prompt': prompt, 'system_prompt': SYSTEM_PROMPT_ANALYST,
+                'temperature': temperature}
 
-        return self._safe_call(prompt, SYSTEM_PROMPT_ANALYST, temperature)
-
-    def categorize_few_shot(self, reviews_text_list, num_examples=3, temperature=0.3):
-        """실험 2: Few-shot Learning"""
-        print(f"\n🔬 실험 2: Few-shot ({num_examples}-shot)")
+    def categorize_zero_shot(self, reviews_text_list, temperature=0.3):
+        """실험 1: Zero-shot (현재 방식)"""
+        print("\n🔬 실험 1: Zero-shot")
+        return self._safe_call(**self._zero_shot_request(reviews_text_list, temperature))
 
+    def _few_shot_request(self, reviews_text_list, temperature=0.3):
         # Few-shot 예시
         examples = """
 Examples:
@@ -74,9 +86,7 @@ Examples:
 """
 
         sampled_reviews = reviews_text_list[:min(100, len(reviews_text_list))]
-        reviews_text = "\n---\n".join(
-            [f"{i+1}. {text[:500]}" for i, text in enumerate(sampled_reviews)]
-        )
+        reviews_text = format_reviews(sampled_reviews)
 
         prompt = f"""You are analyzing customer reviews for an e-commerce platform.
 
@@ -108,17 +118,19 @@ Use concise category names in English (lowercase with underscores).
 Categories: delivery_delay, wrong_item, poor_quality, damaged_packaging, size_issue,
 missing_parts, not_as_described, customer_service, price_issue, other
 """
+        return {'prompt': prompt, 'system_prompt': SYSTEM_PROMPT_ANALYST,
+                'temperature': temperature}
 
-        return self._safe_call(prompt, SYSTEM_PROMPT_ANALYST, temperature)
-
-    def categorize_cot(self, reviews_text_list, temperature=0.3):
-        """실험 3: Chain-of-Thought"""
-        print("\n🔬 실험 3: Chain-of-Thought")
+    def categorize_few_shot(self, reviews_text_list, num_examples=3, temperature=0.3):
+        """실험 2: Few-shot Learning"""
+        print(f"\n🔬 실험 2: Few-shot ({num_examples}-shot)")
+        return self._safe_call(
+            **self._few_shot_request(reviews_text_list, temperature)
+        )
 
+    def _cot_request(self, reviews_text_list, temperature=0.3):
         sampled_reviews = reviews_text_list[:min(100, len(reviews_text_list))]
-        reviews_text = "\n---\n".join(
-            [f"{i+1}. {text[:500]}" for i, text in enumerate(sampled_reviews)]
-        )
+        reviews_text = format_reviews(sampled_reviews)
 
         prompt = f"""You are analyzing customer reviews for an e-commerce platform.
 
@@ -152,8 +164,13 @@ Output format (JSON):
 Categories: delivery_delay, wrong_item, poor_quality, damaged_packaging, size_issue,
 missing_parts, not_as_described, customer_service, price_issue, other
 """
+        return {'prompt': prompt, 'system_prompt': SYSTEM_PROMPT_COT,
+                'temperature': temperature}
 
-        return self._safe_call(prompt, SYSTEM_PROMPT_COT, temperature)
+    def categorize_cot(self, reviews_text_list, temperature=0.3):
+        """실험 3: Chain-of-Thought"""
+        print("\n🔬 실험 3: Chain-of-Thought")
+        return self._safe_call(**self._cot_request(reviews_text_list, temperature))
 
     def extract_predictions(self, categorization_result, num_reviews):
         """카테고리화 결과에서 예측 리스트 추출"""
@@ -170,11 +187,37 @@ missing_parts, not_as_described, customer_service, price_issue, other
         correct = sum(1 for t, p in zip(y_true, y_pred, strict=True) if t == p)
         return correct / len(y_true)
 
-    def _run_categorization(self, reviews, y_true, method, **kwargs):
-        result = method(reviews, **kwargs)
+    def _score(self, result, reviews, y_true):
         y_pred = self.extract_predictions(result, len(reviews))
         return self._compute_accuracy(y_true, y_pred)
 
+    def _experiment_plan(self, reviews):
+        """(결과 키, 설명, 요청) 목록. 순차 실행과 Batch 실행이 같은 요청을 사용"""
+        plan = [
+            ('zero_shot', 'Baseline - No examples', self._zero_shot_request(reviews)),
+            ('few_shot_3', 'Few-shot with 3 examples per category',
+             self._few_shot_request(reviews)),
+            ('cot', 'Chain-of-Thought reasoning', self._cot_request(reviews)),
+        ]
+        for temp in [0.0, 0.5, 0.7]:
+            plan.append((
+                f'temperature_{temp}',
+                f'Few-shot with temperature={temp}',
+                self._few_shot_request(reviews, temperature=temp),
+            ))
+        return plan
+
+    def _run_plan_batch(self, plan):
+        """모든 실험 요청을 Batch API 하나로 제출하고 {결과 키: 파싱 결과} 반환"""
+        lines = [
+            batch_request(key, request['prompt'], system_prompt=request['system_prompt'],
+                          temperature=request['temperature'])
+            for key, _, request in plan
+        ]
+        print(f"\n📦 Batch API 제출: {len(lines)}개 실험 요청 (완료까지 대기)")
+        batch_results = run_batch(self.client, lines, call_site="prompt_experiment_batch")
+        return {key: self._parse_result(batch_results.content(key)) for key, _, _ in plan}
+
     def _add_result(self, results, key, accuracy, description):
         results[key] = {
             'accuracy': round(accuracy, 4),
@@ -189,6 +232,7 @@ missing_parts, not_as_described, customer_service, price_issue, other
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
 
+        write_run_report(f'results/llm_usage_prompt_experiments_{timestamp}.json')
         return output_file
 
     def _print_summary(self, results, output_file):
@@ -214,8 +258,13 @@ missing_parts, not_as_described, customer_service, price_issue, other
             f"+{(best_strategy[1]['accuracy'] - baseline_acc)*100:.1f}%"
         )
 
-    def run_all_experiments(self):
-        """모든 실험 실행"""
+    def run_all_experiments(self, batch=False):
+        """
+        모든 실험 실행
+
+        Args:
+            batch: True면 실험별 동기 호출 대신 모든 요청을 Batch API로 한 번에 제출
+        """
         print("="*80)
         print("  프롬프트 엔지니어링 실험")
         print("="*80)
@@ -230,71 +279,36 @@ missing_parts, not_as_described, customer_service, price_issue, other
         y_true = df['manual_label'].tolist()
 
         results = {}
-
-        # 실험 1: Zero-shot
-        print("\n" + "-"*80)
-        accuracy_zero = self._run_categorization(
-            reviews,
-            y_true,
-            self.categorize_zero_shot,
-        )
-        self._add_result(results, 'zero_shot', accuracy_zero, 'Baseline - No examples')
-        print(f"   ✓ Accuracy: {accuracy_zero*100:.2f}%")
-
-        # 실험 2: Few-shot (3-shot)
-        print("\n" + "-"*80)
-        accuracy_few = self._run_categorization(
-            reviews,
-            y_true,
-            self.categorize_few_shot,
-            num_examples=3,
-        )
-        self._add_result(
-            results,
-            'few_shot_3',
-            accuracy_few,
-            'Few-shot with 3 examples per category',
-        )
-        print(f"   ✓ Accuracy: {accuracy_few*100:.2f}%")
-
-        # 실험 3: Chain-of-Thought
-        print("\n" + "-"*80)
-        accuracy_cot = self._run_categorization(
-            reviews,
-            y_true,
-            self.categorize_cot,
-        )
-        self._add_result(results, 'cot', accuracy_cot, 'Chain-of-Thought reasoning')
-        print(f"   ✓ Accuracy: {accuracy_cot*100:.2f}%")
-
-        # 실험 4: Temperature 실험
-        print("\n" + "-"*80)
-        print("\n🔬 실험 4: Temperature Optimization")
-        temps = [0.0, 0.5, 0.7]
-        for temp in temps:
-            accuracy_temp = self._run_categorization(
-                reviews,
-                y_true,
-                self.categorize_few_shot,
-                temperature=temp,
-            )
-            self._add_result(
-                results,
-                f'temperature_{temp}',
-                accuracy_temp,
-                f'Few-shot with temperature={temp}',
-            )
-            print(f"   Temperature {temp}: {accuracy_temp*100:.2f}%")
+        plan = self._experiment_plan(reviews)
+        batch_outputs = self._run_plan_batch(plan) if batch else {}
+
+        for i, (key, description, request) in enumerate(plan, start=1):
+            print("\n" + "-"*80)
+            if batch:
+                result = batch_outputs[key]
+            else:
+                print(f"\n🔬 실험 {i}: {description}")
+                result = self._safe_call(**request)
+            accuracy = self._score(result, reviews, y_true)
+            self._add_result(results, key, accuracy, description)
+            print(f"   ✓ {key} Accuracy: {accuracy*100:.2f}%")
 
         output_file = self._save_results(results)
         self._print_summary(results, output_file)
+        print_llm_cache_stats()
 
         return results
 
 
 def main():
+    parser = argparse.ArgumentParser(description='프롬프트 엔지니어링 실험')
+    add_no_cache_argument(parser)
+    add_batch_argument(parser)
+    args = parser.parse_args()
+    apply_no_cache_argument(args)
+
     experiments = PromptExperiments()
-    experiments.run_all_experiments()
+    experiments.run_all_experiments(batch=args.batch)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,6 @@ import sys
 from uuid import uuid4
 
 import pandas as pd
-from openai import OpenAI
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -26,9 +25,16 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from core import config  # pylint: disable=wrong-import-position
 from core.utils.json_utils import extract_json_from_text  # pylint: disable=wrong-import-position
+from core.utils.llm_batch import batch_request, run_batch  # pylint: disable=wrong-import-position
+from core.utils.openai_client import call_openai_json, get_client  # pylint: disable=wrong-import-position
 from core.utils.prompt_templates import SINGLE_REVIEW_JSON_FORMAT  # pylint: disable=wrong-import-position
 from core.utils.review_categories import CATEGORIES_BULLETS  # pylint: disable=wrong-import-position
 
+RAG_SYSTEM_PROMPT = (
+    "You are an expert at analyzing e-commerce customer "
+    "feedback with retrieval-augmented generation."
+)
+
 
 class RAGReviewAnalyzer:
     """RAG 기반 리뷰 분석기"""
@@ -43,7 +49,7 @@ class RAGReviewAnalyzer:
             raise ImportError(
                 "Required packages not installed. Install: sentence-transformers chromadb"
             ) from _IMPORT_ERROR
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = get_client()
         self.llm_model = config.LLM_MODEL
         self.temperature = config.LLM_TEMPERATURE
 
@@ -125,12 +131,8 @@ class RAGReviewAnalyzer:
 
         return similar_examples
 
-    def categorize_with_rag(self, review_text, n_examples=3):
-        """RAG 기반 리뷰 분류"""
-        # 1. 유사한 예시 검색
-        similar_examples = self.retrieve_similar(review_text, n_results=n_examples)
-
-        # 2. Few-shot 프롬프트 구성
+    def _build_rag_prompt(self, review_text, similar_examples):
+        """검색된 예시로 Few-shot 프롬프트 구성"""
         examples_text = ""
         if similar_examples:
             examples_text = "Similar examples from past reviews:\n\n"
@@ -138,7 +140,7 @@ class RAGReviewAnalyzer:
                 examples_text += f"{i}. Review: \"{example['text'][:150]}...\"\n"
                 examples_text += f"   Category: {example['category']}\n\n"
 
-        prompt = (
+        return (
             f"{examples_text}\n\n"
             "Now, categorize this new review:\n\n"
             f"Review: \"{review_text}\"\n\n"
@@ -148,38 +150,71 @@ class RAGReviewAnalyzer:
             f"{SINGLE_REVIEW_JSON_FORMAT}"
         )
 
-        response = self.client.chat.completions.create(
-            model=self.llm_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert at analyzing e-commerce customer "
-                        "feedback with retrieval-augmented generation."
-                    ),
-                },
-                {"role": "user", "content": prompt}
-            ],
-            temperature=self.temperature,
-            response_format={"type": "json_object"}
-        )
-
-        result = extract_json_from_text(response.choices[0].message.content)
+    def _parse_rag_result(self, content, similar_examples):
+        result = extract_json_from_text(content)
         if result is None:
             raise ValueError("Failed to parse RAG categorization JSON response.")
         result['retrieved_examples'] = similar_examples
         return result
 
-    def categorize_batch(self, reviews_list, n_examples=3):
-        """여러 리뷰 배치 분류"""
+    def categorize_with_rag(self, review_text, n_examples=3):
+        """RAG 기반 리뷰 분류"""
+        # 1. 유사한 예시 검색
+        similar_examples = self.retrieve_similar(review_text, n_results=n_examples)
+
+        # 2. Few-shot 프롬프트 구성
+        prompt = self._build_rag_prompt(review_text, similar_examples)
+
+        content = call_openai_json(
+            self.client,
+            prompt,
+            system_prompt=RAG_SYSTEM_PROMPT,
+            model=self.llm_model,
+            temperature=self.temperature,
+            call_site="rag",
+        )
+        return self._parse_rag_result(content, similar_examples)
+
+    def _submit_batch(self, reviews_list, n_examples):
+        """검색은 로컬에서 하고 LLM 요청만 Batch API로 한 번에 제출 (custom_id = 리뷰 인덱스)"""
+        similar_by_review = [
+            self.retrieve_similar(review, n_results=n_examples) for review in reviews_list
+        ]
+        lines = [
+            batch_request(
+                idx, self._build_rag_prompt(review, similar),
+                system_prompt=RAG_SYSTEM_PROMPT, model=self.llm_model,
+                temperature=self.temperature,
+            )
+            for idx, (review, similar) in enumerate(zip(reviews_list, similar_by_review))
+        ]
+        print(f"   Batch API 제출: {len(lines)}개 요청 (완료까지 대기)")
+        return run_batch(self.client, lines, call_site="rag_batch"), similar_by_review
+
+    def categorize_batch(self, reviews_list, n_examples=3, batch=False):
+        """
+        여러 리뷰 배치 분류
+
+        Args:
+            reviews_list: 리뷰 텍스트 목록
+            n_examples: 리뷰별 검색 예시 수
+            batch: True면 리뷰별 동기 호출 대신 Batch API로 한 번에 제출
+        """
         results = []
 
         print(f"\n🤖 RAG 기반 분석 시작 (검색 예시: {n_examples}개)")
+        if batch:
+            batch_results, similar_by_review = self._submit_batch(reviews_list, n_examples)
         for idx, review in enumerate(reviews_list):
             print(f"   [{idx+1}/{len(reviews_list)}] 분석 중...", end='\r')
 
             try:
-                result = self.categorize_with_rag(review, n_examples=n_examples)
+                if batch:
+                    result = self._parse_rag_result(
+                        batch_results.content(str(idx)), similar_by_review[idx]
+                    )
+                else:
+                    result = self.categorize_with_rag(review, n_examples=n_examples)
                 results.append({
                     'review_number': idx + 1,
                     'category': result['category'],
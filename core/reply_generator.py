@@ -3,10 +3,18 @@
 부정 리뷰에 대해 매크로가 아닌 진심 어린 맞춤 답변을 LLM으로 생성한다.
 """
 
+import asyncio
 import logging
 
+from core import config
+from core.utils.dedup import cluster_near_duplicates
 from core.utils.json_utils import extract_json_from_text
-from core.utils.openai_client import call_openai_json, get_client
+from core.utils.openai_client import (
+    call_openai_json,
+    call_openai_json_async,
+    get_client,
+    stream_openai_json_items_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +93,56 @@ def _build_batch_prompt(reviews: list[dict]) -> str:
 }}"""
 
 
+def _parse_single(raw: str) -> dict:
+    parsed = extract_json_from_text(raw)
+    if not parsed or "reply" not in parsed:
+        logger.warning("답변 생성 JSON 파싱 실패, raw: %s", raw[:200])
+        return {"reply": raw, "tone": "", "key_points_addressed": [], "suggested_action": ""}
+
+    return parsed
+
+
+def _parse_batch_chunk(raw: str, start: int, chunk_len: int) -> list[dict]:
+    parsed = extract_json_from_text(raw)
+    if parsed and "replies" in parsed:
+        for reply_data in parsed["replies"]:
+            reply_data["review_index"] = start + reply_data.get("review_index", 1)
+        return parsed["replies"]
+
+    logger.warning("일괄 답변 생성 파싱 실패, chunk %d~%d", start, start + chunk_len)
+    return []
+
+
+def _chunk_starts(reviews: list[dict]) -> range:
+    return range(0, len(reviews), REPLY_BATCH_SIZE)
+
+
+def _collapse_duplicates(reviews: list[dict]) -> tuple[list[dict], list[list[int]]]:
+    """근접 중복 리뷰(같은 평점/카테고리)를 대표 하나로 묶음. (대표 리뷰 목록, 대표별 멤버 인덱스)"""
+    if not config.DEDUP_ENABLED or len(reviews) < 2:
+        return reviews, [[i] for i in range(len(reviews))]
+
+    clusters = cluster_near_duplicates([r["review_text"] for r in reviews])
+    members = {}
+    for i, (cluster, r) in enumerate(zip(clusters, reviews)):
+        members.setdefault((cluster, r.get("rating"), r.get("category")), []).append(i)
+    groups = list(members.values())
+    return [reviews[group[0]] for group in groups], groups
+
+
+def _fan_out(reply: dict, members: list[list[int]]) -> list[dict]:
+    """대표 리뷰 기준 review_index(1부터)의 답변을 클러스터 멤버마다 복사"""
+    index = reply.get("review_index")
+    if not isinstance(index, int) or not 1 <= index <= len(members):
+        return [reply]
+    return [{**reply, "review_index": i + 1} for i in members[index - 1]]
+
+
+def _fan_out_all(replies: list[dict], members: list[list[int]]) -> list[dict]:
+    fanned = [copy for reply in replies for copy in _fan_out(reply, members)]
+    return sorted(fanned, key=lambda reply: reply.get("review_index", 0))
+
+
 class ReplyGenerator:
     def __init__(self):
         self.client = get_client()
@@ -94,30 +152,82 @@ class ReplyGenerator:
     ) -> dict:
         """단일 리뷰에 대한 맞춤 답변 생성."""
         prompt = _build_single_prompt(review_text, rating, category)
-        raw = call_openai_json(self.client, prompt, system_prompt=SYSTEM_PROMPT)
-
-        parsed = extract_json_from_text(raw)
-        if not parsed or "reply" not in parsed:
-            logger.warning("답변 생성 JSON 파싱 실패, raw: %s", raw[:200])
-            return {"reply": raw, "tone": "", "key_points_addressed": [], "suggested_action": ""}
-
-        return parsed
+        raw = call_openai_json(
+            self.client, prompt, system_prompt=SYSTEM_PROMPT, call_site="reply_single"
+        )
+        return _parse_single(raw)
 
     def generate_batch(self, reviews: list[dict]) -> list[dict]:
-        """다건 리뷰 답변 일괄 생성. REPLY_BATCH_SIZE씩 묶어 호출."""
+        """다건 리뷰 답변 일괄 생성. 근접 중복은 대표만 REPLY_BATCH_SIZE씩 묶어 호출하고 멤버에게 펼친다."""
+        reviews, members = _collapse_duplicates(reviews)
         all_replies = []
 
-        for start in range(0, len(reviews), REPLY_BATCH_SIZE):
+        for start in _chunk_starts(reviews):
             chunk = reviews[start:start + REPLY_BATCH_SIZE]
             prompt = _build_batch_prompt(chunk)
-            raw = call_openai_json(self.client, prompt, system_prompt=SYSTEM_PROMPT)
+            raw = call_openai_json(
+                self.client, prompt, system_prompt=SYSTEM_PROMPT, call_site="reply_batch"
+            )
+            all_replies.extend(_parse_batch_chunk(raw, start, len(chunk)))
+
+        return _fan_out_all(all_replies, members)
 
-            parsed = extract_json_from_text(raw)
-            if parsed and "replies" in parsed:
-                for reply_data in parsed["replies"]:
-                    reply_data["review_index"] = start + reply_data.get("review_index", 1)
-                all_replies.extend(parsed["replies"])
-            else:
-                logger.warning("일괄 답변 생성 파싱 실패, chunk %d~%d", start, start + len(chunk))
+    async def generate_single_async(
+        self, review_text: str, rating: int, category: str | None = None
+    ) -> dict:
+        """generate_single의 비동기 버전."""
+        prompt = _build_single_prompt(review_text, rating, category)
+        raw = await call_openai_json_async(
+            prompt, system_prompt=SYSTEM_PROMPT, call_site="reply_single"
+        )
+        return _parse_single(raw)
 
-        return all_replies
+    async def generate_batch_async(self, reviews: list[dict]) -> list[dict]:
+        """generate_batch의 비동기 버전. 청크들을 동시에 호출한다."""
+        reviews, members = _collapse_duplicates(reviews)
+
+        async def _run_chunk(start):
+            chunk = reviews[start:start + REPLY_BATCH_SIZE]
+            raw = await call_openai_json_async(
+                _build_batch_prompt(chunk), system_prompt=SYSTEM_PROMPT, call_site="reply_batch"
+            )
+            return _parse_batch_chunk(raw, start, len(chunk))
+
+        chunk_results = await asyncio.gather(
+            *(_run_chunk(start) for start in _chunk_starts(reviews))
+        )
+        return _fan_out_all([reply for replies in chunk_results for reply in replies], members)
+
+    async def stream_batch_async(self, reviews: list[dict]):
+        """generate_batch_async의 스트리밍 버전. 청크들을 동시에 호출하고 답변이 완성되는 대로 yield."""
+        reviews, members = _collapse_duplicates(reviews)
+        queue = asyncio.Queue()
+
+        async def _run_chunk(start):
+            chunk = reviews[start:start + REPLY_BATCH_SIZE]
+            try:
+                async for reply in stream_openai_json_items_async(
+                    _build_batch_prompt(chunk),
+                    "replies",
+                    system_prompt=SYSTEM_PROMPT,
+                    call_site="reply_batch",
+                ):
+                    reply["review_index"] = start + reply.get("review_index", 1)
+                    await queue.put(reply)
+            finally:
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(_run_chunk(start)) for start in _chunk_starts(reviews)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                reply = await queue.get()
+                if reply is None:
+                    remaining -= 1
+                else:
+                    for copy in _fan_out(reply, members):
+                        yield copy
+            await asyncio.gather(*tasks)  # 실패한 청크의 오류를 올림
+        finally:
+            for task in tasks:
+                task.cancel()
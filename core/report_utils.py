@@ -33,3 +33,17 @@ def print_emerging_issues(
             print()
     else:
         print(f"\n{empty_message}")
+
+
+def print_surges(surges, header, limit=5):
+    """Print statistically significant daily surges (nothing if there are none)."""
+    if not surges:
+        return
+    print(f"\n{header}\n")
+    for i, surge in enumerate(surges[:limit], 1):
+        print(f"{i}. {surge['category'].replace('_', ' ').title()} ({surge['day']})")
+        print(
+            f"   {surge['count']:.0f}건 (기대 {surge['expected']:.1f}건), "
+            f"z={surge['z_score']:.1f}, p={surge['p_value']:.2g}"
+        )
+        print()
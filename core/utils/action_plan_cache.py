@@ -0,0 +1,162 @@
+"""
+개선안(generate_action_plan) 결과 캐시 (SQLite)
+
+개선안 생성은 느리고 비싼 호출인데, 대시보드를 새로 고칠 때마다 상위 이슈/급증 이슈가
+사실상 그대로여도 다시 실행된다. 입력을 정규화한 시그니처로 결과를 저장해 두고
+바뀐 폭이 허용 범위 안이면 그대로 재사용한다.
+
+- 키: (scope, 모델, 프롬프트 템플릿, 상위 이슈 카테고리 순서, 급증 이슈 카테고리 집합)
+  — 이 중 하나라도 바뀌면 다른 키라 새로 생성한다
+- 같은 키 안에서는 건수가 config.ACTION_PLAN_COUNT_TOLERANCE(상대 비율),
+  비율이 config.ACTION_PLAN_PERCENT_TOLERANCE(%p) 넘게 바뀌면 새로 생성한다
+- 비교 기준은 개선안을 생성했을 때의 값이라 조금씩 누적된 변화도 결국 재생성된다
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from core import config
+from core.utils import sqlite_utils
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS action_plans (
+    key TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    recommendations TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+_shared = {"cache": None}
+_shared_lock = threading.Lock()
+
+
+def issue_profile(top_issues, emerging_issues):
+    """
+    개선안 입력의 정규화 프로필 (예시 문구는 제외)
+
+    Returns:
+        {'top': [[category, count, percentage], ...] (순위 순서),
+         'emerging': [[category, recent_count, comparison_count], ...] (카테고리 순)}
+    """
+    return {
+        "top": [
+            [issue["category"], issue["count"], float(issue["percentage"])]
+            for issue in top_issues
+        ],
+        "emerging": sorted(
+            [issue["category"], issue["recent_count"], issue["comparison_count"]]
+            for issue in emerging_issues or []
+        ),
+    }
+
+
+def profile_key(scope, model, template, profile):
+    """카테고리 구성이 같은 프로필끼리 공유하는 캐시 키"""
+    payload = json.dumps(
+        [
+            scope,
+            model,
+            template,
+            [row[0] for row in profile["top"]],
+            [row[0] for row in profile["emerging"]],
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count_changed(old, new):
+    return abs(new - old) > config.ACTION_PLAN_COUNT_TOLERANCE * max(old, 1)
+
+
+def changed_materially(cached, current):
+    """같은 키의 두 프로필 사이에 허용 범위를 넘는 변화가 있는지"""
+    for (_, old_count, old_pct), (_, count, pct) in zip(cached["top"], current["top"]):
+        if _count_changed(old_count, count):
+            return True
+        if abs(pct - old_pct) > config.ACTION_PLAN_PERCENT_TOLERANCE:
+            return True
+    for (_, old_recent, old_comparison), (_, recent, comparison) in zip(
+        cached["emerging"], current["emerging"]
+    ):
+        if _count_changed(old_recent, recent) or _count_changed(old_comparison, comparison):
+            return True
+    return False
+
+
+class ActionPlanCache:
+    """시그니처 + 허용 범위로 재사용하는 개선안 캐시"""
+
+    def __init__(self, path, ttl_seconds=None):
+        self.path = path
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else config.ACTION_PLAN_CACHE_TTL_SECONDS
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite_utils.connect(path, _SCHEMA)
+
+    def get(self, key, profile):
+        """재사용 가능한 개선안 목록. 없거나 만료/큰 변화가 있으면 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT profile, recommendations, created_at FROM action_plans WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if (
+                row is None
+                or time.time() - row[2] > self.ttl_seconds
+                or changed_materially(json.loads(row[0]), profile)
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[1])
+
+    def set(self, key, profile, recommendations):
+        """새로 생성한 개선안 저장 (이후 비교 기준이 이 프로필로 바뀜)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO action_plans "
+                "(key, profile, recommendations, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(profile, ensure_ascii=False),
+                    json.dumps(recommendations, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM action_plans WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM action_plans")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_action_plan_cache():
+    """공유 개선안 캐시 반환. 비활성화 상태면 None"""
+    if not config.ACTION_PLAN_CACHE_ENABLED:
+        return None
+
+    with _shared_lock:
+        cache = _shared["cache"]
+        if cache is None or cache.path != config.ACTION_PLAN_CACHE_PATH:
+            cache = ActionPlanCache(config.ACTION_PLAN_CACHE_PATH)
+            _shared["cache"] = cache
+    return cache
@@ -3,7 +3,9 @@
 main.py, analyze_csv.py에서 사용하는 분석 파이프라인 공통 로직
 """
 
-from core.report_utils import print_emerging_issues, print_top_issues
+from concurrent.futures import ThreadPoolExecutor
+
+from core.report_utils import print_emerging_issues, print_surges, print_top_issues
 from core.utils.cli_helpers import print_section
 
 
@@ -14,29 +16,41 @@ def split_by_period(negative_df, loader):
 
 
 def analyze_periods(analyzer, recent_df, comparison_df, allow_empty_comparison=False):
-    """Analyze recent and comparison reviews."""
+    """Analyze recent and comparison reviews (both periods' LLM calls run concurrently)."""
     print_section("Step 4: Analyzing Recent Reviews")
     print(f"Processing {len(recent_df)} recent negative reviews...")
     print("(This may take a few minutes...)")
 
-    recent_reviews = recent_df['review_text'].dropna().tolist()
-    recent_categorization = analyzer.categorize_issues(recent_reviews)
-
     print_section("Step 5: Analyzing Comparison Period Reviews")
     print(f"Processing {len(comparison_df)} comparison period negative reviews...")
 
-    comparison_reviews = comparison_df['review_text'].dropna().tolist()
-    if allow_empty_comparison and not comparison_reviews:
+    skip_comparison = allow_empty_comparison and comparison_df['review_text'].dropna().empty
+    if skip_comparison:
         print("Not enough data in comparison period, using empty categorization")
-        comparison_categorization = {'categories': []}
-    else:
-        comparison_categorization = analyzer.categorize_issues(comparison_reviews)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        recent_future = executor.submit(analyzer.categorize_period, recent_df)
+        comparison_future = (
+            None if skip_comparison
+            else executor.submit(analyzer.categorize_period, comparison_df)
+        )
+        recent_categorization = recent_future.result()
+        comparison_categorization = (
+            comparison_future.result() if comparison_future else {'categories': []}
+        )
 
     return recent_categorization, comparison_categorization
 
 
-def summarize_results(analyzer, recent_categorization, comparison_categorization):
-    """Summarize top and emerging issues."""
+def summarize_results(
+    analyzer, recent_categorization, comparison_categorization, series=None
+):
+    """Summarize top and emerging issues.
+
+    With a series key, exact (full corpus) daily category counts are also
+    persisted and the incremental surge detector reports significant daily
+    surges; sampled categorizations are not recorded.
+    """
     print_section("Step 6: Identifying Top 3 Issues")
     top_issues = analyzer.get_top_issues(recent_categorization, top_n=3)
 
@@ -61,14 +75,22 @@ def summarize_results(analyzer, recent_categorization, comparison_categorization
         comparison_format="   이전: {comparison_count}회 → 최근: {recent_count}회",
     )
 
+    if series:
+        surges = analyzer.update_issue_series(
+            series, comparison_categorization, recent_categorization
+        )
+        print_surges(surges, header="[일간 급증 신호 (EWMA/CUSUM)]")
+
     return top_issues, emerging_issues
 
 
-def generate_and_print_action_plan(analyzer, top_issues, emerging_issues):
+def generate_and_print_action_plan(analyzer, top_issues, emerging_issues, scope=None):
     """Generate action plan and print recommendations."""
     print_section("Step 8: Generating Action Plan")
     print("AI가 개선 액션을 생성하는 중...")
-    recommendations = analyzer.generate_action_plan(top_issues, emerging_issues)
+    recommendations = analyzer.generate_action_plan(
+        top_issues, emerging_issues, scope=scope
+    )
 
     print("\n[개선 액션 제안]\n")
     for i, rec in enumerate(recommendations, 1):
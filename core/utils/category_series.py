@@ -0,0 +1,347 @@
+"""
+카테고리별 일간 건수 시계열과 증분 급증 탐지 (SQLite)
+
+두 고정 기간의 Counter를 매번 다시 비교하는 대신, 분류 결과가 나올 때마다
+(시리즈, 날짜, 카테고리)별 건수를 저장하고 새 날짜만 탐지기에 흘려 보낸다.
+탐지기 상태는 카테고리별 EWMA 기대값과 단측 CUSUM 하나씩이라 하루 갱신이
+O(카테고리 수)이고, 과거 리뷰를 다시 분류할 필요가 없다.
+
+- 기대값 λ: 일간 건수의 EWMA (config.EMERGING_EWMA_ALPHA)
+- p-value: Poisson(λ)에서 그날 건수 이상이 나올 확률
+- CUSUM: S = max(0, S + z - k), S > h면 지속적인 증가로 보고 신호 후 0으로 리셋
+- 처음 config.EMERGING_WARMUP_DAYS일은 기대값만 쌓고 신호를 내지 않는다
+
+시리즈는 상품/데이터셋 단위 키다. Poisson 가정은 정확한 건수에서만 성립하므로
+전수 분류(또는 라벨 저장소로 모든 리뷰가 라벨된 기간) 결과만 받는다. 층화 표본의
+가중 추정치는 리뷰 하나가 수십 건으로 부풀려져 가짜 급증이 되므로 거부한다.
+"""
+
+import logging
+import math
+import threading
+from collections import defaultdict
+
+import pandas as pd
+
+from core import config
+from core.categorization_result import CategorizationResult
+from core.utils import sqlite_utils
+from core.utils.sampling import POPULATION_KEY
+
+logger = logging.getLogger(__name__)
+
+DAY_KEY = "day"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_counts (
+    series TEXT NOT NULL,
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    count REAL NOT NULL,
+    PRIMARY KEY (series, day, category)
+);
+CREATE TABLE IF NOT EXISTS detector_state (
+    series TEXT NOT NULL,
+    category TEXT NOT NULL,
+    mean REAL NOT NULL,
+    cusum REAL NOT NULL,
+    days INTEGER NOT NULL,
+    PRIMARY KEY (series, category)
+);
+CREATE TABLE IF NOT EXISTS detector_cursor (
+    series TEXT PRIMARY KEY,
+    last_day TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS surges (
+    series TEXT NOT NULL,
+    day TEXT NOT NULL,
+    category TEXT NOT NULL,
+    count REAL NOT NULL,
+    expected REAL NOT NULL,
+    z_score REAL NOT NULL,
+    p_value REAL NOT NULL,
+    cusum REAL NOT NULL,
+    PRIMARY KEY (series, day, category)
+);
+"""
+
+_SURGE_FIELDS = ("day", "category", "count", "expected", "z_score", "p_value", "cusum")
+
+_shared = {"store": None}
+_shared_lock = threading.Lock()
+
+
+def attach_days(categorization, created_at):
+    """
+    categorize_issues 결과 항목에 작성일(YYYY-MM-DD)을 붙임
+
+    Args:
+        categorization: {'categories': [...]} (review_number는 created_at 순서 기준 1부터)
+        created_at: 분류에 넣은 리뷰 순서대로의 작성 시각
+    """
+    days = pd.to_datetime(pd.Series(list(created_at)), errors="coerce").dt.strftime("%Y-%m-%d")
+    for item in categorization.get("categories", []):
+        day = days.iloc[item["review_number"] - 1]
+        if isinstance(day, str):
+            item[DAY_KEY] = day
+    return categorization
+
+
+def is_exact(categorization):
+    """층화 표본이 아닌(전수) 분류 결과인지"""
+    return not CategorizationResult.of(categorization).get(POPULATION_KEY)
+
+
+def daily_category_counts(categorization):
+    """
+    {날짜: {카테고리: 건수}}
+
+    Raises:
+        ValueError: 층화 표본 결과 (건수가 Poisson을 따르지 않음)
+    """
+    if not is_exact(categorization):
+        raise ValueError("daily category counts need an exact (full corpus) categorization")
+    daily = defaultdict(lambda: defaultdict(float))
+    for item in CategorizationResult.of(categorization)["categories"]:
+        day = item.get(DAY_KEY)
+        if day is not None:
+            daily[day][item["category"]] += 1.0
+    return {day: dict(counts) for day, counts in daily.items()}
+
+
+def _log_poisson_pmf(k, lam):
+    return -lam + k * math.log(lam) - math.lgamma(k + 1)
+
+
+def poisson_sf(x, lam):
+    """P(X >= x), X ~ Poisson(lam)"""
+    if x <= 0:
+        return 1.0
+    if lam <= 0:
+        return 0.0
+    if x <= lam:
+        cdf = sum(math.exp(_log_poisson_pmf(k, lam)) for k in range(x))
+        return max(0.0, 1.0 - cdf)
+
+    # 꼬리를 직접 합산 (작은 p-value에서 1 - cdf의 정밀도 손실 방지)
+    total, k = 0.0, x
+    while True:
+        term = math.exp(_log_poisson_pmf(k, lam))
+        total += term
+        if term <= total * 1e-12:
+            return min(1.0, total)
+        k += 1
+
+
+def detector_step(state, count):
+    """
+    한 카테고리의 하루치 탐지기 갱신
+
+    Args:
+        state: {'mean', 'cusum', 'days'} 또는 None(처음 보는 카테고리)
+        count: 그날 건수
+
+    Returns:
+        (새 state, {'expected', 'z_score', 'p_value', 'cusum', 'surge'})
+    """
+    state = state or {"mean": 0.0, "cusum": 0.0, "days": 0}
+    expected = max(state["mean"], config.EMERGING_RATE_FLOOR)
+    z_score = (count - expected) / math.sqrt(expected)
+    p_value = poisson_sf(round(count), expected)
+    # 기대값이 자리잡기 전(warmup)에는 CUSUM을 쌓지 않음
+    warmed_up = state["days"] >= config.EMERGING_WARMUP_DAYS
+    cusum = max(0.0, state["cusum"] + z_score - config.EMERGING_CUSUM_K) if warmed_up else 0.0
+
+    surge = (
+        warmed_up
+        and count >= config.EMERGING_MIN_DAILY_COUNT
+        and (p_value < config.EMERGING_P_VALUE or cusum > config.EMERGING_CUSUM_H)
+    )
+    alpha = config.EMERGING_EWMA_ALPHA
+    new_state = {
+        "mean": count if state["days"] == 0 else (1 - alpha) * state["mean"] + alpha * count,
+        "cusum": 0.0 if surge else cusum,
+        "days": state["days"] + 1,
+    }
+    return new_state, {
+        "expected": expected,
+        "z_score": z_score,
+        "p_value": p_value,
+        "cusum": cusum,
+        "surge": surge,
+    }
+
+
+def _calendar_days(cursor, first_day, last_day):
+    """커서 다음 날(커서가 없으면 first_day)부터 last_day까지 모든 날짜 (YYYY-MM-DD)"""
+    start = pd.Timestamp(cursor) + pd.Timedelta(days=1) if cursor else pd.Timestamp(first_day)
+    return pd.date_range(start, last_day, freq="D").strftime("%Y-%m-%d")
+
+
+def _step_day(states, day, counts):
+    """하루치 탐지기 갱신 (states를 직접 수정). 그날의 급증 목록 반환"""
+    surges = []
+    for category in sorted(states.keys() | counts.keys()):
+        count = counts.get(category, 0.0)
+        states[category], step = detector_step(states.get(category), count)
+        if step["surge"]:
+            surges.append({
+                "day": day,
+                "category": category,
+                "count": count,
+                **{k: v for k, v in step.items() if k != "surge"},
+            })
+    return surges
+
+
+class CategorySeriesStore:
+    """시리즈별 일간 카테고리 건수 + 증분 탐지기 상태 저장소"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite_utils.connect(path, _SCHEMA)
+
+    def _cursor(self, series):
+        row = self._conn.execute(
+            "SELECT last_day FROM detector_cursor WHERE series = ?", (series,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record_counts(self, series, daily, replay=False):
+        """
+        {날짜: {카테고리: 건수}} 저장 (같은 날짜는 통째로 교체)
+
+        탐지기가 이미 지나간 날짜(커서 이하)는 기본적으로 건너뛴다. 겹치는 최근 기간을
+        다시 돌리는 것은 정상 실행이라, 처음 반영한 값으로 탐지기 상태를 유지한다.
+        replay=True면 그 날짜들도 저장하고 탐지기를 초기화해 다음 update_detector에서
+        저장된 건수 전체를 처음부터 다시 반영한다.
+        """
+        if not daily:
+            return
+        with self._lock:
+            cursor = self._cursor(series)
+            late = {day for day in daily if cursor is not None and day <= cursor}
+            if late and replay:
+                self._reset(series)
+            elif late:
+                logger.debug(
+                    "category series %s: skipping %d day(s) up to %s already passed the detector",
+                    series, len(late), cursor,
+                )
+                daily = {day: counts for day, counts in daily.items() if day not in late}
+            for day, counts in daily.items():
+                self._conn.execute(
+                    "DELETE FROM daily_counts WHERE series = ? AND day = ?", (series, day)
+                )
+                self._conn.executemany(
+                    "INSERT INTO daily_counts (series, day, category, count) VALUES (?, ?, ?, ?)",
+                    [(series, day, category, count) for category, count in counts.items()],
+                )
+            self._conn.commit()
+
+    def daily_counts(self, series, since=None):
+        """저장된 {날짜: {카테고리: 건수}} (since 이후만)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, category, count FROM daily_counts "
+                "WHERE series = ? AND day >= ? ORDER BY day",
+                (series, since or ""),
+            ).fetchall()
+        daily = defaultdict(dict)
+        for day, category, count in rows:
+            daily[day][category] = count
+        return dict(daily)
+
+    def update_detector(self, series):
+        """
+        마지막으로 처리한 날짜 이후의 일간 건수를 날짜순으로 탐지기에 반영
+
+        리뷰가 하나도 없는 날도 모든 카테고리를 0건으로 한 번씩 갱신한다 (빈 날을 건너뛰면
+        EWMA 기대값이 줄지 않아 조용한 기간 뒤의 급증을 놓친다).
+
+        Returns:
+            새로 감지된 급증 목록 [{day, category, count, expected, z_score, p_value, cusum}]
+        """
+        with self._lock:
+            cursor = self._cursor(series)
+            rows = self._conn.execute(
+                "SELECT day, category, count FROM daily_counts "
+                "WHERE series = ? AND day > ? ORDER BY day",
+                (series, cursor or ""),
+            ).fetchall()
+            if not rows:
+                return []
+
+            states = {
+                category: {"mean": mean, "cusum": cusum, "days": days}
+                for category, mean, cusum, days in self._conn.execute(
+                    "SELECT category, mean, cusum, days FROM detector_state WHERE series = ?",
+                    (series,),
+                )
+            }
+            by_day = defaultdict(dict)
+            for day, category, count in rows:
+                by_day[day][category] = count
+
+            surges = []
+            for day in _calendar_days(cursor, rows[0][0], rows[-1][0]):
+                surges.extend(_step_day(states, day, by_day.get(day, {})))
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO detector_state (series, category, mean, cusum, days) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (series, category, s["mean"], s["cusum"], s["days"])
+                    for category, s in states.items()
+                ],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO detector_cursor (series, last_day) VALUES (?, ?)",
+                (series, rows[-1][0]),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO surges "
+                "(series, day, category, count, expected, z_score, p_value, cusum) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(series, *(s[field] for field in _SURGE_FIELDS)) for s in surges],
+            )
+            self._conn.commit()
+        return surges
+
+    def surges(self, series, since=None):
+        """저장된 급증 목록 (최근 날짜 → p-value 오름차순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_SURGE_FIELDS)} FROM surges "
+                "WHERE series = ? AND day >= ? ORDER BY day DESC, p_value",
+                (series, since or ""),
+            ).fetchall()
+        return [dict(zip(_SURGE_FIELDS, row)) for row in rows]
+
+    def reset_detector(self, series):
+        """탐지기 상태/급증 기록을 지워 저장된 일간 건수로 처음부터 다시 돌릴 수 있게 함"""
+        with self._lock:
+            self._reset(series)
+            self._conn.commit()
+
+    def _reset(self, series):
+        for table in ("detector_state", "detector_cursor", "surges"):
+            self._conn.execute(f"DELETE FROM {table} WHERE series = ?", (series,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_category_series_store():
+    """공유 시계열 저장소 반환. 비활성화 상태면 None"""
+    if not config.CATEGORY_SERIES_ENABLED:
+        return None
+
+    with _shared_lock:
+        store = _shared["store"]
+        if store is None or store.path != config.CATEGORY_SERIES_PATH:
+            store = CategorySeriesStore(config.CATEGORY_SERIES_PATH)
+            _shared["store"] = store
+    return store
@@ -6,6 +6,7 @@ main.py, analyze_csv.py 등에서 사용하는 공통 함수
 import sys
 
 from core import config
+from core.utils.llm_cache import cache_stats
 
 
 def print_section(title):
@@ -39,17 +40,93 @@ def filter_and_check_negative(loader, df):
     return negative_df
 
 
-def print_analysis_complete(df, negative_df, extra_info=""):
-    """Print analysis complete summary."""
+def load_negative_chunked_and_check(loader, chunks):
+    """Stream reviews chunk by chunk, keep only negative ones, and exit if none found."""
+    print_section("Step 2: Streaming Negative Reviews")
+    negative_df, stats = loader.load_negative_reviews_chunked(chunks)
+    check_negative_reviews(negative_df)
+    return negative_df, stats
+
+
+def add_chunked_arguments(parser):
+    """Add --chunked/--chunk-size flags for the out-of-core streaming loader."""
+    parser.add_argument(
+        "--chunked",
+        action="store_true",
+        help="CSV를 청크 단위로 스트리밍하며 부정 리뷰만 메모리에 유지 (대용량 파일용)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="청크당 행 수 (기본값: config.LOADER_CHUNK_ROWS)",
+    )
+
+
+def add_offline_argument(parser):
+    """Add --offline flag that only uses the verified local dataset copy."""
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="네트워크 없이 검증된 로컬 데이터셋 사본만 사용 (없으면 오류)",
+    )
+
+
+def apply_offline_argument(args):
+    """Enable dataset offline mode if --offline was given."""
+    if args.offline:
+        config.DATASET_OFFLINE = True
+
+
+def add_no_cache_argument(parser):
+    """Add --no-cache flag that makes LLM calls bypass the response cache and label store."""
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM 응답 캐시와 리뷰 라벨 저장소를 무시하고 항상 새로 호출",
+    )
+
+
+def apply_no_cache_argument(args):
+    """Disable the LLM response cache and review label store if --no-cache was given."""
+    if args.no_cache:
+        config.LLM_CACHE_ENABLED = False
+        config.LABEL_STORE_ENABLED = False
+
+
+def add_batch_argument(parser):
+    """Add --batch flag that submits LLM requests through the Batch API."""
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="요청을 JSONL로 묶어 Batch API로 제출 (결과가 나올 때까지 폴링, 비용 절감)",
+    )
+
+
+def print_llm_cache_stats():
+    """Print LLM response cache hit/miss counts for this run."""
+    stats = cache_stats()
+    if stats is None:
+        return
+    print(
+        f"LLM 캐시: hit {stats['hits']}회 / miss {stats['misses']}회 "
+        f"(저장 {stats['entries']}건, {stats['bytes'] / 1024:.1f} KB)"
+    )
+
+
+def print_analysis_complete(df, negative_df, extra_info="", total_reviews=None):
+    """Print analysis complete summary (pass total_reviews instead of df when streamed)."""
     print_section("Analysis Complete")
     extra_line = f"\n{extra_info}" if extra_info else ""
+    total_reviews = len(df) if total_reviews is None else total_reviews
     print(
         f"""
 [OK] 분석 완료
 
-총 리뷰 수: {len(df):,}
+총 리뷰 수: {total_reviews:,}
 부정 리뷰 수: {len(negative_df):,}{extra_line}
 
 이 분석 결과를 바탕으로 즉시 개선 작업을 시작할 수 있습니다.
     """
     )
+    print_llm_cache_stats()
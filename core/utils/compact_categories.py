@@ -0,0 +1,56 @@
+"""
+분류 결과 압축 출력 형식 (opt-in: config.LLM_COMPACT_OUTPUT)
+
+리뷰마다 {"review_number": 1, "category": "delivery_delay", "brief_issue": "..."}를
+반복하는 대신 {"c": [[1, 0, "..."], [2, 2]]}처럼 [리뷰 번호, 카테고리 코드(, brief_issue)]
+배열로 받아 출력 토큰을 줄인다. 코드는 review_categories.CATEGORY_KEYS의 인덱스다.
+여기서 기존 {'categories': [...]} 형태로 되돌리므로 호출하는 쪽은 바뀌지 않는다.
+"""
+
+import logging
+
+from core.utils.review_categories import CATEGORY_KEYS
+
+logger = logging.getLogger(__name__)
+
+COMPACT_KEY = "c"
+UNKNOWN_CATEGORY = "other"
+
+
+def decode_category_item(row):
+    """[번호, 코드(, brief_issue)] 하나를 기존 dict 형태로. 형식이 틀리면 None"""
+    if isinstance(row, dict):
+        return row
+    if not isinstance(row, list) or len(row) < 2:
+        logger.warning("Ignoring malformed compact categorization row: %s", row)
+        return None
+
+    number, code = row[0], row[1]
+    if isinstance(code, int) and 0 <= code < len(CATEGORY_KEYS):
+        category = CATEGORY_KEYS[code]
+    elif isinstance(code, str) and code in CATEGORY_KEYS:
+        category = code
+    else:
+        logger.warning("Unknown compact category code %r, using %s", code, UNKNOWN_CATEGORY)
+        category = UNKNOWN_CATEGORY
+    return {
+        "review_number": number,
+        "category": category,
+        "brief_issue": str(row[2]) if len(row) > 2 and row[2] is not None else "",
+    }
+
+
+def decode_categories(parsed):
+    """
+    압축 응답을 {'categories': [...]}로 확장
+
+    모델이 기존 형식({'categories': [...]})으로 답했으면 그대로 돌려준다.
+    """
+    if COMPACT_KEY not in parsed:
+        return parsed
+    categories = []
+    for row in parsed.get(COMPACT_KEY) or []:
+        item = decode_category_item(row)
+        if item is not None:
+            categories.append(item)
+    return {"categories": categories}
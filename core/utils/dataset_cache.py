@@ -0,0 +1,152 @@
+"""
+가공된 데이터셋 DataFrame 디스크 캐시 (Feather, pyarrow가 없으면 pickle)
+
+Olist 원본 CSV 두 개를 읽어 order_id로 병합하고 시각 파싱/정렬하는 작업을 매번
+반복하지 않도록 결과 DataFrame을 저장해 두고 다음 실행에서 바로 읽는다.
+Feather(비압축)는 메모리 맵으로 읽으므로 CSV 파싱보다 훨씬 빠르다.
+
+원본 파일별 (크기, mtime, SHA-256)을 메타데이터(JSON)로 함께 저장한다.
+- 크기와 mtime이 모두 같으면 해시 계산 없이 캐시 사용
+- mtime만 바뀌었으면(복사/재다운로드) 해시를 다시 계산해 내용이 같을 때만 사용
+- 그 밖에 원본이 바뀌었거나 가공 버전(version)이 다르면 새로 만들어 덮어쓴다
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+import pandas as pd
+
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = None
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_digest(path):
+    """파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_stat(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _source_fingerprints(sources):
+    return {
+        os.path.basename(path): {**_source_stat(path), "sha256": file_digest(path)}
+        for path in sources
+    }
+
+
+def _format():
+    return "feather" if feather is not None else "pickle"
+
+
+def _check_fresh(meta, sources, version):
+    """
+    메타데이터가 현재 원본과 맞는지 확인
+
+    Returns:
+        (최신 여부, mtime만 바뀌어 메타데이터를 갱신했는지)
+    """
+    if meta.get("version") != version or meta.get("format") != _format():
+        return False, False
+    recorded = meta.get("sources", {})
+    if set(recorded) != {os.path.basename(path) for path in sources}:
+        return False, False
+
+    touched = False
+    for path in sources:
+        entry = recorded[os.path.basename(path)]
+        stat = _source_stat(path)
+        if stat["size"] != entry["size"]:
+            return False, False
+        if stat["mtime_ns"] != entry["mtime_ns"]:
+            if file_digest(path) != entry["sha256"]:
+                return False, False
+            entry["mtime_ns"] = stat["mtime_ns"]
+            touched = True
+    return True, touched
+
+
+def _read_frame(path):
+    if feather is not None:
+        return feather.read_table(path, memory_map=True).to_pandas()
+    return pd.read_pickle(path)
+
+
+def _write_frame(df, path):
+    tmp_path = f"{path}.tmp"
+    if feather is not None:
+        # 메모리 맵으로 바로 읽을 수 있도록 비압축
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _write_meta(meta, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_cached_frame(cache_dir, name, sources, build, version=1):
+    """
+    원본 파일에서 만든 DataFrame을 캐시에서 읽거나 새로 만들어 저장
+
+    Args:
+        cache_dir: 캐시 디렉토리
+        name: 캐시 이름 (파일명 접두어)
+        sources: 원본 파일 경로 목록
+        build: 캐시가 없거나 낡았을 때 DataFrame을 만드는 함수 (인자 없음)
+        version: 가공 방식이 바뀌면 올려서 기존 캐시를 무효화
+
+    Returns:
+        (DataFrame, 캐시 사용 여부)
+    """
+    data_path = os.path.join(cache_dir, f"{name}.{_format()}")
+    meta_path = os.path.join(cache_dir, f"{name}.json")
+
+    if os.path.exists(data_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            fresh, touched = _check_fresh(meta, sources, version)
+            if fresh:
+                df = _read_frame(data_path)
+                if touched:
+                    _write_meta(meta, meta_path)
+                return df, True
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError) as e:
+            logger.warning("dataset cache %s unreadable, rebuilding: %s", name, e)
+
+    # 빌드 중에 원본이 바뀌어도 다음 실행에서 감지되도록 빌드 전에 지문을 뜸
+    fingerprints = _source_fingerprints(sources)
+    df = build()
+    os.makedirs(cache_dir, exist_ok=True)
+    try:
+        # 데이터를 쓰는 도중 중단돼도 이전 메타데이터가 새 데이터를 가리키지 않도록 먼저 삭제
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        _write_frame(df, data_path)
+        _write_meta(
+            {"version": version, "format": _format(), "sources": fingerprints},
+            meta_path,
+        )
+    except OSError as e:
+        logger.warning("failed to write dataset cache %s: %s", name, e)
+    return df, False
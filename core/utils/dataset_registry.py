@@ -0,0 +1,170 @@
+"""
+로컬 데이터셋 레지스트리 (체크섬 manifest로 검증된 사본)
+
+kagglehub로 받은 데이터셋을 config.DATA_PATH/datasets 아래에 복사하고 파일별
+(크기, mtime, SHA-256) manifest를 함께 저장한다. 검증된 사본이 있으면 네트워크 없이
+바로 그 경로를 쓰고, 오프라인 모드(config.DATASET_OFFLINE)에서는 다운로드를 아예
+시도하지 않는다.
+
+- 크기와 mtime이 manifest와 같으면 해시 계산 없이 통과 (빠른 경로)
+- mtime만 바뀐 파일은 SHA-256을 다시 계산해 내용이 같을 때만 통과
+
+인터넷이 없는 배치 노드에서는 데이터셋 디렉토리를 옮겨 온 뒤 등록한다:
+    python -m core.utils.dataset_registry register olistbr/brazilian-ecommerce <디렉토리>
+    python -m core.utils.dataset_registry verify olistbr/brazilian-ecommerce
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+
+from core import config
+from core.utils.dataset_cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+FILES_DIR = "files"
+
+
+def _handle_dirname(handle):
+    return handle.replace("/", "__")
+
+
+class DatasetRegistry:
+    """handle(예: olistbr/brazilian-ecommerce)별 검증된 로컬 사본 저장소"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def _entry_dir(self, handle):
+        return os.path.join(self.root, _handle_dirname(handle))
+
+    def files_path(self, handle):
+        """등록된 파일이 있는 디렉토리 (검증 여부와 무관)"""
+        return os.path.join(self._entry_dir(handle), FILES_DIR)
+
+    def _manifest_path(self, handle):
+        return os.path.join(self._entry_dir(handle), MANIFEST_FILE)
+
+    def _read_manifest(self, handle):
+        try:
+            with open(self._manifest_path(handle), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, handle, manifest):
+        path = self._manifest_path(handle)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def register(self, handle, source_dir):
+        """
+        source_dir의 파일을 레지스트리로 복사하고 manifest 작성
+
+        Returns:
+            등록된 파일 디렉토리
+        """
+        entry_dir = self._entry_dir(handle)
+        staging_dir = f"{entry_dir}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        shutil.copytree(source_dir, os.path.join(staging_dir, FILES_DIR))
+
+        files_dir = os.path.join(staging_dir, FILES_DIR)
+        files = {}
+        for directory, _, names in os.walk(files_dir):
+            for name in names:
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                files[os.path.relpath(path, files_dir)] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": file_digest(path),
+                }
+
+        # 새 사본을 먼저 완성한 뒤 기존 사본과 교체
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(staging_dir, entry_dir)
+        self._write_manifest(handle, {
+            "handle": handle,
+            "source": os.path.abspath(source_dir),
+            "registered_at": time.time(),
+            "files": files,
+        })
+        logger.info("registered dataset %s (%d files)", handle, len(files))
+        return self.files_path(handle)
+
+    def verify(self, handle, deep=False):
+        """
+        등록된 사본이 manifest와 일치하는지 확인
+
+        Args:
+            deep: True면 mtime이 같아도 모든 파일의 SHA-256을 다시 계산
+        """
+        manifest = self._read_manifest(handle)
+        if not manifest or not manifest.get("files"):
+            return False
+
+        files_dir = self.files_path(handle)
+        touched = False
+        for relpath, entry in manifest["files"].items():
+            path = os.path.join(files_dir, relpath)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                logger.warning("dataset %s: missing file %s", handle, relpath)
+                return False
+            if stat.st_size != entry["size"]:
+                logger.warning("dataset %s: size mismatch for %s", handle, relpath)
+                return False
+            if deep or stat.st_mtime_ns != entry["mtime_ns"]:
+                if file_digest(path) != entry["sha256"]:
+                    logger.warning("dataset %s: checksum mismatch for %s", handle, relpath)
+                    return False
+                if stat.st_mtime_ns != entry["mtime_ns"]:
+                    entry["mtime_ns"] = stat.st_mtime_ns
+                    touched = True
+        if touched:
+            self._write_manifest(handle, manifest)
+        return True
+
+    def verified_path(self, handle):
+        """검증된 사본의 파일 디렉토리. 없거나 손상됐으면 None"""
+        return self.files_path(handle) if self.verify(handle) else None
+
+
+def get_dataset_registry(data_path=None):
+    """data_path(기본값: config.DATA_PATH)/datasets 레지스트리"""
+    return DatasetRegistry(os.path.join(data_path or config.DATA_PATH, "datasets"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 데이터셋 레지스트리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    register_parser = subparsers.add_parser("register", help="디렉토리를 검증된 사본으로 등록")
+    register_parser.add_argument("handle", help="예: olistbr/brazilian-ecommerce")
+    register_parser.add_argument("source_dir", help="데이터셋 파일이 있는 디렉토리")
+    verify_parser = subparsers.add_parser("verify", help="등록된 사본의 체크섬 검증")
+    verify_parser.add_argument("handle", help="예: olistbr/brazilian-ecommerce")
+    args = parser.parse_args()
+
+    registry = get_dataset_registry()
+    if args.command == "register":
+        print(f"Registered {args.handle} at {registry.register(args.handle, args.source_dir)}")
+        return
+    if registry.verify(args.handle, deep=True):
+        print(f"[OK] {args.handle}: {registry.files_path(args.handle)}")
+        return
+    print(f"[Error] {args.handle}: no verified local copy")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+근접 중복 리뷰 묶기 (정규화 해시 + MinHash/LSH)
+
+"배송이 너무 늦어요", "배송이 너무 늦어요!!", "배송이 너무 늦어요 ㅠㅠ"처럼
+표기만 조금 다른 리뷰를 하나의 클러스터로 묶어 대표 리뷰만 LLM에 보내고,
+결과는 클러스터의 모든 멤버에게 그대로 펼친다.
+
+1. 문장부호/공백/자모 이모티콘/반복 문자를 없앤 키가 같으면 같은 클러스터
+2. 키가 다르면 문자 n-gram MinHash를 LSH 밴드로 나눠 후보 쌍을 찾고,
+   실제 Jaccard 유사도가 config.DEDUP_JACCARD_THRESHOLD 이상이면 합친다
+   (키가 config.DEDUP_MIN_FUZZY_CHARS보다 짧으면 n-gram이 적어 1단계만 적용)
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+from core import config
+
+SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_HASH_SEED = 1
+
+# 한글 자모(ㅋㅋ, ㅠㅠ — NFKC 후에는 조합형 자모)와 문자/숫자가 아닌 모든 것
+_NOISE_RE = re.compile(r"[\u1100-\u11ff\u3131-\u318e]|[^\w]|_")
+_REPEAT_RE = re.compile(r"(.)\1{2,}")
+
+
+def dedup_key(text):
+    """근접 중복 비교용 정규화 키"""
+    normalized = unicodedata.normalize("NFKC", str(text)).lower()
+    normalized = _NOISE_RE.sub("", normalized)
+    return _REPEAT_RE.sub(r"\1\1", normalized)
+
+
+def _shingles(key):
+    if len(key) <= SHINGLE_SIZE:
+        return {key}
+    return {key[i:i + SHINGLE_SIZE] for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+def _shingle_hashes(shingles):
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class _MinHasher:
+    def __init__(self, permutations):
+        rng = np.random.default_rng(_HASH_SEED)
+        # (a*x + b) mod p를 2^61-1 아래에서 계산 (a, x < 2^32라 uint64 오버플로 없음)
+        self.a = rng.integers(1, 1 << 32, size=permutations, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 32, size=permutations, dtype=np.uint64)
+
+    def signature(self, hashes):
+        values = (np.outer(self.a, hashes) + self.b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return values.min(axis=1)
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # 먼저 나온 리뷰가 대표가 되도록 작은 번호를 루트로
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def _jaccard(left, right):
+    return len(left & right) / len(left | right)
+
+
+def cluster_near_duplicates(texts, threshold=None):
+    """
+    근접 중복 클러스터 계산
+
+    Args:
+        texts: 리뷰 텍스트 목록
+        threshold: 같은 클러스터로 볼 최소 Jaccard 유사도 (기본값: config.DEDUP_JACCARD_THRESHOLD)
+
+    Returns:
+        리뷰별 대표 리뷰 인덱스 목록 (대표는 클러스터에서 가장 먼저 나온 리뷰)
+    """
+    threshold = config.DEDUP_JACCARD_THRESHOLD if threshold is None else threshold
+    keys = [dedup_key(text) for text in texts]
+
+    first_by_key = {}
+    for i, key in enumerate(keys):
+        first_by_key.setdefault(key, i)
+    union = _UnionFind(len(texts))
+    for i, key in enumerate(keys):
+        union.union(i, first_by_key[key])
+
+    unique = [
+        i for i in first_by_key.values() if len(keys[i]) >= config.DEDUP_MIN_FUZZY_CHARS
+    ]
+    if len(unique) > 1:
+        _merge_similar(unique, keys, union, threshold)
+    return [union.find(i) for i in range(len(texts))]
+
+
+def _merge_similar(unique, keys, union, threshold):
+    shingles = {i: _shingles(keys[i]) for i in unique}
+    checked = set()
+    for members in _lsh_buckets(unique, shingles):
+        _union_similar(members, shingles, union, threshold, checked)
+
+
+def _lsh_buckets(unique, shingles):
+    """MinHash 시그니처를 밴드로 나눠, 같은 밴드 값을 가진 후보 리뷰 묶음 목록"""
+    bands = config.DEDUP_LSH_BANDS
+    rows = config.DEDUP_MINHASH_PERMUTATIONS // bands
+    hasher = _MinHasher(bands * rows)
+
+    buckets = defaultdict(list)
+    for i in unique:
+        signature = hasher.signature(_shingle_hashes(shingles[i]))
+        for band in range(bands):
+            buckets[(band, signature[band * rows:(band + 1) * rows].tobytes())].append(i)
+    return [members for members in buckets.values() if len(members) > 1]
+
+
+def _union_similar(members, shingles, union, threshold, checked):
+    """후보 묶음 안에서 Jaccard 유사도가 threshold 이상인 쌍을 합침 (checked: 이미 비교한 쌍)"""
+    for pos, i in enumerate(members):
+        for j in members[pos + 1:]:
+            if (i, j) in checked:
+                continue
+            checked.add((i, j))
+            if _jaccard(shingles[i], shingles[j]) >= threshold:
+                union.union(i, j)
+
+
+def group_duplicates(texts, threshold=None):
+    """
+    대표 리뷰 인덱스와 클러스터 멤버 목록
+
+    Returns:
+        (대표 인덱스 목록, 대표별 멤버 인덱스 목록) — 두 목록은 같은 순서
+    """
+    members = defaultdict(list)
+    for i, representative in enumerate(cluster_near_duplicates(texts, threshold)):
+        members[representative].append(i)
+    representatives = sorted(members)
+    return representatives, [members[r] for r in representatives]
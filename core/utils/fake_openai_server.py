@@ -0,0 +1,550 @@
+"""
+로컬 OpenAI 호환 스탠드인 서버
+
+실제 API 없이 파이프라인을 돌리기 위한 최소 구현 (표준 라이브러리만 사용).
+chat.completions(stream 포함), files, batches 엔드포인트를 지원하며, 응답 content는 responder가 만든다.
+
+- synthetic_responder: 프롬프트 형식을 보고 유효한 categories/replies 등 JSON을 합성
+- ReplayResponder: LLM_RECORD_PATH로 기록한 실제 응답을 재생
+- latency / error_rate: 지연 분포와 오류(429/5xx) 비율을 주입해 부하 테스트에 사용
+
+사용 예:
+    with FakeOpenAIServer(responder=lambda body: '{"category": "other"}') as server:
+        client = OpenAI(base_url=server.base_url, api_key="test")
+
+독립 실행 (백엔드 부하 테스트, 오프라인 CI):
+    python -m core.utils.fake_openai_server --port 8001 --latency-median 0.8 --error-rate 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=test uvicorn backend.main:app
+"""
+
+import argparse
+import email.parser
+import email.policy
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from core.utils.llm_cache import request_key
+from core.utils.llm_recording import load_recordings
+from core.utils.review_categories import CATEGORY_KEYS
+from core.utils.token_budget import count_tokens
+
+SYNTHETIC_CATEGORIES = (
+    "delivery_delay", "wrong_item", "poor_quality", "damaged_packaging",
+    "size_issue", "missing_parts", "not_as_described", "customer_service",
+    "price_issue", "other",
+)
+
+DEFAULT_ERROR_STATUSES = (429, 500, 503)
+STREAM_CHUNK_CHARS = 16
+
+_REVIEW_COUNT_RE = re.compile(r"(?:아래는?|Below are)\s*(\d+)")
+
+
+def empty_json_responder(_body):
+    return "{}"
+
+
+def _pick(seed_text, options):
+    digest = hashlib.sha256(seed_text.encode("utf-8")).digest()
+    return options[digest[0] % len(options)]
+
+
+def _review_count(prompt):
+    match = _REVIEW_COUNT_RE.search(prompt)
+    return int(match.group(1)) if match else 1
+
+
+def _synthetic_reply(index=None):
+    reply = {
+        "reply": "말씀해 주신 문제를 확인했습니다. 교환 또는 환불을 바로 도와드리겠습니다.",
+        "tone": "공감+사과+교환안내",
+        "key_points_addressed": ["상품 문제"],
+        "suggested_action": "1:1 문의 유도",
+    }
+    if index is not None:
+        reply = {"review_index": index, **reply}
+    return reply
+
+
+def synthetic_responder(body):
+    """
+    요청 프롬프트의 출력 형식에 맞는 결정적(deterministic) JSON content 합성
+
+    리뷰 일괄 분류(categories, 압축 형식 c), 단건 분류(category), 답변(reply/replies),
+    개선안(recommendations)을 지원하며 그 외 요청에는 "{}"를 돌려준다.
+    """
+    prompt = body["messages"][-1].get("content") or ""
+    if '"replies"' in prompt:
+        payload = {
+            "replies": [_synthetic_reply(i) for i in range(1, _review_count(prompt) + 1)]
+        }
+    elif '"reply"' in prompt:
+        payload = _synthetic_reply()
+    elif '"recommendations"' in prompt:
+        payload = {"recommendations": [
+            {
+                "title": f"개선안 {i}",
+                "problem": "상위 불만 카테고리 대응",
+                "action": "담당 부서가 주간 단위로 원인을 점검",
+                "expected_impact": "관련 부정 리뷰 감소",
+            }
+            for i in range(1, 4)
+        ]}
+    elif '{"c":[[' in prompt:
+        # 표준 형식과 같은 카테고리를 고르고, 요청대로 공백 없이 직렬화
+        rows = [
+            [i, CATEGORY_KEYS.index(_pick(f"{prompt}:{i}", SYNTHETIC_CATEGORIES))]
+            + ([f"리뷰 {i} 요약"] if '"brief_issue"]' in prompt else [])
+            for i in range(1, _review_count(prompt) + 1)
+        ]
+        return json.dumps({"c": rows}, ensure_ascii=False, separators=(",", ":"))
+    elif '"categories"' in prompt:
+        payload = {"categories": [
+            {
+                "review_number": i,
+                "category": _pick(f"{prompt}:{i}", SYNTHETIC_CATEGORIES),
+                "brief_issue": f"리뷰 {i} 요약",
+            }
+            for i in range(1, _review_count(prompt) + 1)
+        ]}
+    elif '"category"' in prompt:
+        payload = {
+            "category": _pick(prompt, SYNTHETIC_CATEGORIES),
+            "confidence": 0.9,
+            "reasoning": "synthetic",
+        }
+    else:
+        payload = {}
+    return json.dumps(payload, ensure_ascii=False)
+
+
+class ReplayResponder:
+    """LLM_RECORD_PATH로 기록한 응답을 요청 키(llm_cache.request_key)로 재생"""
+
+    def __init__(self, path, fallback=None):
+        """
+        Args:
+            path: record 모드로 만든 JSONL 파일
+            fallback: 기록에 없는 요청을 처리할 responder (None이면 500 오류)
+        """
+        self.recordings = load_recordings(path)
+        self.fallback = fallback
+
+    def __call__(self, body):
+        content = self.recordings.get(request_key(body))
+        if content is not None:
+            return content
+        if self.fallback is None:
+            raise KeyError("No recorded response for this request")
+        return self.fallback(body)
+
+
+def lognormal_latency(median, sigma=0.5):
+    """중앙값 median초, 꼬리 두께 sigma인 로그정규 지연 분포 (rng -> 초)"""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def fixed_latency(seconds):
+    return lambda _rng: seconds
+
+
+def _estimate_tokens(text):
+    return max(1, count_tokens(text))
+
+
+class _State:  # pylint: disable=too-many-instance-attributes
+    def __init__(  # pylint: disable=too-many-arguments
+        self, responder, *, latency, error_rate, error_statuses, seed, token_latency=0.0
+    ):
+        self.responder = responder
+        self.latency = latency
+        self.token_latency = token_latency
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.files = {}
+        self.batches = {}
+        self.requests = []
+
+    def draw_fault(self):
+        """이번 요청에 적용할 (지연 초, 오류 상태 코드 또는 None)"""
+        with self.lock:
+            delay = self.latency(self.rng) if self.latency else 0.0
+            status = None
+            if self.error_rate and self.rng.random() < self.error_rate:
+                status = self.rng.choice(self.error_statuses)
+        return delay, status
+
+    def chat_completion(self, body):
+        """요청 body → chat.completion 응답 dict"""
+        with self.lock:
+            self.requests.append(body)
+        content = self.responder(body)
+        prompt_tokens = sum(_estimate_tokens(m.get("content") or "") for m in body["messages"])
+        completion_tokens = _estimate_tokens(content)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": 0},
+            },
+        }
+
+    def add_file(self, filename, purpose, data):
+        file_id = f"file-{uuid.uuid4().hex}"
+        with self.lock:
+            self.files[file_id] = {
+                "id": file_id,
+                "object": "file",
+                "bytes": len(data),
+                "created_at": int(time.time()),
+                "filename": filename,
+                "purpose": purpose,
+                "status": "processed",
+                "data": data,
+            }
+        return self.files[file_id]
+
+    def run_batch(self, batch_id):
+        """입력 파일의 요청을 순서대로 처리해 output/error 파일을 만든다"""
+        batch = self.batches[batch_id]
+        with self.lock:
+            batch["status"] = "in_progress"
+        lines = self.files[batch["input_file_id"]]["data"].decode("utf-8").splitlines()
+        outputs, errors = [], []
+        for line in filter(None, lines):
+            item = json.loads(line)
+            result = {"id": f"batch_req_{uuid.uuid4().hex}", "custom_id": item["custom_id"]}
+            try:
+                body = self.chat_completion(item["body"])
+                result["response"] = {"status_code": 200, "request_id": body["id"], "body": body}
+                result["error"] = None
+                outputs.append(result)
+            except Exception as exc:  # pylint: disable=broad-except
+                # Report a per-request failure the way the Batch API does.
+                result["response"] = {
+                    "status_code": 500,
+                    "body": {"error": {"message": str(exc), "type": "server_error"}},
+                }
+                result["error"] = None
+                errors.append(result)
+
+        updates = {
+            "request_counts": {
+                "total": len(outputs) + len(errors),
+                "completed": len(outputs),
+                "failed": len(errors),
+            },
+            "completed_at": int(time.time()),
+            "status": "completed",
+        }
+        for key, rows in (("output_file_id", outputs), ("error_file_id", errors)):
+            if rows:
+                data = "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+                updates[key] = self.add_file(f"{batch_id}_{key}.jsonl", "batch_output", data)["id"]
+        with self.lock:
+            batch.update(updates)
+
+    def get_batch(self, batch_id):
+        with self.lock:
+            return dict(self.batches[batch_id])
+
+
+def _parse_multipart(content_type, data):
+    message = email.parser.BytesParser(policy=email.policy.default).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + data
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        fields[name] = (part.get_filename(), part.get_payload(decode=True))
+    return fields
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeOpenAI/1.0"
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _send_json(self, payload, status=200):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_not_found(self):
+        self._send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _send_injected_error(self, status):
+        error_type = "rate_limit_exceeded" if status == 429 else "server_error"
+        data = json.dumps(
+            {"error": {"message": f"Injected {status} error", "type": error_type}}
+        ).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _chat_completions(self, body):
+        delay, status = self.state.draw_fault()
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            self._send_injected_error(status)
+            return
+        payload = json.loads(body)
+        try:
+            completion = self.state.chat_completion(payload)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Surface responder failures as a 5xx like the real API would.
+            self._send_json(
+                {"error": {"message": str(exc), "type": "server_error"}}, status=500
+            )
+            return
+        if payload.get("stream"):
+            include_usage = (payload.get("stream_options") or {}).get("include_usage")
+            self._send_stream(completion, include_usage)
+        else:
+            if self.state.token_latency:
+                time.sleep(completion["usage"]["completion_tokens"] * self.state.token_latency)
+            self._send_json(completion)
+
+    def _send_stream(self, completion, include_usage):
+        """completion을 STREAM_CHUNK_CHARS 글자씩 chat.completion.chunk SSE로 전송"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+
+        base = {
+            "id": completion["id"],
+            "object": "chat.completion.chunk",
+            "created": completion["created"],
+            "model": completion["model"],
+        }
+        content = completion["choices"][0]["message"]["content"]
+        pieces = [
+            content[i:i + STREAM_CHUNK_CHARS]
+            for i in range(0, len(content), STREAM_CHUNK_CHARS)
+        ]
+        chunks = [
+            {**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+            for piece in pieces
+        ]
+        chunks.append({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if include_usage:
+            chunks.append({**base, "choices": [], "usage": completion["usage"]})
+        for chunk in chunks:
+            if self.state.token_latency and chunk["choices"]:
+                piece = chunk["choices"][0]["delta"].get("content") or ""
+                time.sleep(_estimate_tokens(piece) * self.state.token_latency if piece else 0)
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        body = self._read_body()
+        if self.path.endswith("/chat/completions"):
+            self._chat_completions(body)
+        elif self.path.endswith("/files"):
+            fields = _parse_multipart(self.headers["Content-Type"], body)
+            filename, data = fields["file"]
+            purpose = fields["purpose"][1].decode("utf-8")
+            file_obj = self.state.add_file(filename, purpose, data)
+            self._send_json({k: v for k, v in file_obj.items() if k != "data"})
+        elif self.path.endswith("/batches"):
+            payload = json.loads(body)
+            batch_id = f"batch_{uuid.uuid4().hex}"
+            batch = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": payload["endpoint"],
+                "input_file_id": payload["input_file_id"],
+                "completion_window": payload["completion_window"],
+                "metadata": payload.get("metadata"),
+                "status": "validating",
+                "created_at": int(time.time()),
+                "output_file_id": None,
+                "error_file_id": None,
+            }
+            with self.state.lock:
+                self.state.batches[batch_id] = batch
+            self._send_json(batch)
+            threading.Thread(target=self.state.run_batch, args=(batch_id,), daemon=True).start()
+        else:
+            self._send_not_found()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        parts = self.path.rstrip("/").split("/")
+        if len(parts) >= 3 and parts[-2] == "batches" and parts[-1] in self.state.batches:
+            self._send_json(self.state.get_batch(parts[-1]))
+        elif parts[-1] == "content" and parts[-2] in self.state.files:
+            data = self.state.files[parts[-2]]["data"]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_not_found()
+
+
+class FakeOpenAIServer:
+    """백그라운드 스레드에서 도는 OpenAI 호환 HTTP 서버"""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        responder=None,
+        host="127.0.0.1",
+        port=0,
+        *,
+        latency=None,
+        error_rate=0.0,
+        error_statuses=DEFAULT_ERROR_STATUSES,
+        seed=None,
+        token_latency=0.0,
+    ):
+        """
+        Args:
+            responder: 요청 body(dict)를 받아 응답 content 문자열을 돌려주는 함수
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 할당)
+            latency: random.Random을 받아 chat completion 지연 초를 돌려주는 함수
+                (예: lognormal_latency(0.8))
+            error_rate: chat completion 요청 중 오류로 응답할 비율 (0~1)
+            error_statuses: 주입할 오류 상태 코드 후보
+            seed: 지연/오류 주입 난수 시드
+            token_latency: 출력 토큰당 디코딩 지연 초 (출력 길이에 비례하는 지연 모사)
+        """
+        self.state = _State(
+            responder or empty_json_responder,
+            latency=latency,
+            error_rate=error_rate,
+            error_statuses=error_statuses,
+            seed=seed,
+            token_latency=token_latency,
+        )
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def requests(self):
+        """지금까지 받은 chat completion 요청 body 목록"""
+        return list(self.state.requests)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (CLI용, stop() 또는 Ctrl-C로 종료)"""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 호환 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="LLM_RECORD_PATH로 기록한 JSONL 재생 (기록에 없는 요청은 합성 응답)",
+    )
+    parser.add_argument(
+        "--latency-median", type=float, default=0.0, help="응답 지연 중앙값(초), 0이면 지연 없음"
+    )
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.5, help="로그정규 지연 분포의 sigma"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="429/500/503으로 응답할 요청 비율"
+    )
+    parser.add_argument(
+        "--token-latency", type=float, default=0.0, help="출력 토큰당 디코딩 지연(초)"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    responder = synthetic_responder
+    if args.replay:
+        responder = ReplayResponder(args.replay, fallback=synthetic_responder)
+    latency = (
+        lognormal_latency(args.latency_median, args.latency_sigma)
+        if args.latency_median > 0
+        else None
+    )
+    server = FakeOpenAIServer(
+        responder,
+        args.host,
+        args.port,
+        latency=latency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        token_latency=args.token_latency,
+    )
+    print(f"Fake OpenAI server listening on {server.base_url}")
+    print(f"  OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=test")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
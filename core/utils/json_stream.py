@@ -0,0 +1,103 @@
+"""Incremental JSON parsing for streamed model responses."""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _ScanState:
+    """Lexical position of the scanner: offset, nesting depth and string state."""
+
+    def __init__(self):
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+
+
+class JSONArrayItemStream:
+    """Yield elements of a top-level array (e.g. "categories") as soon as each one is complete.
+
+    Text is fed in arbitrary chunks from the token stream; object or array
+    elements of ``{"<key>": [{...}, [...]]}`` are emitted (scalars are not).
+    Anything before the root object (such as a code fence) is ignored. A root
+    object that closes without the array raises ValueError, like the
+    non-streaming parse does.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self._data = ""
+        self._scan = _ScanState()
+        self._last_key = None
+        self._array_depth = None
+        self._array_seen = False
+        self._item_start = None
+
+    def feed(self, text):
+        """Consume a chunk of text and return the array items completed by it.
+
+        Raises:
+            ValueError: if the root object closes without ever containing the array
+        """
+        self._data += text
+        items = []
+        for char in text:
+            item = self._step(char)
+            if item is not None:
+                items.append(item)
+            self._scan.pos += 1
+        return items
+
+    def close(self):
+        """Check the end of the stream; raises ValueError if the array never appeared."""
+        if not self._array_seen:
+            raise ValueError(f"Streamed response has no top-level {self.key!r} array")
+
+    def _step(self, char):  # pylint: disable=too-many-branches
+        scan = self._scan
+        if scan.in_string:
+            if scan.escape:
+                scan.escape = False
+            elif char == "\\":
+                scan.escape = True
+            elif char == '"':
+                scan.in_string = False
+                if scan.string_start is not None:
+                    self._last_key = json.loads(self._data[scan.string_start:scan.pos + 1])
+                    scan.string_start = None
+            return None
+
+        if char == '"':
+            scan.in_string = True
+            if scan.depth == 1:
+                scan.string_start = scan.pos
+        elif char in "{[":
+            if char == "[" and scan.depth == 1 and self._last_key == self.key:
+                self._array_depth = scan.depth + 1
+                self._array_seen = True
+            elif scan.depth == self._array_depth:
+                self._item_start = scan.pos
+            scan.depth += 1
+        elif char in "}]":
+            scan.depth -= 1
+            if scan.depth == 0:
+                self.close()
+            elif char == "]" and scan.depth == 1:
+                self._array_depth = None
+            elif self._item_start is not None and scan.depth == self._array_depth:
+                return self._parse_item()
+        elif char == "," and scan.depth == 1:
+            self._last_key = None
+        return None
+
+    def _parse_item(self):
+        raw = self._data[self._item_start:self._scan.pos + 1]
+        self._item_start = None
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Skipping malformed streamed %s item", self.key)
+            return None
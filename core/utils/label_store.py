@@ -0,0 +1,148 @@
+"""
+리뷰 단위 분류 결과 저장소 (SQLite)
+
+정규화한 리뷰 텍스트의 해시를 키로 category/brief_issue를 저장하여
+이미 분류한 리뷰는 다시 LLM에 보내지 않도록 한다.
+"""
+
+import hashlib
+import threading
+import time
+import unicodedata
+
+from core import config
+from core.utils import sqlite_utils
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_labels (
+    text_hash TEXT NOT NULL,
+    labeler TEXT NOT NULL,
+    category TEXT NOT NULL,
+    brief_issue TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (text_hash, labeler)
+);
+CREATE TABLE IF NOT EXISTS review_texts (
+    text_hash TEXT PRIMARY KEY,
+    review_text TEXT NOT NULL
+);
+"""
+
+# SQLite 바인딩 변수 제한 내에서 IN 조회를 나눠서 수행
+_QUERY_CHUNK = 500
+
+_shared = {"store": None}
+_shared_lock = threading.Lock()
+
+
+def normalize_review_text(text):
+    """공백/대소문자/유니코드 표기 차이를 없앤 비교용 텍스트"""
+    normalized = unicodedata.normalize("NFKC", str(text))
+    return " ".join(normalized.split()).lower()
+
+
+def review_hash(text):
+    return hashlib.sha256(normalize_review_text(text).encode("utf-8")).hexdigest()
+
+
+class ReviewLabelStore:
+    """(text_hash, labeler) → {category, brief_issue} 저장소"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite_utils.connect(path, _SCHEMA)
+
+    def get_many(self, hashes, labeler):
+        """저장된 라벨을 {text_hash: {"category", "brief_issue"}}로 반환"""
+        unique = list(dict.fromkeys(hashes))
+        found = {}
+        with self._lock:
+            for start in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, category, brief_issue FROM review_labels "
+                    f"WHERE labeler = ? AND text_hash IN ({placeholders})",
+                    (labeler, *chunk),
+                )
+                for text_hash, category, brief_issue in rows:
+                    found[text_hash] = {"category": category, "brief_issue": brief_issue}
+        return found
+
+    def count_labeled(self, hashes, labeler):
+        """hashes 중 라벨이 저장된 서로 다른 해시 수"""
+        unique = list(dict.fromkeys(hashes))
+        total = 0
+        with self._lock:
+            for start in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                (found,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM review_labels "
+                    f"WHERE labeler = ? AND text_hash IN ({placeholders})",
+                    (labeler, *chunk),
+                ).fetchone()
+                total += found
+        return total
+
+    def put_many(self, labels, labeler, texts=None):
+        """{text_hash: {"category", "brief_issue"}} 저장 (기존 값은 덮어씀)
+
+        texts({text_hash: 리뷰 원문})를 넘기면 로컬 분류기 학습용으로 원문도 저장한다.
+        """
+        now = time.time()
+        rows = [
+            (text_hash, labeler, label["category"], label.get("brief_issue", ""), now)
+            for text_hash, label in labels.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO review_labels "
+                "(text_hash, labeler, category, brief_issue, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            if texts:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO review_texts (text_hash, review_text) VALUES (?, ?)",
+                    [(text_hash, texts[text_hash]) for text_hash in labels if text_hash in texts],
+                )
+            self._conn.commit()
+
+    def count(self, labeler):
+        """원문과 함께 저장된 라벨 수"""
+        with self._lock:
+            (total,) = self._conn.execute(
+                "SELECT COUNT(*) FROM review_labels l "
+                "JOIN review_texts t ON t.text_hash = l.text_hash WHERE l.labeler = ?",
+                (labeler,),
+            ).fetchone()
+        return total
+
+    def labeled_examples(self, labeler):
+        """원문과 함께 저장된 라벨을 [(리뷰 원문, category)]로 반환"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT t.review_text, l.category FROM review_labels l "
+                "JOIN review_texts t ON t.text_hash = l.text_hash "
+                "WHERE l.labeler = ? ORDER BY l.updated_at",
+                (labeler,),
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_label_store():
+    """공유 라벨 저장소 반환. 비활성화 상태면 None"""
+    if not config.LABEL_STORE_ENABLED:
+        return None
+
+    with _shared_lock:
+        store = _shared["store"]
+        if store is None or store.path != config.LABEL_STORE_PATH:
+            store = ReviewLabelStore(config.LABEL_STORE_PATH)
+            _shared["store"] = store
+    return store
@@ -0,0 +1,218 @@
+"""
+OpenAI Batch API 실행 모드
+
+실험 스크립트의 요청들을 JSONL로 써서 Batch API에 제출하고, 완료될 때까지 폴링한 뒤
+custom_id 기준으로 응답 content를 돌려준다. 응답 캐시에 이미 있는 요청은 제출하지 않고,
+완료된 응답은 캐시에 저장하여 call_openai_json과 결과를 공유한다.
+"""
+
+import io
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from core import config
+from core.utils import llm_cache, llm_metrics
+from core.utils.openai_client import DEFAULT_SYSTEM_PROMPT, build_request
+
+logger = logging.getLogger(__name__)
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchItemError(RuntimeError):
+    """배치 안의 개별 요청이 실패했거나 결과가 없음"""
+
+
+class BatchResults:
+    """custom_id → 응답 content / 오류 메시지"""
+
+    def __init__(self, contents, errors):
+        self.contents = contents
+        self.errors = errors
+
+    def content(self, custom_id):
+        """응답 content 반환. 실패한 요청이면 BatchItemError"""
+        if custom_id in self.contents:
+            return self.contents[custom_id]
+        raise BatchItemError(self.errors.get(custom_id, "No result returned for request"))
+
+    def __len__(self):
+        return len(self.contents)
+
+
+def batch_request(
+    custom_id,
+    prompt,
+    system_prompt=DEFAULT_SYSTEM_PROMPT,
+    model=None,
+    temperature=None,
+):
+    """Batch 입력 JSONL의 한 줄 (call_openai_json과 같은 요청 body)"""
+    return {
+        "custom_id": str(custom_id),
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_ENDPOINT,
+        "body": build_request(prompt, system_prompt, model, temperature),
+    }
+
+
+def _write_input_file(lines, call_site):
+    os.makedirs(config.LLM_BATCH_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    path = os.path.join(config.LLM_BATCH_DIR, f"{call_site or 'batch'}_{timestamp}.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    return path
+
+
+def _submit(client, lines, call_site):
+    path = _write_input_file(lines, call_site)
+    with open(path, "rb") as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=CHAT_COMPLETIONS_ENDPOINT,
+        completion_window=config.LLM_BATCH_COMPLETION_WINDOW,
+        metadata={"call_site": call_site or llm_metrics.DEFAULT_CALL_SITE},
+    )
+    logger.info("Submitted batch %s (%d requests, input %s)", batch.id, len(lines), path)
+    return batch
+
+
+def _wait(client, batch_ids, poll_interval, max_wait):
+    deadline = time.monotonic() + max_wait
+    pending = list(batch_ids)
+    finished = []
+    while True:
+        still_pending = []
+        for batch_id in pending:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                finished.append(batch)
+            else:
+                still_pending.append(batch_id)
+        pending = still_pending
+        if not pending:
+            return finished
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Batches did not finish within {max_wait:.0f}s: {pending}")
+        time.sleep(poll_interval)
+
+
+def _read_jsonl(client, file_id):
+    if not file_id:
+        return []
+    text = client.files.content(file_id).text
+    return [json.loads(line) for line in io.StringIO(text) if line.strip()]
+
+
+def _item_error(item):
+    if item.get("error"):
+        return item["error"].get("message") or str(item["error"])
+    response = item.get("response") or {}
+    body = response.get("body") or {}
+    error = body.get("error") or {}
+    return error.get("message") or f"HTTP {response.get('status_code')}"
+
+
+def _collect(client, batch, requests_by_id, call_site, elapsed):
+    contents = {}
+    errors = {}
+    if batch.status == "failed":
+        message = f"Batch {batch.id} failed: {getattr(batch, 'errors', None)}"
+        logger.error(message)
+        for custom_id in requests_by_id:
+            errors[custom_id] = message
+
+    items = _read_jsonl(client, batch.output_file_id) + _read_jsonl(client, batch.error_file_id)
+    for item in items:
+        custom_id = item.get("custom_id")
+        response = item.get("response") or {}
+        if response.get("status_code") != 200 or item.get("error"):
+            errors[custom_id] = _item_error(item)
+            continue
+        body = response["body"]
+        contents[custom_id] = body["choices"][0]["message"]["content"]
+        usage = body.get("usage") or {}
+        details = SimpleNamespace(**(usage.get("prompt_tokens_details") or {}))
+        llm_metrics.record_call(
+            call_site, body.get("model"),
+            SimpleNamespace(**{**usage, "prompt_tokens_details": details}), elapsed,
+        )
+
+    for custom_id in requests_by_id:
+        if custom_id not in contents and custom_id not in errors:
+            errors[custom_id] = f"Batch {batch.id} ended as {batch.status} without a result"
+    return contents, errors
+
+
+def run_batch(  # pylint: disable=too-many-arguments,too-many-locals
+    client,
+    lines,
+    *,
+    call_site=None,
+    use_cache=None,
+    poll_interval=None,
+    max_wait=None,
+):
+    """
+    batch_request() 줄들을 Batch API로 실행하고 결과를 custom_id 기준으로 반환
+
+    Args:
+        client: OpenAI 클라이언트
+        lines: batch_request()로 만든 요청 목록 (custom_id는 고유해야 함)
+        call_site: 사용량 계측용 호출 지점 이름
+        use_cache: 응답 캐시 사용 여부 (기본값: config.LLM_CACHE_ENABLED)
+        poll_interval: 상태 확인 간격 초 (기본값: config.LLM_BATCH_POLL_SECONDS)
+        max_wait: 최대 대기 초 (기본값: config.LLM_BATCH_MAX_WAIT_SECONDS)
+
+    Returns:
+        BatchResults
+    """
+    if poll_interval is None:
+        poll_interval = config.LLM_BATCH_POLL_SECONDS
+    if max_wait is None:
+        max_wait = config.LLM_BATCH_MAX_WAIT_SECONDS
+
+    cache = llm_cache.get_cache(use_cache)
+    contents = {}
+    errors = {}
+    to_submit = []
+    for line in lines:
+        cached = cache.get(llm_cache.request_key(line["body"])) if cache is not None else None
+        if cached is not None:
+            llm_metrics.record_cache_hit(call_site, line["body"]["model"])
+            contents[line["custom_id"]] = cached
+        else:
+            to_submit.append(line)
+    if not to_submit:
+        return BatchResults(contents, errors)
+
+    started = time.perf_counter()
+    chunk_size = config.LLM_BATCH_MAX_REQUESTS
+    chunks = [to_submit[i:i + chunk_size] for i in range(0, len(to_submit), chunk_size)]
+    submitted = {}
+    for chunk in chunks:
+        batch = _submit(client, chunk, call_site)
+        submitted[batch.id] = {line["custom_id"]: line for line in chunk}
+
+    for batch in _wait(client, submitted, poll_interval, max_wait):
+        requests_by_id = submitted[batch.id]
+        batch_contents, batch_errors = _collect(
+            client, batch, requests_by_id, call_site, time.perf_counter() - started
+        )
+        for custom_id, content in batch_contents.items():
+            if cache is not None and custom_id in requests_by_id:
+                cache.set(llm_cache.request_key(requests_by_id[custom_id]["body"]), content)
+        contents.update(batch_contents)
+        errors.update(batch_errors)
+
+    if errors:
+        logger.warning("%d of %d batch requests failed", len(errors), len(lines))
+    return BatchResults(contents, errors)
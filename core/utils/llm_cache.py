@@ -0,0 +1,170 @@
+"""
+LLM 응답 디스크 캐시 (SQLite)
+
+(model, temperature, system_prompt, prompt, response_format)의 해시를 키로
+응답 content를 저장한다. 전체 크기 기준 LRU 및 TTL로 만료시킨다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from core import config
+from core.utils import sqlite_utils
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+"""
+
+_shared = {"cache": None}
+_shared_lock = threading.Lock()
+
+
+def make_key(model, temperature, system_prompt, prompt, response_format=None):
+    """요청 파라미터로부터 content-addressed 캐시 키 생성"""
+    payload = json.dumps(
+        [model, temperature, system_prompt, prompt, response_format],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def request_key(request):
+    """chat.completions.create 인자 dict로부터 캐시 키 생성"""
+    messages = request["messages"]
+    return make_key(
+        request["model"],
+        request["temperature"],
+        messages[0]["content"],
+        messages[1]["content"],
+        request.get("response_format"),
+    )
+
+
+class LLMCache:
+    """크기 기반 LRU + TTL 만료를 지원하는 SQLite 응답 캐시"""
+
+    def __init__(self, path, max_bytes=None, ttl_seconds=None):
+        self.path = path
+        self.max_bytes = max_bytes if max_bytes is not None else config.LLM_CACHE_MAX_BYTES
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else config.LLM_CACHE_TTL_SECONDS
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite_utils.connect(path, _SCHEMA)
+
+    def get(self, key):
+        """캐시된 응답 반환. 없거나 만료되었으면 None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key, value):
+        """응답 저장 후 최대 크기를 넘으면 오래 사용되지 않은 항목부터 제거"""
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, value, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        logger.debug("LLM cache evicted %d entries", len(victims))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self):
+        """이번 프로세스의 hit/miss 수와 현재 저장 용량"""
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": total,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_cache(use_cache=None):
+    """
+    공유 캐시 인스턴스 반환. 캐시를 사용하지 않으면 None
+
+    Args:
+        use_cache: True/False로 호출 단위 강제 설정 (None이면 config.LLM_CACHE_ENABLED)
+    """
+    enabled = config.LLM_CACHE_ENABLED if use_cache is None else use_cache
+    if not enabled:
+        return None
+
+    with _shared_lock:
+        cache = _shared["cache"]
+        if cache is None or cache.path != config.LLM_CACHE_PATH:
+            cache = LLMCache(config.LLM_CACHE_PATH)
+            _shared["cache"] = cache
+    return cache
+
+
+def cache_stats():
+    """공유 캐시 통계 (캐시를 한 번도 사용하지 않았으면 None)"""
+    cache = _shared["cache"]
+    return cache.stats() if cache is not None else None
@@ -0,0 +1,190 @@
+"""
+LLM 호출 사용량/지연 계측
+
+호출 지점(call_site)과 모델별로 토큰 수와 wall latency를 히스토그램으로 집계한다.
+백엔드는 Prometheus 텍스트 형식(/api/metrics)으로, 실험 스크립트는 결과 JSON 옆에
+실행 단위 JSON 리포트로 내보낸다.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000)
+
+DEFAULT_CALL_SITE = "other"
+
+_lock = threading.Lock()
+_series = {}
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram 의미론)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+    def to_dict(self):
+        return {
+            "buckets": dict(zip((str(b) for b in self.buckets), self.counts)),
+            "sum": self.total,
+            "count": self.count,
+        }
+
+
+def _new_series():
+    return {
+        "calls": 0,
+        "errors": 0,
+        "cache_hits": 0,
+        "cached_tokens": 0,
+        "latency_seconds": Histogram(LATENCY_BUCKETS),
+        "prompt_tokens": Histogram(TOKEN_BUCKETS),
+        "completion_tokens": Histogram(TOKEN_BUCKETS),
+    }
+
+
+def _get_series(call_site, model):
+    return _series.setdefault((call_site or DEFAULT_CALL_SITE, model), _new_series())
+
+
+def _usage_value(obj, name):
+    value = getattr(obj, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def record_call(call_site, model, usage, latency_seconds):
+    """성공한 API 호출 1건 기록 (usage: 응답의 usage 객체, 없으면 None)"""
+    details = getattr(usage, "prompt_tokens_details", None)
+    with _lock:
+        series = _get_series(call_site, model)
+        series["calls"] += 1
+        series["latency_seconds"].observe(latency_seconds)
+        series["prompt_tokens"].observe(_usage_value(usage, "prompt_tokens"))
+        series["completion_tokens"].observe(_usage_value(usage, "completion_tokens"))
+        series["cached_tokens"] += _usage_value(details, "cached_tokens")
+
+
+def record_cache_hit(call_site, model):
+    with _lock:
+        _get_series(call_site, model)["cache_hits"] += 1
+
+
+def record_error(call_site, model):
+    with _lock:
+        _get_series(call_site, model)["errors"] += 1
+
+
+def reset():
+    with _lock:
+        _series.clear()
+
+
+def snapshot():
+    """[{call_site, model, calls, ..., latency_seconds: {...}}, ...]"""
+    with _lock:
+        rows = []
+        for (call_site, model), series in sorted(_series.items()):
+            row = {"call_site": call_site, "model": model}
+            for name, value in series.items():
+                row[name] = value.to_dict() if isinstance(value, Histogram) else value
+            rows.append(row)
+    return rows
+
+
+def write_run_report(output_file, extra=None):
+    """실행 단위 사용량 리포트 JSON 저장 (실험 결과 JSON 옆에 둠)"""
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "calls": snapshot(),
+        **(extra or {}),
+    }
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return output_file
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _render_histogram(lines, name, help_text, entries):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, hist in entries:
+        for bound, count in zip(hist.buckets, hist.counts):
+            lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {count}")
+        lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {hist.count}")
+        lines.append(f"{name}_sum{_labels(**labels)} {hist.total}")
+        lines.append(f"{name}_count{_labels(**labels)} {hist.count}")
+
+
+def _render_counter(lines, name, help_text, entries):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in entries:
+        lines.append(f"{name}{_labels(**labels)} {value}")
+
+
+def render_prometheus(extra_gauges=None, extra_counters=None):
+    """
+    Prometheus 텍스트 노출 형식으로 렌더링
+
+    Args:
+        extra_gauges: {metric_name: (help_text, value)} 형태의 추가 gauge (시점 값)
+        extra_counters: 같은 형태의 추가 counter (누적 값, 이름은 _total로 끝남)
+    """
+    with _lock:
+        items = [
+            ({"call_site": call_site, "model": model}, series)
+            for (call_site, model), series in sorted(_series.items())
+        ]
+        lines = []
+        for name, help_text in [
+            ("calls", "Successful LLM API calls"),
+            ("errors", "LLM calls that failed after retries"),
+            ("cache_hits", "LLM calls served from the response cache"),
+            ("cached_tokens", "Prompt tokens served from the provider prompt cache"),
+        ]:
+            _render_counter(
+                lines, f"llm_{name}_total", help_text,
+                [(labels, series[name]) for labels, series in items],
+            )
+        for name, help_text in [
+            ("latency_seconds", "Wall latency of LLM calls including retries"),
+            ("prompt_tokens", "Prompt tokens per LLM call"),
+            ("completion_tokens", "Completion tokens per LLM call"),
+        ]:
+            _render_histogram(
+                lines, f"llm_{name}", help_text,
+                [(labels, series[name]) for labels, series in items],
+            )
+
+    for name, (help_text, value) in (extra_counters or {}).items():
+        _render_counter(lines, name, help_text, [({}, value)])
+    for name, (help_text, value) in (extra_gauges or {}).items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,47 @@
+"""
+LLM 요청/응답 기록 (record/replay)
+
+config.LLM_RECORD_PATH가 설정되어 있으면 call_openai_json이 받은 응답을
+JSONL로 덧붙여 기록한다. 기록 파일은 fake_openai_server의 ReplayResponder로
+재생해 실제 API 없이 같은 파이프라인을 돌릴 수 있다.
+"""
+
+import json
+import os
+import threading
+
+from core import config
+from core.utils.llm_cache import request_key
+
+_write_lock = threading.Lock()
+
+
+def record_response(request, content, path=None):
+    """요청 dict와 응답 content를 한 줄로 기록 (기록 경로가 없으면 무시)"""
+    path = path or config.LLM_RECORD_PATH
+    if not path or not isinstance(content, str):
+        return
+
+    line = json.dumps(
+        {"key": request_key(request), "request": request, "content": content},
+        ensure_ascii=False,
+    )
+    directory = os.path.dirname(path)
+    with _write_lock:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def load_recordings(path):
+    """기록 파일을 {캐시 키: content} dict로 읽음 (같은 키는 마지막 기록 우선)"""
+    recordings = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            key = item.get("key") or request_key(item["request"])
+            recordings[key] = item["content"]
+    return recordings
@@ -0,0 +1,178 @@
+"""
+LLM 호출 재시도 / 헤징 유틸리티
+
+- 재시도 가능한 오류(타임아웃, 연결 오류, 429, 5xx)는 지수 백오프 + 지터로 재시도
+- 헤징: 첫 요청이 최근 p95 지연을 넘기면 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용
+"""
+
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import wait
+
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+from core import config
+
+logger = logging.getLogger(__name__)
+
+# APITimeoutError는 APIConnectionError의 하위 클래스
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+_hedge_executor = {"executor": None}
+_hedge_lock = threading.Lock()
+
+
+def backoff_delay(attempt):
+    """attempt번째(0부터) 재시도 전 대기 시간 (full jitter)"""
+    ceiling = min(
+        config.LLM_BACKOFF_MAX_SECONDS,
+        config.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt),
+    )
+    return random.uniform(0, ceiling)
+
+
+def _retry_after(exc):
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _next_delay(exc, attempt, max_retries):
+    delay = backoff_delay(attempt)
+    retry_after = _retry_after(exc)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    logger.warning(
+        "LLM call failed (%s), retrying in %.1fs [%d/%d]",
+        type(exc).__name__, delay, attempt + 1, max_retries,
+    )
+    return delay
+
+
+def call_with_retry(fn, max_retries):
+    """fn()을 재시도 가능한 오류에 한해 최대 max_retries번 재시도"""
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except RETRYABLE_ERRORS as exc:
+            if attempt == max_retries:
+                raise
+            time.sleep(_next_delay(exc, attempt, max_retries))
+    raise AssertionError("unreachable")
+
+
+async def call_with_retry_async(coro_fn, max_retries):
+    """call_with_retry의 코루틴 버전"""
+    for attempt in range(max_retries + 1):
+        try:
+            return await coro_fn()
+        except RETRYABLE_ERRORS as exc:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(_next_delay(exc, attempt, max_retries))
+    raise AssertionError("unreachable")
+
+
+class LatencyTracker:
+    """(모델, 프롬프트 크기 구간)별 최근 성공 지연을 보관하고 p95를 계산"""
+
+    def __init__(self, window=200, min_samples=20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request):
+        prompt_chars = sum(len(m["content"]) for m in request["messages"])
+        return request["model"], int(math.log2(prompt_chars + 1))
+
+    def record(self, key, seconds):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(seconds)
+
+    def p95(self, key):
+        """표본이 충분하지 않으면 None"""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+latency_tracker = LatencyTracker()
+
+
+def _get_hedge_executor():
+    with _hedge_lock:
+        if _hedge_executor["executor"] is None:
+            _hedge_executor["executor"] = ThreadPoolExecutor(
+                max_workers=config.LLM_HEDGE_MAX_WORKERS,
+                thread_name_prefix="llm-hedge",
+            )
+    return _hedge_executor["executor"]
+
+
+def _first_success(futures):
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+    return futures[0].result()  # 모두 실패하면 첫 요청의 오류를 그대로 올림
+
+
+def hedged_call(fn, hedge_after):
+    """fn()이 hedge_after초 안에 끝나지 않으면 한 번 더 실행하고 먼저 성공한 결과 반환"""
+    if hedge_after is None:
+        return fn()
+
+    executor = _get_hedge_executor()
+    primary = executor.submit(fn)
+    try:
+        return primary.result(timeout=hedge_after)
+    except FuturesTimeoutError:
+        pass
+
+    logger.info("LLM call exceeded p95 (%.1fs), sending hedged request", hedge_after)
+    return _first_success([primary, executor.submit(fn)])
+
+
+async def hedged_call_async(coro_fn, hedge_after):
+    """hedged_call의 코루틴 버전. 늦게 끝난 요청은 취소"""
+    if hedge_after is None:
+        return await coro_fn()
+
+    primary = asyncio.ensure_future(coro_fn())
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        logger.info("LLM call exceeded p95 (%.1fs), sending hedged request", hedge_after)
+        tasks.append(asyncio.ensure_future(coro_fn()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        return primary.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,150 @@
+"""
+로컬 1차 분류기 (TF-IDF 문자 n-gram + 로지스틱 회귀)
+
+대부분의 부정 리뷰는 배송 지연/품질 불량처럼 뻔한 경우라 LLM 왕복이 필요 없다.
+평가 데이터셋(manual_label)과 라벨 저장소에 쌓인 LLM 라벨로 가벼운 분류기를 학습해
+확신도가 config.LOCAL_CLASSIFIER_THRESHOLD 이상인 리뷰는 로컬에서 분류하고
+나머지만 LLM으로 보낸다. 문자 n-gram이라 형태소 분석 없이 한국어에도 동작한다.
+
+scikit-learn이 없거나 학습 데이터가 부족하면 None을 반환하고 모두 LLM으로 간다.
+"""
+
+import logging
+import os
+import threading
+
+import pandas as pd
+
+from core import config
+from core.utils.label_store import review_hash
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+except ImportError:
+    make_pipeline = None
+
+logger = logging.getLogger(__name__)
+
+NGRAM_RANGE = (1, 3)
+LOCAL_SOURCE = "local"
+
+_shared = {"classifier": None, "key": None, "trained_on": None}
+_shared_lock = threading.Lock()
+
+
+def _build_pipeline():
+    return make_pipeline(
+        TfidfVectorizer(analyzer="char_wb", ngram_range=NGRAM_RANGE, sublinear_tf=True),
+        LogisticRegression(max_iter=1000),
+    )
+
+
+class LocalClassifier:
+    """학습된 파이프라인 + 확신도 기준 라벨링
+
+    학습에 쓴 리뷰(trained_hashes)는 label_confident에서 라벨링하지 않는다. 평가
+    데이터셋이 시드로 들어가므로, 평가셋 리뷰를 자기 정답으로 학습한 모델이 맞히는
+    일이 없도록 하기 위함이다 (운영에서는 그런 리뷰가 이미 라벨 저장소에서 해결된다).
+    """
+
+    def __init__(self, pipeline, sample_count, trained_hashes=frozenset()):
+        self.pipeline = pipeline
+        self.sample_count = sample_count
+        self.trained_hashes = trained_hashes
+
+    @classmethod
+    def train(cls, texts, labels):
+        """학습. scikit-learn이 없거나 카테고리가 2개 미만이면 None"""
+        if make_pipeline is None or len(set(labels)) < 2:
+            return None
+        texts = list(texts)
+        pipeline = _build_pipeline()
+        pipeline.fit(texts, list(labels))
+        return cls(pipeline, len(labels), frozenset(review_hash(text) for text in texts))
+
+    def predict(self, texts):
+        """리뷰별 (category, 확신도) 목록"""
+        if not texts:
+            return []
+        proba = self.pipeline.predict_proba(list(texts))
+        best = proba.argmax(axis=1)
+        classes = self.pipeline.classes_
+        return [(str(classes[i]), float(proba[row, i])) for row, i in enumerate(best)]
+
+    def label_confident(self, texts_by_hash, threshold=None):
+        """
+        확신도가 threshold 이상인 리뷰만 라벨링 (학습에 쓴 리뷰는 제외)
+
+        Args:
+            texts_by_hash: {text_hash: 리뷰 원문}
+            threshold: 최소 확신도 (기본값: config.LOCAL_CLASSIFIER_THRESHOLD)
+
+        Returns:
+            {text_hash: {"category", "brief_issue": "", "source": "local"}}
+            (로컬 모델은 요약을 만들지 않으므로 brief_issue는 비워 둔다)
+        """
+        threshold = config.LOCAL_CLASSIFIER_THRESHOLD if threshold is None else threshold
+        hashes = [h for h in texts_by_hash if h not in self.trained_hashes]
+        predictions = self.predict([texts_by_hash[h] for h in hashes])
+        return {
+            text_hash: {"category": category, "brief_issue": "", "source": LOCAL_SOURCE}
+            for text_hash, (category, confidence) in zip(hashes, predictions)
+            if confidence >= threshold
+        }
+
+
+def load_seed_examples(path=None):
+    """평가 데이터셋의 (review_text, manual_label) 목록. 파일이 없으면 빈 목록"""
+    path = config.LOCAL_CLASSIFIER_SEED_PATH if path is None else path
+    if not os.path.exists(path):
+        return []
+    df = pd.read_csv(path, usecols=["review_text", "manual_label"]).dropna()
+    df = df[df["manual_label"].str.strip() != ""]
+    return list(zip(df["review_text"], df["manual_label"].str.strip()))
+
+
+def training_examples(label_store, labeler, seed_path=None):
+    """
+    저장된 LLM 라벨 + 평가 데이터셋 라벨 (같은 리뷰는 수동 라벨 우선)
+
+    Returns:
+        (texts, labels)
+    """
+    examples = {}
+    if label_store is not None:
+        for text, category in label_store.labeled_examples(labeler):
+            examples[review_hash(text)] = (text, category)
+    for text, category in load_seed_examples(seed_path):
+        examples[review_hash(text)] = (text, category)
+    texts = [text for text, _ in examples.values()]
+    labels = [category for _, category in examples.values()]
+    return texts, labels
+
+
+def get_local_classifier(label_store, labeler):
+    """
+    공유 로컬 분류기 반환 (없거나 학습 데이터가 부족하면 None)
+
+    라벨 저장소에 LLM 라벨이 config.LOCAL_CLASSIFIER_RETRAIN_EVERY건 더 쌓이면 다시 학습한다.
+    """
+    if not config.LOCAL_CLASSIFIER_ENABLED or make_pipeline is None:
+        return None
+
+    key = (config.LOCAL_CLASSIFIER_SEED_PATH, label_store.path if label_store else None, labeler)
+    stored = label_store.count(labeler) if label_store else 0
+    with _shared_lock:
+        if (
+            _shared["key"] == key
+            and stored < _shared["trained_on"] + config.LOCAL_CLASSIFIER_RETRAIN_EVERY
+        ):
+            return _shared["classifier"]
+
+        texts, labels = training_examples(label_store, labeler)
+        classifier = None
+        if len(texts) >= config.LOCAL_CLASSIFIER_MIN_SAMPLES:
+            classifier = LocalClassifier.train(texts, labels)
+            logger.info("local classifier trained on %d labeled reviews", len(texts))
+        _shared.update(classifier=classifier, key=key, trained_on=stored)
+    return classifier
@@ -1,24 +1,177 @@
 """
 OpenAI API 호출을 위한 공통 유틸리티
 중복 코드 제거를 위해 공통 함수로 추출
+
+클라이언트는 프로세스 전역으로 공유하여 HTTP 커넥션 풀(keep-alive)을 재사용한다.
 """
 
-from openai import OpenAI
+import asyncio
+import threading
+import time
+import weakref
+from functools import partial
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
 from core import config
+from core.utils import llm_cache, llm_metrics, llm_recording
+from core.utils.json_stream import JSONArrayItemStream
+from core.utils.json_utils import extract_json_from_text
+from core.utils.llm_retry import (
+    LatencyTracker,
+    call_with_retry,
+    call_with_retry_async,
+    hedged_call,
+    hedged_call_async,
+    latency_tracker,
+)
+from core.utils.rate_limiter import estimate_request_tokens, get_rate_limiter
+
+DEFAULT_SYSTEM_PROMPT = "당신은 이커머스 고객 피드백 분석 전문가입니다. 반드시 한국어로 응답하세요."
+
+_clients = {"sync": None}
+_client_lock = threading.Lock()
+# AsyncOpenAI의 커넥션 풀은 생성된 이벤트 루프에 묶이므로 루프별로 하나씩 유지
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _http_limits():
+    return httpx.Limits(
+        max_connections=config.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.LLM_KEEPALIVE_EXPIRY,
+    )
 
 
 def get_client():
-    """OpenAI 클라이언트 인스턴스 반환"""
-    return OpenAI(api_key=config.OPENAI_API_KEY)
+    """프로세스 전역 OpenAI 클라이언트 반환 (커넥션 풀 공유)"""
+    if _clients["sync"] is None:
+        with _client_lock:
+            if _clients["sync"] is None:
+                _clients["sync"] = OpenAI(
+                    api_key=config.OPENAI_API_KEY,
+                    base_url=config.OPENAI_BASE_URL,
+                    max_retries=0,  # 재시도는 call_with_retry에서 처리
+                    http_client=httpx.Client(limits=_http_limits()),
+                )
+    return _clients["sync"]
+
+
+def get_async_client():
+    """현재 이벤트 루프에서 공유하는 AsyncOpenAI 클라이언트 반환"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            base_url=config.OPENAI_BASE_URL,
+            max_retries=0,  # 재시도는 call_with_retry_async에서 처리
+            http_client=httpx.AsyncClient(limits=_http_limits()),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client():
+    """현재 이벤트 루프의 AsyncOpenAI 클라이언트를 닫음 (앱 종료 시 호출)"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+def build_request(prompt, system_prompt, model, temperature):
+    """chat.completions.create 인자 dict 구성 (Batch API 요청 body로도 사용)"""
+    if model is None:
+        model = config.LLM_MODEL
+    if temperature is None:
+        temperature = config.LLM_TEMPERATURE
+
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": temperature,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _total_tokens(response):
+    usage = getattr(response, "usage", None)
+    total = getattr(usage, "total_tokens", None)
+    return total if isinstance(total, int) else None
+
+
+def _cache_lookup(request, use_cache):
+    cache = llm_cache.get_cache(use_cache)
+    if cache is None:
+        return None, None, None
+    key = llm_cache.request_key(request)
+    return cache, key, cache.get(key)
+
+
+def _cache_store(cache, key, content):
+    if cache is not None and isinstance(content, str):
+        cache.set(key, content)
+
 
+def _create_once(client, request, timeout):
+    """레이트 리밋을 거친 단일 API 호출"""
+    limiter = get_rate_limiter()
+    estimate = estimate_request_tokens(request)
+    if limiter is not None:
+        limiter.acquire(estimate)
 
-def call_openai_json(
+    started = time.perf_counter()
+    response = client.chat.completions.create(**request, timeout=timeout)
+    latency_tracker.record(LatencyTracker.key_for(request), time.perf_counter() - started)
+
+    if limiter is not None:
+        limiter.reconcile(estimate, _total_tokens(response))
+    return response
+
+
+async def _create_once_async(client, request, timeout):
+    """_create_once의 코루틴 버전"""
+    limiter = get_rate_limiter()
+    estimate = estimate_request_tokens(request)
+    if limiter is not None:
+        await limiter.acquire_async(estimate)
+
+    started = time.perf_counter()
+    response = await client.chat.completions.create(**request, timeout=timeout)
+    latency_tracker.record(LatencyTracker.key_for(request), time.perf_counter() - started)
+
+    if limiter is not None:
+        limiter.reconcile(estimate, _total_tokens(response))
+    return response
+
+
+def _resilience_options(request, timeout, max_retries, hedge):
+    if timeout is None:
+        timeout = config.LLM_TIMEOUT_SECONDS
+    if max_retries is None:
+        max_retries = config.LLM_MAX_RETRIES
+    if hedge is None:
+        hedge = config.LLM_HEDGING_ENABLED
+    hedge_after = latency_tracker.p95(LatencyTracker.key_for(request)) if hedge else None
+    return timeout, max_retries, hedge_after
+
+
+def call_openai_json(  # pylint: disable=too-many-arguments,too-many-locals
     client,
     prompt,
-    system_prompt="당신은 이커머스 고객 피드백 분석 전문가입니다. 반드시 한국어로 응답하세요.",
+    system_prompt=DEFAULT_SYSTEM_PROMPT,
     model=None,
     temperature=None,
+    *,
+    use_cache=None,
+    timeout=None,
+    max_retries=None,
+    hedge=None,
+    call_site=None,
 ):
     """
     OpenAI API를 호출하여 JSON 응답을 반환
@@ -29,23 +182,279 @@ def call_openai_json(
         system_prompt: 시스템 프롬프트
         model: 사용할 모델 (기본값: config.LLM_MODEL)
         temperature: 온도 설정 (기본값: config.LLM_TEMPERATURE)
+        use_cache: 디스크 캐시 사용 여부 (기본값: config.LLM_CACHE_ENABLED)
+        timeout: 요청당 타임아웃 초 (기본값: config.LLM_TIMEOUT_SECONDS)
+        max_retries: 재시도 가능한 오류 시 최대 재시도 횟수 (기본값: config.LLM_MAX_RETRIES)
+        hedge: p95 초과 시 중복 요청 여부 (기본값: config.LLM_HEDGING_ENABLED)
+        call_site: 사용량/지연 계측용 호출 지점 이름 (예: "categorize_issues")
 
     Returns:
         API 응답의 message content (문자열)
     """
-    if model is None:
-        model = config.LLM_MODEL
-    if temperature is None:
-        temperature = config.LLM_TEMPERATURE
+    started = time.perf_counter()
+    request = build_request(prompt, system_prompt, model, temperature)
+    cache, key, cached = _cache_lookup(request, use_cache)
+    if cached is not None:
+        llm_metrics.record_cache_hit(call_site, request["model"])
+        llm_recording.record_response(request, cached)
+        return cached
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=temperature,
-        response_format={"type": "json_object"}
+    timeout, max_retries, hedge_after = _resilience_options(
+        request, timeout, max_retries, hedge
     )
+    attempt = partial(_create_once, client, request, timeout)
+    try:
+        response = call_with_retry(partial(hedged_call, attempt, hedge_after), max_retries)
+    except Exception:
+        llm_metrics.record_error(call_site, request["model"])
+        raise
+    llm_metrics.record_call(
+        call_site, request["model"], response.usage, time.perf_counter() - started
+    )
+    content = response.choices[0].message.content
+
+    _cache_store(cache, key, content)
+    llm_recording.record_response(request, content)
+    return content
+
+
+async def call_openai_json_async(  # pylint: disable=too-many-arguments,too-many-locals
+    prompt,
+    system_prompt=DEFAULT_SYSTEM_PROMPT,
+    model=None,
+    temperature=None,
+    *,
+    client=None,
+    use_cache=None,
+    timeout=None,
+    max_retries=None,
+    hedge=None,
+    call_site=None,
+):
+    """
+    call_openai_json의 비동기 버전
+
+    스레드 풀을 거치지 않고 이벤트 루프에서 직접 await 할 수 있다.
+
+    Args:
+        prompt: 사용자 프롬프트
+        system_prompt: 시스템 프롬프트
+        model: 사용할 모델 (기본값: config.LLM_MODEL)
+        temperature: 온도 설정 (기본값: config.LLM_TEMPERATURE)
+        client: AsyncOpenAI 클라이언트 (기본값: 공유 클라이언트)
+        use_cache: 디스크 캐시 사용 여부 (기본값: config.LLM_CACHE_ENABLED)
+        timeout: 요청당 타임아웃 초 (기본값: config.LLM_TIMEOUT_SECONDS)
+        max_retries: 재시도 가능한 오류 시 최대 재시도 횟수 (기본값: config.LLM_MAX_RETRIES)
+        hedge: p95 초과 시 중복 요청 여부 (기본값: config.LLM_HEDGING_ENABLED)
+        call_site: 사용량/지연 계측용 호출 지점 이름 (예: "categorize_issues")
+
+    Returns:
+        API 응답의 message content (문자열)
+    """
+    started = time.perf_counter()
+    request = build_request(prompt, system_prompt, model, temperature)
+    cache, key, cached = _cache_lookup(request, use_cache)
+    if cached is not None:
+        llm_metrics.record_cache_hit(call_site, request["model"])
+        llm_recording.record_response(request, cached)
+        return cached
+
+    if client is None:
+        client = get_async_client()
+    timeout, max_retries, hedge_after = _resilience_options(
+        request, timeout, max_retries, hedge
+    )
+    attempt = partial(_create_once_async, client, request, timeout)
+    try:
+        response = await call_with_retry_async(
+            partial(hedged_call_async, attempt, hedge_after), max_retries
+        )
+    except Exception:
+        llm_metrics.record_error(call_site, request["model"])
+        raise
+    llm_metrics.record_call(
+        call_site, request["model"], response.usage, time.perf_counter() - started
+    )
+    content = response.choices[0].message.content
+
+    _cache_store(cache, key, content)
+    llm_recording.record_response(request, content)
+    return content
+
+
+class _StreamCollector:
+    """스트리밍 청크에서 배열 항목을 뽑고, 끝나면 전체 content/usage를 정리"""
+
+    def __init__(self, request, array_key, call_site, started):
+        self.request = request
+        self.array_key = array_key
+        self.call_site = call_site
+        self.started = started
+        self.parser = JSONArrayItemStream(array_key)
+        self.parts = []
+        self.usage = None
+
+    def consume(self, chunk):
+        if getattr(chunk, "usage", None) is not None:
+            self.usage = chunk.usage
+        items = []
+        for choice in chunk.choices or ():
+            text = getattr(choice.delta, "content", None)
+            if text:
+                self.parts.append(text)
+                items.extend(self.parser.feed(text))
+        return items
+
+    def finish(self, cache, key, limiter, estimate):
+        self.parser.close()
+        if limiter is not None:
+            limiter.reconcile(estimate, _total_tokens(self))
+        llm_metrics.record_call(
+            self.call_site,
+            self.request["model"],
+            self.usage,
+            time.perf_counter() - self.started,
+        )
+        content = "".join(self.parts)
+        _cache_store(cache, key, content)
+        llm_recording.record_response(self.request, content)
+
+
+def _cached_items(request, content, array_key, call_site):
+    llm_metrics.record_cache_hit(call_site, request["model"])
+    llm_recording.record_response(request, content)
+    parsed = extract_json_from_text(content)
+    if not isinstance(parsed, dict) or not isinstance(parsed.get(array_key), list):
+        raise ValueError(f"Cached response has no top-level {array_key!r} array")
+    return [item for item in parsed[array_key] if isinstance(item, (dict, list))]
+
+
+def _stream_request(request, timeout):
+    return {
+        **request,
+        "stream": True,
+        "stream_options": {"include_usage": True},
+        "timeout": timeout,
+    }
+
+
+def _open_stream(client, request, timeout, limiter, estimate):
+    """레이트 리밋을 거친 스트림 연결 한 번 (재시도마다 토큰을 다시 받음)"""
+    if limiter is not None:
+        limiter.acquire(estimate)
+    return client.chat.completions.create(**_stream_request(request, timeout))
+
+
+async def _open_stream_async(client, request, timeout, limiter, estimate):
+    """_open_stream의 코루틴 버전"""
+    if limiter is not None:
+        await limiter.acquire_async(estimate)
+    return await client.chat.completions.create(**_stream_request(request, timeout))
+
+
+def stream_openai_json_items(  # pylint: disable=too-many-arguments,too-many-locals
+    client,
+    prompt,
+    array_key,
+    *,
+    system_prompt=DEFAULT_SYSTEM_PROMPT,
+    model=None,
+    temperature=None,
+    use_cache=None,
+    timeout=None,
+    max_retries=None,
+    call_site=None,
+):
+    """
+    call_openai_json의 스트리밍 버전. 응답 JSON의 array_key 배열 항목을
+    완성되는 즉시 하나씩 yield 한다 (예: "categories", "replies")
+
+    재시도는 스트림 연결 단계에서만 하며, 헤징은 하지 않는다.
+    캐시 히트 시에는 저장된 응답의 항목을 한꺼번에 yield 한다.
+
+    Args:
+        client: OpenAI 클라이언트
+        prompt: 사용자 프롬프트
+        array_key: 항목을 뽑을 최상위 배열 키
+        (그 외 인자는 call_openai_json과 동일)
+
+    Yields:
+        배열 항목 dict
+    """
+    started = time.perf_counter()
+    request = build_request(prompt, system_prompt, model, temperature)
+    cache, key, cached = _cache_lookup(request, use_cache)
+    if cached is not None:
+        yield from _cached_items(request, cached, array_key, call_site)
+        return
+
+    timeout, max_retries, _ = _resilience_options(request, timeout, max_retries, False)
+    limiter = get_rate_limiter()
+    estimate = estimate_request_tokens(request)
+
+    collector = _StreamCollector(request, array_key, call_site, started)
+    try:
+        stream = call_with_retry(
+            partial(_open_stream, client, request, timeout, limiter, estimate),
+            max_retries,
+        )
+        for chunk in stream:
+            yield from collector.consume(chunk)
+    except Exception:
+        llm_metrics.record_error(call_site, request["model"])
+        raise
+    collector.finish(cache, key, limiter, estimate)
+
+
+async def stream_openai_json_items_async(  # pylint: disable=too-many-arguments,too-many-locals
+    prompt,
+    array_key,
+    *,
+    system_prompt=DEFAULT_SYSTEM_PROMPT,
+    model=None,
+    temperature=None,
+    client=None,
+    use_cache=None,
+    timeout=None,
+    max_retries=None,
+    call_site=None,
+):
+    """
+    stream_openai_json_items의 비동기 버전 (async generator)
+
+    Args:
+        prompt: 사용자 프롬프트
+        array_key: 항목을 뽑을 최상위 배열 키
+        client: AsyncOpenAI 클라이언트 (기본값: 공유 클라이언트)
+        (그 외 인자는 call_openai_json_async와 동일)
+
+    Yields:
+        배열 항목 dict
+    """
+    started = time.perf_counter()
+    request = build_request(prompt, system_prompt, model, temperature)
+    cache, key, cached = _cache_lookup(request, use_cache)
+    if cached is not None:
+        for item in _cached_items(request, cached, array_key, call_site):
+            yield item
+        return
+
+    if client is None:
+        client = get_async_client()
+    timeout, max_retries, _ = _resilience_options(request, timeout, max_retries, False)
+    limiter = get_rate_limiter()
+    estimate = estimate_request_tokens(request)
 
-    return response.choices[0].message.content
+    collector = _StreamCollector(request, array_key, call_site, started)
+    try:
+        stream = await call_with_retry_async(
+            partial(_open_stream_async, client, request, timeout, limiter, estimate),
+            max_retries,
+        )
+        async for chunk in stream:
+            for item in collector.consume(chunk):
+                yield item
+    except Exception:
+        llm_metrics.record_error(call_site, request["model"])
+        raise
+    collector.finish(cache, key, limiter, estimate)
@@ -1,5 +1,21 @@
 """Prompt template helpers."""
 
+from core import config
+from core.utils.review_categories import CATEGORY_KEYS
+from core.utils.token_budget import truncate_to_tokens
+
+_ZERO_SHOT_INTRO = (
+    "당신은 이커머스 플랫폼의 고객 리뷰를 분석하는 전문가입니다.\n\n"
+    "아래는 {review_count}개의 부정적 고객 리뷰 (별점 3점 이하)입니다.\n\n"
+    "작업 지침:\n"
+    "1. 모든 리뷰를 주의 깊게 읽으세요\n"
+    "2. 주요 문제 카테고리를 식별하세요 (예: 배송 문제, 품질 불량, "
+    "오배송, 포장 불량, 고객 서비스 등)\n"
+    "3. 각 리뷰에 하나의 주요 문제 카테고리를 지정하세요\n\n"
+    "리뷰 목록:\n"
+    "{reviews_text}\n\n"
+)
+
 # JSON output format for single review categorization
 SINGLE_REVIEW_JSON_FORMAT = (
     "Output JSON:\n"
@@ -12,23 +28,17 @@ SINGLE_REVIEW_JSON_FORMAT = (
 
 
 def format_reviews(sampled_reviews):
+    """Number reviews, cutting each at a sentence boundary within LLM_REVIEW_MAX_TOKENS."""
     return "\n---\n".join(
-        [f"{i + 1}. {text[:500]}" for i, text in enumerate(sampled_reviews)]
+        f"{i + 1}. {truncate_to_tokens(text, config.LLM_REVIEW_MAX_TOKENS)}"
+        for i, text in enumerate(sampled_reviews)
     )
 
 
 def build_zero_shot_prompt(reviews_text, review_count):
     return (
-        "당신은 이커머스 플랫폼의 고객 리뷰를 분석하는 전문가입니다.\n\n"
-        f"아래는 {review_count}개의 부정적 고객 리뷰 (별점 3점 이하)입니다.\n\n"
-        "작업 지침:\n"
-        "1. 모든 리뷰를 주의 깊게 읽으세요\n"
-        "2. 주요 문제 카테고리를 식별하세요 (예: 배송 문제, 품질 불량, "
-        "오배송, 포장 불량, 고객 서비스 등)\n"
-        "3. 각 리뷰에 하나의 주요 문제 카테고리를 지정하세요\n\n"
-        "리뷰 목록:\n"
-        f"{reviews_text}\n\n"
-        "출력 형식 (JSON):\n"
+        _ZERO_SHOT_INTRO.format(reviews_text=reviews_text, review_count=review_count)
+        + "출력 형식 (JSON):\n"
         "{\n"
         '  "categories": [\n'
         "    {\n"
@@ -41,10 +51,36 @@ def build_zero_shot_prompt(reviews_text, review_count):
         "}\n\n"
         "IMPORTANT RULES:\n"
         "- category는 반드시 아래 영어 키 중 하나를 사용하세요:\n"
-        "  delivery_delay, wrong_item, poor_quality, damaged_packaging, "
-        "size_issue, missing_parts, not_as_described, customer_service, "
-        "price_issue, overheating, battery_issue, network_issue, "
-        "display_issue, software_issue, sound_issue, positive_review, other\n"
+        f"  {', '.join(CATEGORY_KEYS)}\n"
         "- brief_issue는 반드시 한국어로 작성하세요 (리뷰가 영어여도 한국어로 번역)\n"
         "- 위 목록에 정확히 맞는 카테고리가 없으면 가장 가까운 것을 선택하세요\n"
     )
+
+
+def build_compact_prompt(reviews_text, review_count, brief_issue=True):
+    """Zero-shot categorization asking for the compact wire format.
+
+    Each review is answered as a positional array [review_number, category code]
+    plus brief_issue only when requested, instead of a keyed object
+    (see core.utils.compact_categories).
+    """
+    codes = ", ".join(f"{code}={key}" for code, key in enumerate(CATEGORY_KEYS))
+    if brief_issue:
+        row_format = '[리뷰 번호, 카테고리 코드, "brief_issue"]'
+        example = '{"c":[[1,0,"택배가 2주 늦게 도착함"],[2,2,"한 번 쓰고 고장남"]]}'
+        brief_rule = "- brief_issue는 반드시 한국어로 짧게 작성하세요 (리뷰가 영어여도 한국어로 번역)\n"
+    else:
+        row_format = "[리뷰 번호, 카테고리 코드]"
+        example = '{"c":[[1,0],[2,2]]}'
+        brief_rule = ""
+    return (
+        _ZERO_SHOT_INTRO.format(reviews_text=reviews_text, review_count=review_count)
+        + f"카테고리 코드: {codes}\n\n"
+        "출력 형식 (JSON, 공백/줄바꿈 없이):\n"
+        f"{example}\n\n"
+        "IMPORTANT RULES:\n"
+        f"- 리뷰마다 {row_format} 배열 하나를 \"c\" 배열에 넣으세요\n"
+        "- 카테고리 코드는 위 목록의 정수만 사용하세요\n"
+        f"{brief_rule}"
+        "- 위 목록에 정확히 맞는 카테고리가 없으면 가장 가까운 것을 선택하세요\n"
+    )
@@ -0,0 +1,129 @@
+"""
+OpenAI 호출용 전역 토큰 버킷 레이트 리미터 (RPM/TPM)
+
+스레드와 코루틴이 같은 버킷을 공유한다. 호출 전에 예상 토큰만큼 예약하고,
+응답의 usage를 받으면 실제 사용량과의 차이를 버킷에 되돌려(또는 추가로 차감해) 맞춘다.
+"""
+
+import asyncio
+import threading
+import time
+
+from core import config
+
+# 토큰 수 추정용 휴리스틱 (한국어/영어 혼합 리뷰 기준 보수적으로 잡음)
+CHARS_PER_TOKEN = 2
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_shared = {"limiter": None}
+_shared_lock = threading.Lock()
+
+
+def estimate_request_tokens(request):
+    """chat.completions 요청의 (입력 + 예상 출력) 토큰 수 추정"""
+    prompt_tokens = sum(
+        len(message["content"]) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+        for message in request["messages"]
+    )
+    completion_tokens = request.get("max_tokens") or config.LLM_ESTIMATED_COMPLETION_TOKENS
+    return prompt_tokens + completion_tokens
+
+
+class TokenBucket:
+    """분당 용량만큼 연속적으로 채워지는 버킷. 음수(대기열)까지 예약 가능"""
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount, now):
+        """amount만큼 차감하고, 잔량이 0 이상이 될 때까지 기다려야 할 초를 반환"""
+        self._refill(now)
+        self.tokens -= amount
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def adjust(self, amount, now):
+        """예약량 보정 (양수면 반환, 음수면 추가 차감)"""
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """RPM/TPM 두 버킷을 함께 예약하는 리미터"""
+
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0, "wait_seconds_total": 0.0,
+                       "wait_seconds_max": 0.0, "token_estimate_error": 0}
+
+    def _reserve(self, estimated_tokens):
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self._requests.reserve(1, now),
+                self._tokens.reserve(estimated_tokens, now),
+            )
+            self._stats["acquired"] += 1
+            if wait > 0:
+                self._stats["waited"] += 1
+                self._stats["wait_seconds_total"] += wait
+                self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], wait)
+        return wait
+
+    def acquire(self, estimated_tokens):
+        """슬롯이 날 때까지 블로킹 대기. 대기한 초를 반환"""
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, estimated_tokens):
+        """acquire의 코루틴 버전 (이벤트 루프를 막지 않음)"""
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def reconcile(self, estimated_tokens, actual_tokens):
+        """응답 usage로 TPM 예약량 보정"""
+        if actual_tokens is None:
+            return
+        with self._lock:
+            self._tokens.adjust(estimated_tokens - actual_tokens, time.monotonic())
+            self._stats["token_estimate_error"] += actual_tokens - estimated_tokens
+
+    def stats(self):
+        """획득 횟수와 대기열 대기 시간 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["wait_seconds_avg"] = (
+            stats["wait_seconds_total"] / stats["acquired"] if stats["acquired"] else 0.0
+        )
+        return stats
+
+
+def get_rate_limiter():
+    """공유 리미터 반환. 비활성화 상태면 None"""
+    if not config.LLM_RATE_LIMIT_ENABLED:
+        return None
+
+    with _shared_lock:
+        limiter = _shared["limiter"]
+        if (
+            limiter is None
+            or limiter.requests_per_minute != config.LLM_RATE_LIMIT_RPM
+            or limiter.tokens_per_minute != config.LLM_RATE_LIMIT_TPM
+        ):
+            limiter = RateLimiter(config.LLM_RATE_LIMIT_RPM, config.LLM_RATE_LIMIT_TPM)
+            _shared["limiter"] = limiter
+    return limiter
@@ -1,5 +1,30 @@
 """Shared category text blocks for prompts."""
 
+# Category keys accepted by the batch categorization prompt; the index is the
+# integer code used by the compact output format
+CATEGORY_KEYS = (
+    "delivery_delay",
+    "wrong_item",
+    "poor_quality",
+    "damaged_packaging",
+    "size_issue",
+    "missing_parts",
+    "not_as_described",
+    "customer_service",
+    "price_issue",
+    "overheating",
+    "battery_issue",
+    "network_issue",
+    "display_issue",
+    "software_issue",
+    "sound_issue",
+    "positive_review",
+    "other",
+)
+
+# The evaluation dataset / fine-tuning label set: the first nine keys plus "other"
+EVALUATION_CATEGORY_KEYS = frozenset(CATEGORY_KEYS[:9] + ("other",))
+
 CATEGORIES_BULLETS = (
     "- delivery_delay: Shipping/delivery took too long\n"
     "- wrong_item: Received incorrect product\n"
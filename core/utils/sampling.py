@@ -0,0 +1,203 @@
+"""
+층화 표본 추출과 모집단 추정
+
+고정 LLM 예산으로 일부 리뷰만 분류할 때, 앞에서부터 자르는 대신
+(평점, 날짜 구간, 길이 구간) 층별로 비례 배분해 표본을 뽑는다.
+분류 결과의 카테고리 건수는 층별 가중치로 모집단 추정치와 신뢰구간으로 되돌린다.
+"""
+
+import math
+from collections import Counter, defaultdict
+
+import numpy as np
+import pandas as pd
+
+from core import config
+from core.categorization_result import CategorizationResult
+
+STRATUM_KEY = "stratum"
+POPULATION_KEY = "population"
+
+
+def _quantile_bucket(values, buckets):
+    """값의 순위 기준 분위 구간 번호 (동률이 많아도 구간이 고르게 나뉘도록 rank 사용)"""
+    buckets = max(1, min(buckets, len(values)))
+    ranks = values.rank(method="first", na_option="bottom")
+    return pd.qcut(ranks, q=buckets, labels=False).astype(int)
+
+
+def assign_strata(df):
+    """리뷰별 층 라벨 ("r<평점>|d<날짜 구간>|l<길이 구간>")"""
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+
+    rating = (
+        df["rating"].fillna(0).round().astype(int)
+        if "rating" in df.columns
+        else pd.Series(0, index=df.index)
+    )
+    date_bucket = (
+        _quantile_bucket(df["created_at"], config.SAMPLING_DATE_BUCKETS)
+        if "created_at" in df.columns
+        else pd.Series(0, index=df.index)
+    )
+    length_bucket = _quantile_bucket(
+        df["review_text"].fillna("").str.len(), config.SAMPLING_LENGTH_BUCKETS
+    )
+    return (
+        "r" + rating.astype(str)
+        + "|d" + date_bucket.astype(str)
+        + "|l" + length_bucket.astype(str)
+    )
+
+
+def _allocate(sizes, n):
+    """층 크기에 비례해 n건 배분 (최대 잉여 방식, 가능하면 층마다 최소 1건)"""
+    quotas = sizes * n / sizes.sum()
+    alloc = np.floor(quotas).astype(int)
+    if n >= len(sizes):
+        alloc = alloc.clip(lower=1)
+    alloc = np.minimum(alloc, sizes)
+
+    remainder = (quotas - np.floor(quotas)).sort_values(ascending=False)
+    while alloc.sum() < n:
+        for stratum in remainder.index:
+            if alloc.sum() >= n:
+                break
+            if alloc[stratum] < sizes[stratum]:
+                alloc[stratum] += 1
+    while alloc.sum() > n:
+        alloc[alloc.idxmax()] -= 1
+    return alloc
+
+
+def stratified_sample(df, n, seed=None, order_keys=None):
+    """
+    df에서 n건을 층화 비례 추출
+
+    order_keys(리뷰 해시 등)를 주면 층마다 키가 가장 작은 리뷰를 고른다(bottom-k).
+    해시는 의사 난수라 층 안에서는 여전히 무작위 표본이면서, 기준/기간을 바꿔 다시
+    돌려도 같은 리뷰가 최대한 다시 뽑혀 이미 분류한 라벨을 재사용할 수 있다.
+
+    Args:
+        df: review_text 컬럼(선택: rating, created_at)이 있는 DataFrame
+        n: 표본 크기
+        seed: 난수 시드 (order_keys가 없을 때)
+        order_keys: df 행 순서대로의 정렬 키
+
+    Returns:
+        (표본 DataFrame(stratum 컬럼 포함, 순서는 섞이거나 키 순), {층 라벨: 모집단 건수})
+    """
+    strata = assign_strata(df)
+    sizes = strata.value_counts()
+    population = {str(k): int(v) for k, v in sizes.items()}
+    if n >= len(df):
+        return df.assign(**{STRATUM_KEY: strata}), population
+
+    alloc = _allocate(sizes, n)
+    labels = strata.to_numpy()
+    if order_keys is not None:
+        positions = _bottom_k_positions(labels, alloc, np.asarray(order_keys))
+    else:
+        positions = _random_positions(labels, alloc, seed)
+    sample = df.iloc[positions].assign(**{STRATUM_KEY: labels[positions]})
+    return sample, population
+
+
+def _bottom_k_positions(labels, alloc, keys):
+    """층마다 정렬 키가 가장 작은 alloc[층]개의 행 위치 (전체를 키 순으로)"""
+    picks = []
+    for stratum, k in alloc.items():
+        members = np.flatnonzero(labels == stratum)
+        picks.append(members[np.argsort(keys[members], kind="stable")[:int(k)]])
+    positions = np.concatenate(picks)
+    return positions[np.argsort(keys[positions], kind="stable")]
+
+
+def _random_positions(labels, alloc, seed):
+    """층마다 무작위 alloc[층]개의 행 위치 (섞은 순서)"""
+    rng = np.random.default_rng(seed)
+    positions = np.concatenate([
+        rng.choice(np.flatnonzero(labels == stratum), size=int(k), replace=False)
+        for stratum, k in alloc.items()
+        if k > 0
+    ])
+    rng.shuffle(positions)
+    return positions
+
+
+def attach_strata(categorization, strata, population):
+    """
+    categorize_issues 결과에 층 정보를 붙임
+
+    Args:
+        categorization: {'categories': [...]} (review_number는 strata 순서 기준 1부터)
+        strata: 분류에 넣은 리뷰 순서대로의 층 라벨 목록
+        population: {층 라벨: 모집단 건수}
+    """
+    for item in categorization.get("categories", []):
+        item[STRATUM_KEY] = strata[item["review_number"] - 1]
+    categorization[POPULATION_KEY] = population
+    return categorization
+
+
+def estimate_category_totals(categorization, z=None):
+    """
+    카테고리별 모집단 건수 추정치와 신뢰구간
+
+    층화 비율 추정: T = Σ N_h p_h,
+    Var(T) = Σ N_h² (1 - n_h/N_h) p_h(1 - p_h) / (n_h - 1)
+
+    표본이 하나도 없는 층의 모집단은 나머지 층의 비율로 채운다(전체 크기로 비례 보정).
+    층 정보가 없으면(전수 분류) 표본 건수를 그대로 추정치로 쓴다.
+
+    Returns:
+        ({카테고리: {'estimate', 'ci_low', 'ci_high'}}, 추정 대상 모집단 크기)
+    """
+    z = config.SAMPLING_CONFIDENCE_Z if z is None else z
+    result = CategorizationResult.of(categorization)
+    population = result.get(POPULATION_KEY)
+    if not population:
+        return {
+            category: {"estimate": count, "ci_low": count, "ci_high": count}
+            for category, count in result.counts().items()
+        }, result.total
+
+    by_stratum = defaultdict(Counter)
+    for item in result["categories"]:
+        by_stratum[item[STRATUM_KEY]][item["category"]] += 1
+
+    totals, variances = _stratified_totals(by_stratum, population)
+    covered = sum(population[stratum] for stratum in by_stratum)
+    population_size = sum(population.values())
+    scale = population_size / covered if covered else 0.0
+    return {
+        category: _interval(total * scale, z * scale * math.sqrt(variances[category]),
+                            population_size)
+        for category, total in totals.items()
+    }, population_size
+
+
+def _stratified_totals(by_stratum, population):
+    """층별 비율로 카테고리별 (건수 추정 합, 분산 합) — 표본이 있는 층만"""
+    totals = defaultdict(float)
+    variances = defaultdict(float)
+    for stratum, counts in by_stratum.items():
+        big_n = population[stratum]
+        n = sum(counts.values())
+        for category, k in counts.items():
+            p = k / n
+            totals[category] += big_n * p
+            if n > 1:
+                variances[category] += (
+                    big_n ** 2 * (1 - n / big_n) * p * (1 - p) / (n - 1)
+                )
+    return totals, variances
+
+
+def _interval(total, margin, population_size):
+    return {
+        "estimate": total,
+        "ci_low": max(0.0, total - margin),
+        "ci_high": min(float(population_size), total + margin),
+    }
@@ -0,0 +1,16 @@
+"""SQLite helpers shared by the on-disk caches and stores."""
+
+import os
+import sqlite3
+
+
+def connect(path, schema):
+    """Open (and create if needed) a WAL-mode SQLite database usable across threads."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    return conn
@@ -0,0 +1,151 @@
+"""
+토큰 예산 기반 프롬프트 패킹
+
+고정 개수(200건)/고정 길이(500자) 대신, 요청당 입력/출력 토큰 예산이 찰 때까지
+리뷰를 채워 넣는다. 긴 리뷰는 문장 경계에서 자른다.
+
+tiktoken이 설치되어 있으면 모델 토크나이저로 세고, 없으면
+rate_limiter와 같은 글자 수 휴리스틱으로 보수적으로 추정한다.
+"""
+
+import functools
+import logging
+import re
+
+from core import config
+from core.utils.rate_limiter import CHARS_PER_TOKEN
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# "12. " 번호와 "\n---\n" 구분자 몫
+REVIEW_SEPARATOR_TOKENS = 4
+FALLBACK_ENCODING = "o200k_base"
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+
+@functools.lru_cache(maxsize=8)
+def _encoding(model):
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception:  # pylint: disable=broad-except
+        # BPE 파일을 받을 수 없는 오프라인 환경 등: 휴리스틱으로 대체
+        logger.warning("tiktoken encoding unavailable, using character heuristic")
+        return None
+
+
+def count_tokens(text, model=None):
+    """text의 토큰 수 (tiktoken이 없으면 글자 수 기반 추정)"""
+    encoding = _encoding(model or config.LLM_MODEL)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _hard_truncate(text, max_tokens, model):
+    encoding = _encoding(model or config.LLM_MODEL)
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+
+
+def truncate_to_tokens(text, max_tokens, model=None):
+    """
+    text를 max_tokens 이하로 자름
+
+    가능한 한 문장 경계에서 자르고, 첫 문장부터 예산을 넘으면 토큰 단위로 자른다.
+    """
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for sentence in filter(None, _SENTENCE_END_RE.split(text)):
+        tokens = count_tokens(sentence, model) + 1
+        if used + tokens > max_tokens:
+            break
+        kept.append(sentence)
+        used += tokens
+    if kept:
+        return " ".join(kept)
+    return _hard_truncate(text, max_tokens, model)
+
+
+class PackedBatch:
+    """한 요청에 들어갈 리뷰 묶음과 토큰 사용량"""
+
+    def __init__(self):
+        self.indices = []
+        self.reviews = []
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def __len__(self):
+        return len(self.reviews)
+
+    def add(self, index, review, input_tokens, output_tokens):
+        self.indices.append(index)
+        self.reviews.append(review)
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+
+def pack_reviews(  # pylint: disable=too-many-arguments
+    reviews,
+    *,
+    overhead_tokens=0,
+    input_budget=None,
+    output_budget=None,
+    review_max_tokens=None,
+    output_tokens_per_review=None,
+    model=None,
+):
+    """
+    리뷰를 입력/출력 토큰 예산에 맞춰 요청 단위로 묶어 순서대로 yield
+
+    Args:
+        reviews: 리뷰 텍스트 목록
+        overhead_tokens: 리뷰를 제외한 프롬프트(지시문, 시스템 프롬프트) 토큰 수
+        input_budget: 요청당 입력 토큰 예산 (기본값: config.LLM_INPUT_TOKEN_BUDGET)
+        output_budget: 요청당 출력 토큰 예산 (기본값: config.LLM_OUTPUT_TOKEN_BUDGET)
+        review_max_tokens: 리뷰 1건 최대 토큰 (기본값: config.LLM_REVIEW_MAX_TOKENS)
+        output_tokens_per_review: 리뷰 1건당 예상 출력 토큰
+            (기본값: config.LLM_CATEGORY_TOKENS_PER_REVIEW)
+        model: 토큰 계산 기준 모델 (기본값: config.LLM_MODEL)
+
+    Yields:
+        PackedBatch (input_tokens에는 overhead_tokens 포함). 각 묶음에는 최소 1건이 들어간다.
+    """
+    input_budget = input_budget or config.LLM_INPUT_TOKEN_BUDGET
+    output_budget = output_budget or config.LLM_OUTPUT_TOKEN_BUDGET
+    review_max_tokens = review_max_tokens or config.LLM_REVIEW_MAX_TOKENS
+    output_tokens_per_review = (
+        output_tokens_per_review or config.LLM_CATEGORY_TOKENS_PER_REVIEW
+    )
+
+    batch = None
+    for index, text in enumerate(reviews):
+        review = truncate_to_tokens(text, review_max_tokens, model)
+        tokens = count_tokens(review, model) + REVIEW_SEPARATOR_TOKENS
+        if batch is not None and (
+            batch.input_tokens + tokens > input_budget
+            or batch.output_tokens + output_tokens_per_review > output_budget
+        ):
+            yield batch
+            batch = None
+        if batch is None:
+            batch = PackedBatch()
+            batch.input_tokens = overhead_tokens
+        batch.add(index, review, tokens, output_tokens_per_review)
+    if batch is not None:
+        yield batch
@@ -6,6 +6,7 @@ E-commerce Review Analysis PoC
 3. 개선 액션 제안 생성
 """
 
+import argparse
 import logging
 import sys
 import traceback
@@ -21,7 +22,11 @@ from core.utils.analysis_workflow import (
     summarize_results,
 )
 from core.utils.cli_helpers import (
+    add_chunked_arguments,
+    add_offline_argument,
+    apply_offline_argument,
     filter_and_check_negative,
+    load_negative_chunked_and_check,
     print_analysis_complete,
     print_section,
     require_openai_key,
@@ -30,11 +35,11 @@ from core.utils.cli_helpers import (
 logger = logging.getLogger(__name__)
 
 
-def load_reviews(loader):
-    """Load reviews from Kaggle dataset."""
+def load_reviews(loader, load=None):
+    """Load reviews from Kaggle dataset (or run `load` with the same error handling)."""
     print_section("Step 1: Loading Data")
     try:
-        df = loader.load_reviews()
+        df = load() if load is not None else loader.load_reviews()
     except FileNotFoundError as e:
         logger.exception("File not found during data loading")
         print(f"\n[Error] File not found: {e}")
@@ -59,26 +64,53 @@ def load_reviews(loader):
     return df
 
 
+def _load_negative_reviews(loader, args):
+    """
+    Load negative reviews, streaming chunks with --chunked.
+
+    Returns:
+        (all reviews or None when chunked, negative reviews, total review count,
+         date range label)
+    """
+    if args.chunked:
+        negative_df, stats = load_reviews(loader, lambda: load_negative_chunked_and_check(
+            loader, loader.iter_olist_reviews(chunk_size=args.chunk_size)
+        ))
+        df, total_reviews = None, stats['total_reviews']
+        first_date, last_date = stats['first_date'], stats['last_date']
+    else:
+        df = load_reviews(loader)
+        negative_df = filter_and_check_negative(loader, df)
+        total_reviews = len(df)
+        first_date, last_date = df['created_at'].min(), df['created_at'].max()
+    date_range = f"분석 기간: {first_date.date()} ~ {last_date.date()}"
+    return df, negative_df, total_reviews, date_range
+
+
 def main():
+    parser = argparse.ArgumentParser(description="E-commerce Review Analysis PoC (Olist)")
+    add_chunked_arguments(parser)
+    add_offline_argument(parser)
+    args = parser.parse_args()
+    apply_offline_argument(args)
+
     print_section("E-commerce Review Analysis PoC")
     require_openai_key()
 
     loader = DataLoader()
     analyzer = ReviewAnalyzer()
 
-    df = load_reviews(loader)
-    negative_df = filter_and_check_negative(loader, df)
+    df, negative_df, total_reviews, date_range = _load_negative_reviews(loader, args)
     recent_df, comparison_df = split_by_period(negative_df, loader)
     recent_categorization, comparison_categorization = analyze_periods(
         analyzer, recent_df, comparison_df
     )
     top_issues, emerging_issues = summarize_results(
-        analyzer, recent_categorization, comparison_categorization
+        analyzer, recent_categorization, comparison_categorization, series="olist"
     )
 
-    generate_and_print_action_plan(analyzer, top_issues, emerging_issues)
-    date_range = f"분석 기간: {df['created_at'].min().date()} ~ {df['created_at'].max().date()}"
-    print_analysis_complete(df, negative_df, date_range)
+    generate_and_print_action_plan(analyzer, top_issues, emerging_issues, scope="olist")
+    print_analysis_complete(df, negative_df, date_range, total_reviews=total_reviews)
 
 
 if __name__ == "__main__":
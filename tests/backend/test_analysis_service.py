@@ -1,6 +1,17 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
 import pandas as pd
 
-from backend.services.analysis_service import _compute_stats
+from backend.services import progress
+from backend.services.analysis_service import (
+    _categorize_periods,
+    _compute_stats,
+    _stream_progress,
+    run_full_analysis,
+)
+from core.analyzer import ReviewAnalyzer
+from core.utils.sampling import attach_strata
 
 
 class TestComputeStats:
@@ -29,3 +40,74 @@ class TestComputeStats:
         result = _compute_stats(df, negative_df, rating_threshold=3)
         assert result["total_reviews"] == 0
         assert result["negative_ratio"] == 0.0
+
+
+class TestStreamProgress:
+    def test_parts_share_one_range(self):
+        recent, comparison = _stream_progress("분류", 35, 75, parts=2)
+
+        recent(5, 10)
+        assert progress.get()["percent"] == 55
+        comparison(0, 10)
+        assert progress.get() == {"step": "분류 (5/20)", "percent": 45}
+        comparison(10, 10)
+        assert progress.get()["percent"] == 65
+
+
+class TestCategorizePeriods:
+    async def test_periods_categorized_concurrently(self, negative_reviews_df):
+        started = []
+        both_started = asyncio.Event()
+
+        async def categorize(period_df, on_progress=None):
+            started.append(len(period_df))
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            on_progress(len(period_df), len(period_df))
+            return {"categories": [], "size": len(period_df)}
+
+        loader = MagicMock()
+        loader.split_by_period.return_value = (
+            negative_reviews_df.iloc[:2], negative_reviews_df.iloc[2:],
+        )
+        analyzer = MagicMock()
+        analyzer.categorize_period_async = categorize
+
+        recent, comparison = await _categorize_periods(loader, analyzer, negative_reviews_df)
+
+        assert recent["size"] == 2
+        assert comparison["size"] == len(negative_reviews_df) - 2
+        total = len(negative_reviews_df)
+        assert progress.get() == {"step": f"최근/이전 리뷰 GPT 분류 중 ({total}/{total})", "percent": 75}
+
+
+class TestRunFullAnalysis:
+    async def test_all_categories_match_top_issue_estimates(
+        self, monkeypatch, sample_reviews_df
+    ):
+        async def categorize(_self, _period_df, **_kwargs):
+            return attach_strata(
+                {"categories": [
+                    {"review_number": 1, "category": "delivery_delay", "brief_issue": "late"},
+                    {"review_number": 2, "category": "poor_quality", "brief_issue": "broken"},
+                    {"review_number": 3, "category": "poor_quality", "brief_issue": "cheap"},
+                ]},
+                ["big", "small", "small"], {"big": 90, "small": 10},
+            )
+
+        async def action_plan(_self, *_args, **_kwargs):
+            return []
+
+        monkeypatch.setattr(ReviewAnalyzer, "categorize_period_async", categorize)
+        monkeypatch.setattr(ReviewAnalyzer, "generate_action_plan_async", action_plan)
+        monkeypatch.setattr(
+            "backend.services.analysis_service.DataLoader.load_custom_csv",
+            lambda _self, _path: sample_reviews_df,
+        )
+        with patch("core.analyzer.get_client", return_value=MagicMock()):
+            result = await run_full_analysis("reviews.csv")
+
+        assert result["all_categories"] == {"delivery_delay": 90, "poor_quality": 10}
+        for issue in result["top_issues"]:
+            assert result["all_categories"][issue["category"]] == issue["count"]
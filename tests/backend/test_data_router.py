@@ -66,6 +66,22 @@ class TestUploadCsv:
         assert data["total_rows"] == 3
         assert len(data["preview"]) == 3
 
+    def test_upload_eval_format_keeps_review_columns(self, client):
+        csv_content = b"id,rating,review_text,note\n1,5,Great,a\n2,1,Terrible,b\n"
+        resp = client.post(
+            "/api/data/upload",
+            files={"file": ("eval.csv", io.BytesIO(csv_content), "text/csv")},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["preview"][0] == {"Ratings": 5, "Reviews": "Great"}
+
+    def test_upload_missing_columns_rejected(self, client):
+        resp = client.post(
+            "/api/data/upload",
+            files={"file": ("bad.csv", io.BytesIO(b"a,b\n1,2\n"), "text/csv")},
+        )
+        assert resp.status_code == 400
+
     def test_upload_non_csv_rejected(self, client):
         resp = client.post(
             "/api/data/upload",
@@ -92,3 +108,18 @@ class TestGetReviews:
         assert len(data["reviews"]) == 2
         assert data["total"] == 5
         assert data["total_pages"] == 3
+
+
+class TestMetrics:
+    def test_metrics_endpoint_prometheus_text(self, client):
+        resp = client.get("/api/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert "# TYPE llm_latency_seconds histogram" in resp.text
+
+    def test_rate_limit_totals_exported_as_counters(self, client, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_RATE_LIMIT_ENABLED", True)
+        resp = client.get("/api/metrics")
+        for name in ("acquired", "waited", "wait_seconds"):
+            assert f"# TYPE llm_rate_limit_{name}_total counter" in resp.text
+        assert "# TYPE llm_rate_limit_wait_seconds_max gauge" in resp.text
@@ -4,6 +4,18 @@ import pandas as pd
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolate_llm_state(monkeypatch):
+    """테스트 간 LLM 캐시/라벨/레이트 리밋 상태가 새지 않도록 기본 비활성화."""
+    monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr("core.config.LABEL_STORE_ENABLED", False)
+    monkeypatch.setattr("core.config.LLM_RATE_LIMIT_ENABLED", False)
+    monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_ENABLED", False)
+    monkeypatch.setattr("core.config.CATEGORY_SERIES_ENABLED", False)
+    monkeypatch.setattr("core.config.ACTION_PLAN_CACHE_ENABLED", False)
+    monkeypatch.setattr("core.config.DATASET_CACHE_ENABLED", False)
+
+
 @pytest.fixture
 def sample_reviews_df():
     """10개 리뷰, 60일 범위, 다양한 평점."""
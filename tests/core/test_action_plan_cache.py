@@ -0,0 +1,98 @@
+import copy
+
+import pytest
+
+from core.utils.action_plan_cache import (
+    ActionPlanCache,
+    changed_materially,
+    issue_profile,
+    profile_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ActionPlanCache(str(tmp_path / "plans.sqlite3"))
+    yield c
+    c.close()
+
+
+def _bumped(issues, count_delta=0, pct_delta=0.0):
+    issues = copy.deepcopy(issues)
+    issues[0]["count"] += count_delta
+    issues[0]["percentage"] += pct_delta
+    return issues
+
+
+class TestIssueProfile:
+    def test_ignores_examples_and_emerging_order(self, sample_top_issues):
+        emerging = [
+            {"category": "b", "recent_count": 3, "comparison_count": 1},
+            {"category": "a", "recent_count": 5, "comparison_count": 2},
+        ]
+        profile = issue_profile(sample_top_issues, emerging)
+        reordered = issue_profile(
+            [{**issue, "examples": []} for issue in sample_top_issues], emerging[::-1]
+        )
+
+        assert profile == reordered
+        assert [row[0] for row in profile["emerging"]] == ["a", "b"]
+
+    def test_key_depends_on_categories_not_counts(self, sample_top_issues):
+        profile = issue_profile(sample_top_issues, [])
+        bumped = issue_profile(_bumped(sample_top_issues, count_delta=100), [])
+        reordered = issue_profile(sample_top_issues[::-1], [])
+
+        assert profile_key("s", "m", "t", profile) == profile_key("s", "m", "t", bumped)
+        assert profile_key("s", "m", "t", profile) != profile_key("s", "m", "t", reordered)
+        assert profile_key("s", "m", "t", profile) != profile_key("other", "m", "t", profile)
+
+
+class TestChangedMaterially:
+    def test_within_tolerance(self, sample_top_issues, monkeypatch):
+        monkeypatch.setattr("core.config.ACTION_PLAN_COUNT_TOLERANCE", 0.25)
+        monkeypatch.setattr("core.config.ACTION_PLAN_PERCENT_TOLERANCE", 2.0)
+        profile = issue_profile(sample_top_issues, [])
+
+        assert not changed_materially(
+            profile, issue_profile(_bumped(sample_top_issues, 1, 1.5), [])
+        )
+
+    def test_count_or_percentage_outside_tolerance(self, sample_top_issues, monkeypatch):
+        monkeypatch.setattr("core.config.ACTION_PLAN_COUNT_TOLERANCE", 0.25)
+        monkeypatch.setattr("core.config.ACTION_PLAN_PERCENT_TOLERANCE", 2.0)
+        profile = issue_profile(sample_top_issues, [])
+
+        assert changed_materially(profile, issue_profile(_bumped(sample_top_issues, 2), []))
+        assert changed_materially(
+            profile, issue_profile(_bumped(sample_top_issues, pct_delta=2.5), [])
+        )
+
+    def test_emerging_counts(self, sample_top_issues, sample_emerging_issues):
+        profile = issue_profile(sample_top_issues, sample_emerging_issues)
+        surged = copy.deepcopy(sample_emerging_issues)
+        surged[0]["recent_count"] *= 2
+
+        assert changed_materially(profile, issue_profile(sample_top_issues, surged))
+
+
+class TestActionPlanCache:
+    def test_reuses_until_material_change(self, cache, sample_top_issues):
+        profile = issue_profile(sample_top_issues, [])
+        key = profile_key("s", "m", "t", profile)
+        assert cache.get(key, profile) is None
+
+        cache.set(key, profile, ["plan"])
+
+        assert cache.get(key, profile) == ["plan"]
+        changed = issue_profile(_bumped(sample_top_issues, 10), [])
+        assert cache.get(key, changed) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_expired_entry_not_reused(self, tmp_path, sample_top_issues):
+        cache = ActionPlanCache(str(tmp_path / "plans.sqlite3"), ttl_seconds=-1)
+        profile = issue_profile(sample_top_issues, [])
+        cache.set("k", profile, ["plan"])
+
+        assert cache.get("k", profile) is None
+        cache.close()
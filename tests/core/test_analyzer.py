@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from core.analyzer import ReviewAnalyzer
+from core.utils.category_series import get_category_series_store
+from core.utils.review_categories import CATEGORY_KEYS
+from core.utils.sampling import attach_strata
 
 
 @pytest.fixture
@@ -153,7 +157,9 @@ class TestCategorizeIssues:
             result = analyzer.categorize_issues(["Bad product"])
         assert "categories" in result
 
-    def test_samples_at_200(self, analyzer):
+    def test_packs_up_to_output_budget(self, analyzer, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_OUTPUT_TOKEN_BUDGET", 40 * 120)
+        monkeypatch.setattr("core.config.LLM_CATEGORY_TOKENS_PER_REVIEW", 40)
         reviews = [f"Review {i}" for i in range(300)]
         ret = '{"categories": []}'
         with patch("core.analyzer.call_openai_json",
@@ -162,7 +168,28 @@ class TestCategorizeIssues:
                 mf.return_value = "formatted"
                 analyzer.categorize_issues(reviews)
                 called = mf.call_args[0][0]
-                assert len(called) == 200
+                assert len(called) == 120
+
+    def test_sample_size_is_hard_cap(self, analyzer):
+        reviews = [f"Review {i}" for i in range(300)]
+        ret = '{"categories": []}'
+        with patch("core.analyzer.call_openai_json",
+                    return_value=ret):
+            with patch("core.analyzer.format_reviews") as mf:
+                mf.return_value = "formatted"
+                analyzer.categorize_issues(reviews, sample_size=50)
+                assert len(mf.call_args[0][0]) == 50
+
+    def test_reviews_over_input_budget_left_out(self, analyzer, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_INPUT_TOKEN_BUDGET", 1)
+        resp = json.dumps({"categories": [
+            {"review_number": 1, "category": "poor_quality", "brief_issue": "x"},
+        ]})
+        with patch("core.analyzer.call_openai_json", return_value=resp) as mock_call:
+            result = analyzer.categorize_issues(["first", "second"])
+
+        assert "1개의" in mock_call.call_args[0][1]
+        assert [c["review_number"] for c in result["categories"]] == [1]
 
     def test_raises_on_parse_failure(self, analyzer):
         with patch("core.analyzer.call_openai_json",
@@ -176,6 +203,402 @@ class TestCategorizeIssues:
                     analyzer.categorize_issues(["Review"])
 
 
+class TestCategorizeIssuesCompact:
+    @pytest.fixture(autouse=True)
+    def compact_output(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_COMPACT_OUTPUT", True)
+
+    def test_decodes_compact_rows(self, analyzer):
+        resp = json.dumps({"c": [[1, 0, "late"], [2, 99, "?"]]})
+        with patch("core.analyzer.call_openai_json", return_value=resp) as mock_call:
+            result = analyzer.categorize_issues(["Late", "Odd"])
+
+        assert '{"c":[[' in mock_call.call_args[0][1]
+        assert [(c["review_number"], c["category"]) for c in result["categories"]] == [
+            (1, CATEGORY_KEYS[0]), (2, "other"),
+        ]
+
+    def test_packs_more_reviews_per_call(self, analyzer, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_OUTPUT_TOKEN_BUDGET", 40 * 120)
+        monkeypatch.setattr("core.config.LLM_CATEGORY_TOKENS_PER_REVIEW", 40)
+        monkeypatch.setattr("core.config.LLM_COMPACT_TOKENS_PER_REVIEW", 20)
+        reviews = [f"Review {i}" for i in range(300)]
+        with patch("core.analyzer.call_openai_json", return_value='{"c": []}'):
+            with patch("core.analyzer.format_reviews") as mf:
+                mf.return_value = "formatted"
+                analyzer.categorize_issues(reviews)
+                assert len(mf.call_args_list[0][0][0]) == 240
+
+    def test_standard_response_still_accepted(self, analyzer):
+        resp = json.dumps({"categories": [
+            {"review_number": 1, "category": "poor_quality", "brief_issue": "Bad"},
+        ]})
+        with patch("core.analyzer.call_openai_json", return_value=resp):
+            result = analyzer.categorize_issues(["Bad product"])
+
+        assert result["categories"][0]["category"] == "poor_quality"
+
+
+class TestCategorizeIssuesMemo:
+    @pytest.fixture
+    def memo_analyzer(self, analyzer, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LABEL_STORE_ENABLED", True)
+        monkeypatch.setattr("core.config.LABEL_STORE_PATH", str(tmp_path / "labels.sqlite3"))
+        return analyzer
+
+    def _response(self, *categories):
+        return json.dumps({"categories": [
+            {"review_number": i, "category": cat, "brief_issue": f"issue {i}"}
+            for i, cat in enumerate(categories, 1)
+        ]})
+
+    def test_only_unseen_reviews_sent(self, memo_analyzer):
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("delivery_delay", "poor_quality")):
+            memo_analyzer.categorize_issues(["late", "broken"])
+
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("wrong_item")) as mock_call:
+            result = memo_analyzer.categorize_issues(["late", "wrong color", "broken"])
+
+        prompt = mock_call.call_args[0][1]
+        assert "wrong color" in prompt
+        assert "1개의" in prompt
+        assert [(c["review_number"], c["category"]) for c in result["categories"]] == [
+            (1, "delivery_delay"), (2, "wrong_item"), (3, "poor_quality"),
+        ]
+
+    def test_all_hits_skip_llm(self, memo_analyzer):
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("delivery_delay")):
+            memo_analyzer.categorize_issues(["late"])
+
+        with patch("core.analyzer.call_openai_json") as mock_call:
+            result = memo_analyzer.categorize_issues(["  LATE "])
+
+        mock_call.assert_not_called()
+        assert result["categories"][0]["category"] == "delivery_delay"
+
+    def test_duplicate_reviews_sent_once(self, memo_analyzer):
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("delivery_delay")) as mock_call:
+            result = memo_analyzer.categorize_issues(["late", "late"])
+
+        assert "1개의" in mock_call.call_args[0][1]
+        assert len(result["categories"]) == 2
+
+    def test_near_duplicates_sent_once_and_weighted(self, memo_analyzer):
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("delivery_delay", "poor_quality")) as mock_call:
+            result = memo_analyzer.categorize_issues(
+                ["배송이 너무 늦어요!!", "품질이 별로", "배송이 너무 늦어요 ㅠㅠ"]
+            )
+
+        assert "2개의" in mock_call.call_args[0][1]
+        assert result.counts() == {"delivery_delay": 2, "poor_quality": 1}
+
+        with patch("core.analyzer.call_openai_json") as mock_call:
+            memo_analyzer.categorize_issues(["배송이 너무 늦어요 ㅠㅠ"])
+        mock_call.assert_not_called()
+
+    def test_dedup_disabled_sends_every_variant(self, analyzer, monkeypatch):
+        monkeypatch.setattr("core.config.DEDUP_ENABLED", False)
+        with patch("core.analyzer.call_openai_json",
+                   return_value=self._response("a", "a")) as mock_call:
+            analyzer.categorize_issues(["늦어요!!", "늦어요"])
+
+        assert "2개의" in mock_call.call_args[0][1]
+
+    def test_out_of_range_review_number_ignored(self, analyzer):
+        resp = json.dumps({"categories": [
+            {"review_number": 5, "category": "other", "brief_issue": "x"},
+        ]})
+        with patch("core.analyzer.call_openai_json", return_value=resp):
+            result = analyzer.categorize_issues(["only one"])
+        assert result == {"categories": []}
+
+
+class TestCategorizeIssuesLocalCascade:
+    @pytest.fixture
+    def confident_classifier(self):
+        classifier = MagicMock()
+        classifier.label_confident.side_effect = lambda texts: {
+            h: {"category": "delivery_delay", "brief_issue": "", "source": "local"}
+            for h, text in texts.items()
+            if "배송" in text
+        }
+        with patch("core.analyzer.get_local_classifier", return_value=classifier):
+            yield classifier
+
+    @pytest.mark.usefixtures("confident_classifier")
+    def test_only_unconfident_reviews_sent(self, analyzer):
+        resp = json.dumps({"categories": [
+            {"review_number": 1, "category": "poor_quality", "brief_issue": "고장"},
+        ]})
+        with patch("core.analyzer.call_openai_json", return_value=resp) as mock_call:
+            result = analyzer.categorize_issues(["배송이 늦어요", "고장났어요"])
+
+        prompt = mock_call.call_args[0][1]
+        assert "고장났어요" in prompt and "배송이 늦어요" not in prompt
+        assert [(c["review_number"], c["category"]) for c in result["categories"]] == [
+            (1, "delivery_delay"), (2, "poor_quality"),
+        ]
+        assert result["categories"][0]["source"] == "local"
+        examples = {i["category"]: i["examples"] for i in analyzer.get_top_issues(result)}
+        assert examples == {"delivery_delay": [], "poor_quality": ["고장"]}
+
+    @pytest.mark.usefixtures("confident_classifier")
+    def test_all_confident_skips_llm(self, analyzer):
+        with patch("core.analyzer.call_openai_json") as mock_call:
+            result = analyzer.categorize_issues(["배송이 늦어요", "배송 지연"])
+
+        mock_call.assert_not_called()
+        assert result.counts() == {"delivery_delay": 2}
+
+    async def test_async_planning_runs_off_event_loop(self, analyzer):
+        def train_classifier(*_args):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()  # no loop in a worker thread
+
+        resp = json.dumps({"categories": [
+            {"review_number": 1, "category": "poor_quality", "brief_issue": "고장"},
+        ]})
+        with patch("core.analyzer.get_local_classifier", side_effect=train_classifier) as mock, \
+                patch("core.analyzer.call_openai_json_async", return_value=resp):
+            result = await analyzer.categorize_issues_async(["고장났어요"])
+
+        mock.assert_called_once()
+        assert result.counts() == {"poor_quality": 1}
+
+
+class TestCategorizeIssuesMapReduce:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CATEGORY_TOKENS_PER_REVIEW", 40)
+        monkeypatch.setattr("core.config.LLM_OUTPUT_TOKEN_BUDGET", 40 * 3)
+
+    @staticmethod
+    def _echo_response(_client, prompt, **_kwargs):
+        count = int(prompt.split("아래는 ", 1)[1].split("개의", 1)[0])
+        return json.dumps({"categories": [
+            {"review_number": i, "category": "delivery_delay", "brief_issue": str(i)}
+            for i in range(1, count + 1)
+        ]})
+
+    def test_every_review_categorized_and_renumbered(self, analyzer):
+        reviews = [f"Review {i}" for i in range(8)]
+        with patch("core.analyzer.call_openai_json",
+                   side_effect=self._echo_response) as mock_call:
+            result = analyzer.categorize_issues(reviews, full_corpus=True)
+
+        assert mock_call.call_count == 3
+        assert [c["review_number"] for c in result["categories"]] == list(range(1, 9))
+        assert analyzer.get_top_issues(result)[0]["count"] == 8
+
+    def test_unparsable_chunk_skipped(self, analyzer):
+        def respond(client, prompt, **kwargs):
+            if "Review 0" in prompt:
+                return "not json"
+            return self._echo_response(client, prompt, **kwargs)
+
+        with patch("core.analyzer.call_openai_json", side_effect=respond):
+            result = analyzer.categorize_issues(
+                [f"Review {i}" for i in range(6)], full_corpus=True
+            )
+
+        assert [c["review_number"] for c in result["categories"]] == [4, 5, 6]
+
+    async def test_async_bounded_concurrency(self, analyzer, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_MAP_REDUCE_CONCURRENCY", 2)
+        state = {"running": 0, "peak": 0}
+
+        async def respond(prompt, **_kwargs):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            return self._echo_response(None, prompt)
+
+        with patch("core.analyzer.call_openai_json_async", side_effect=respond):
+            result = await analyzer.categorize_issues_async(
+                [f"Review {i}" for i in range(12)], full_corpus=True
+            )
+
+        assert len(result["categories"]) == 12
+        assert state["peak"] == 2
+
+
+class TestPopulationEstimates:
+    @pytest.fixture
+    def weighted_categorization(self):
+        categorization = {"categories": [
+            {"review_number": 1, "category": "delivery_delay", "brief_issue": "late"},
+            {"review_number": 2, "category": "poor_quality", "brief_issue": "broken"},
+            {"review_number": 3, "category": "poor_quality", "brief_issue": "cheap"},
+        ]}
+        return attach_strata(
+            categorization, ["big", "small", "small"], {"big": 90, "small": 10}
+        )
+
+    def test_top_issues_ranked_by_estimate(self, analyzer, weighted_categorization):
+        result = analyzer.get_top_issues(weighted_categorization)
+
+        assert result[0]["category"] == "delivery_delay"
+        assert result[0]["count"] == 90
+        assert result[0]["sample_count"] == 1
+        assert result[0]["percentage"] == 90.0
+        assert "percentage_ci" in result[0]
+
+    def test_action_plan_prompt_uses_estimated_count(self, analyzer, weighted_categorization):
+        top_issues = analyzer.get_top_issues(weighted_categorization)
+        prompt = analyzer._build_action_plan_prompt(  # pylint: disable=protected-access
+            top_issues, []
+        )
+
+        assert "(90건 추정, 표본 1건 기준, 90.0%)" in prompt
+
+    def test_emerging_uses_estimates(self, analyzer, weighted_categorization):
+        comparison = attach_strata(
+            {"categories": [{"review_number": 1, "category": "delivery_delay"}]},
+            ["big"], {"big": 30},
+        )
+        result = analyzer.detect_emerging_issues(weighted_categorization, comparison)
+        delivery = next(r for r in result if r["category"] == "delivery_delay")
+
+        assert delivery["recent_count"] == 90
+        assert delivery["comparison_count"] == 30
+        assert delivery["increase_rate"] == 200.0
+        assert "recent_ci" in delivery
+
+    def test_categorize_period_samples_and_attaches_strata(
+        self, analyzer, sample_reviews_df, monkeypatch
+    ):
+        monkeypatch.setattr("core.config.CATEGORIZATION_SAMPLE_SIZE", 4)
+        resp = json.dumps({"categories": [
+            {"review_number": i, "category": "other", "brief_issue": ""}
+            for i in range(1, 5)
+        ]})
+        with patch("core.analyzer.call_openai_json", return_value=resp):
+            result = analyzer.categorize_period(sample_reviews_df)
+
+        assert len(result["categories"]) == 4
+        assert sum(result["population"].values()) == len(sample_reviews_df)
+        assert analyzer.get_top_issues(result)[0]["count"] == len(sample_reviews_df)
+        assert all("day" in item for item in result["categories"])
+
+    async def test_async_period_sampling_runs_off_event_loop(
+        self, analyzer, sample_reviews_df, monkeypatch
+    ):
+        monkeypatch.setattr("core.config.CATEGORIZATION_SAMPLE_SIZE", 4)
+
+        def label_store():
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()  # no loop in a worker thread
+
+        resp = json.dumps({"categories": [
+            {"review_number": i, "category": "other", "brief_issue": ""}
+            for i in range(1, 5)
+        ]})
+        with patch("core.analyzer.get_label_store", side_effect=label_store) as mock, \
+                patch("core.analyzer.call_openai_json_async", return_value=resp):
+            result = await analyzer.categorize_period_async(sample_reviews_df)
+
+        assert mock.called
+        assert sum(result["population"].values()) == len(sample_reviews_df)
+
+
+class TestReanalysisReusesLabels:
+    @pytest.fixture
+    def memo_analyzer(self, analyzer, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LABEL_STORE_ENABLED", True)
+        monkeypatch.setattr("core.config.LABEL_STORE_PATH", str(tmp_path / "labels.sqlite3"))
+        monkeypatch.setattr("core.config.CATEGORIZATION_SAMPLE_SIZE", 4)
+        return analyzer
+
+    @staticmethod
+    def _response(n):
+        return json.dumps({"categories": [
+            {"review_number": i, "category": "other", "brief_issue": ""}
+            for i in range(1, n + 1)
+        ]})
+
+    def test_same_sample_on_rerun(self, memo_analyzer, sample_reviews_df):
+        with patch("core.analyzer.call_openai_json", return_value=self._response(4)):
+            first = memo_analyzer.categorize_period(sample_reviews_df)
+
+        with patch("core.analyzer.call_openai_json") as mock_call:
+            second = memo_analyzer.categorize_period(sample_reviews_df)
+
+        mock_call.assert_not_called()
+        assert second["categories"] == first["categories"]
+
+    def test_fully_labeled_period_is_census(self, memo_analyzer, sample_reviews_df):
+        reviews = sample_reviews_df["review_text"].tolist()
+        with patch("core.analyzer.call_openai_json", return_value=self._response(10)):
+            memo_analyzer.categorize_issues(reviews, full_corpus=True)
+
+        with patch("core.analyzer.call_openai_json") as mock_call:
+            result = memo_analyzer.categorize_period(sample_reviews_df)
+
+        mock_call.assert_not_called()
+        assert "population" not in result
+        assert result.total == len(sample_reviews_df)
+
+
+class TestUpdateIssueSeries:
+    @pytest.fixture
+    def series_store(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.CATEGORY_SERIES_ENABLED", True)
+        monkeypatch.setattr(
+            "core.config.CATEGORY_SERIES_PATH", str(tmp_path / "series.sqlite3")
+        )
+        return get_category_series_store()
+
+    @pytest.mark.usefixtures("series_store")
+    def test_records_counts_and_reports_surges(self, analyzer):
+        history = {"categories": [
+            {"review_number": n, "category": "delivery_delay", "day": f"2024-01-{day:02d}"}
+            for n, day in enumerate((d for d in range(1, 11) for _ in range(2)), 1)
+        ]}
+        spike = {"categories": [
+            {"review_number": n, "category": "delivery_delay", "day": "2024-01-11"}
+            for n in range(1, 16)
+        ]}
+
+        surges = analyzer.update_issue_series("shop", history, spike)
+
+        assert [s["category"] for s in surges] == ["delivery_delay"]
+        assert surges[0]["count"] == 15
+
+    def test_boundary_day_counts_summed(self, analyzer, series_store):
+        comparison = {"categories": [
+            {"review_number": 1, "category": "a", "day": "2024-01-01"},
+            {"review_number": 2, "category": "b", "day": "2024-01-01"},
+        ]}
+        recent = {"categories": [{"review_number": 1, "category": "a", "day": "2024-01-01"}]}
+
+        analyzer.update_issue_series("shop", comparison, recent)
+
+        assert series_store.daily_counts("shop") == {"2024-01-01": {"a": 2.0, "b": 1.0}}
+
+    def test_sampled_spike_not_a_surge(self, analyzer, series_store):
+        history = {"categories": [
+            {"review_number": n, "category": "delivery_delay", "day": f"2024-01-{day:02d}"}
+            for n, day in enumerate((d for d in range(1, 11) for _ in range(2)), 1)
+        ]}
+        # One sampled review standing for 50 reviews of its stratum
+        spike = {"categories": [
+            {"review_number": 1, "category": "delivery_delay", "day": "2024-01-11"}
+        ]}
+        attach_strata(spike, ["s"], {"s": 50})
+
+        assert not analyzer.update_issue_series("shop", history, spike)
+        assert not series_store.daily_counts("shop")
+
+    def test_disabled_returns_nothing(self, analyzer):
+        assert not analyzer.update_issue_series("shop", {"categories": []})
+
+
 # ── generate_action_plan (mocked LLM) ──
 
 
@@ -218,3 +641,53 @@ class TestGenerateActionPlan:
             analyzer.generate_action_plan(sample_top_issues, [])
             prompt_arg = mock_call.call_args[0][1]
             assert "No significant emerging issues" in prompt_arg
+
+
+class TestActionPlanCaching:
+    @pytest.fixture(autouse=True)
+    def plan_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.ACTION_PLAN_CACHE_ENABLED", True)
+        monkeypatch.setattr(
+            "core.config.ACTION_PLAN_CACHE_PATH", str(tmp_path / "plans.sqlite3")
+        )
+
+    def test_unchanged_issues_reuse_plan(
+        self, analyzer, sample_top_issues, sample_emerging_issues,
+    ):
+        resp = json.dumps({"recommendations": ["액션 1"]})
+        with patch("core.analyzer.call_openai_json", return_value=resp) as mock_call:
+            first = analyzer.generate_action_plan(
+                sample_top_issues, sample_emerging_issues, scope="p"
+            )
+            second = analyzer.generate_action_plan(
+                sample_top_issues, sample_emerging_issues, scope="p"
+            )
+
+        assert first == second == ["액션 1"]
+        assert mock_call.call_count == 1
+
+    def test_material_change_or_other_scope_regenerates(
+        self, analyzer, sample_top_issues, sample_emerging_issues,
+    ):
+        resp = json.dumps({"recommendations": ["액션 1"]})
+        grown = [{**issue, "count": issue["count"] * 3} for issue in sample_top_issues]
+        with patch("core.analyzer.call_openai_json", return_value=resp) as mock_call:
+            analyzer.generate_action_plan(sample_top_issues, sample_emerging_issues, scope="p")
+            analyzer.generate_action_plan(grown, sample_emerging_issues, scope="p")
+            analyzer.generate_action_plan(grown, sample_emerging_issues, scope="q")
+
+        assert mock_call.call_count == 3
+
+    def test_async_shares_cache(
+        self, analyzer, sample_top_issues, sample_emerging_issues,
+    ):
+        resp = json.dumps({"recommendations": ["액션 1"]})
+        with patch("core.analyzer.call_openai_json", return_value=resp):
+            analyzer.generate_action_plan(sample_top_issues, sample_emerging_issues, scope="p")
+        with patch("core.analyzer.call_openai_json_async") as mock_async:
+            result = asyncio.run(analyzer.generate_action_plan_async(
+                sample_top_issues, sample_emerging_issues, scope="p"
+            ))
+
+        assert result == ["액션 1"]
+        mock_async.assert_not_called()
@@ -0,0 +1,48 @@
+import json
+
+from core.categorization_result import CategorizationResult
+
+
+class TestCategorizationResult:
+    def test_counts_and_most_common(self, sample_categorization):
+        result = CategorizationResult.of(sample_categorization)
+
+        assert result.total == 10
+        assert result.count("delivery_delay") == 4
+        assert result.count("unknown") == 0
+        assert result.most_common(2) == [("delivery_delay", 4), ("poor_quality", 3)]
+        assert sum(result.counts().values()) == 10
+
+    def test_examples_in_original_order(self, sample_categorization):
+        result = CategorizationResult.of(sample_categorization)
+
+        assert result.examples("poor_quality", 2) == [
+            "Product broke after one day", "Quality below expectations",
+        ]
+        assert [item["review_number"] for item in result.items_for("wrong_item")] == [6]
+        assert result.examples("unknown") == []
+
+    def test_examples_skip_items_without_summary(self):
+        result = CategorizationResult([
+            {"category": "delivery_delay", "brief_issue": "", "source": "local"},
+            {"category": "delivery_delay", "brief_issue": "Late"},
+            {"category": "delivery_delay"},
+            {"category": "delivery_delay", "brief_issue": "Slow"},
+        ])
+
+        assert result.examples("delivery_delay") == ["Late", "Slow"]
+
+    def test_behaves_like_plain_result(self, sample_categorization):
+        result = CategorizationResult.of(sample_categorization)
+
+        assert result["categories"] == sample_categorization["categories"]
+        assert json.loads(json.dumps(result)) == sample_categorization
+
+    def test_of_returns_existing_instance(self):
+        result = CategorizationResult([{"category": "other"}])
+        assert CategorizationResult.of(result) is result
+
+    def test_keeps_population(self):
+        result = CategorizationResult.of({"categories": [], "population": {"s": 3}})
+        assert result["population"] == {"s": 3}
+        assert result.total == 0
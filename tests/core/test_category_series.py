@@ -0,0 +1,170 @@
+import pytest
+
+from core.utils.category_series import (
+    CategorySeriesStore,
+    attach_days,
+    daily_category_counts,
+    detector_step,
+    poisson_sf,
+)
+from core.utils.sampling import attach_strata
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = CategorySeriesStore(str(tmp_path / "series.sqlite3"))
+    yield s
+    s.close()
+
+
+def _days(start, n):
+    return [f"2024-01-{day:02d}" for day in range(start, start + n)]
+
+
+class TestDailyCounts:
+    def test_attach_days_by_review_number(self):
+        categorization = {"categories": [
+            {"review_number": 2, "category": "a"},
+            {"review_number": 1, "category": "b"},
+        ]}
+        attach_days(categorization, ["2024-01-01 10:00", "2024-01-02 23:59"])
+
+        assert [item["day"] for item in categorization["categories"]] == [
+            "2024-01-02", "2024-01-01",
+        ]
+
+    def test_unparsable_dates_left_out(self):
+        categorization = {"categories": [{"review_number": 1, "category": "a"}]}
+        attach_days(categorization, ["not a date"])
+
+        assert daily_category_counts(categorization) == {}
+
+    def test_counts_exact_reviews(self):
+        categorization = {"categories": [
+            {"review_number": 1, "category": "a", "day": "2024-01-01"},
+            {"review_number": 2, "category": "a", "day": "2024-01-01"},
+            {"review_number": 3, "category": "b", "day": "2024-01-02"},
+        ]}
+
+        assert daily_category_counts(categorization) == {
+            "2024-01-01": {"a": 2.0},
+            "2024-01-02": {"b": 1.0},
+        }
+
+    def test_sampled_counts_rejected(self):
+        categorization = {"categories": [
+            {"review_number": 1, "category": "a", "day": "2024-01-01"},
+        ]}
+        attach_strata(categorization, ["s"], {"s": 50})
+
+        with pytest.raises(ValueError):
+            daily_category_counts(categorization)
+
+
+class TestDetector:
+    def test_poisson_sf(self):
+        assert poisson_sf(0, 2.0) == 1.0
+        assert poisson_sf(1, 2.0) == pytest.approx(1 - 0.1353352832)
+        assert poisson_sf(10, 1.0) == pytest.approx(1.1142547e-7, rel=1e-4)
+
+    def test_no_surge_during_warmup(self, monkeypatch):
+        monkeypatch.setattr("core.config.EMERGING_WARMUP_DAYS", 3)
+        state = None
+        for _ in range(3):
+            state, step = detector_step(state, 50)
+            assert not step["surge"]
+
+    def test_spike_after_stable_baseline(self):
+        state = None
+        for _ in range(10):
+            state, step = detector_step(state, 2)
+            assert not step["surge"]
+
+        state, step = detector_step(state, 12)
+        assert step["surge"]
+        assert step["p_value"] < 1e-4
+        assert step["expected"] == pytest.approx(2.0)
+        assert state["cusum"] == 0.0
+
+    def test_sustained_small_increase_caught_by_cusum(self, monkeypatch):
+        monkeypatch.setattr("core.config.EMERGING_P_VALUE", 1e-9)
+        state = None
+        for _ in range(10):
+            state, _ = detector_step(state, 4)
+
+        flagged = []
+        for _ in range(5):
+            state, step = detector_step(state, 9)
+            flagged.append(step["surge"])
+        assert any(flagged)
+
+
+class TestCategorySeriesStore:
+    def test_detector_is_incremental(self, store):
+        store.record_counts("p", {day: {"delivery_delay": 2} for day in _days(1, 10)})
+        assert store.update_detector("p") == []
+
+        store.record_counts("p", {"2024-01-11": {"delivery_delay": 15, "poor_quality": 1}})
+        surges = store.update_detector("p")
+
+        assert [(s["day"], s["category"]) for s in surges] == [("2024-01-11", "delivery_delay")]
+        assert store.update_detector("p") == []
+        assert store.surges("p") == surges
+
+    def test_stable_series_never_surges(self, store):
+        store.record_counts("p", {day: {"a": 3} for day in _days(1, 20)})
+        assert store.update_detector("p") == []
+
+    def test_reset_replays_stored_counts(self, store):
+        store.record_counts("p", {day: {"a": 2} for day in _days(1, 10)})
+        store.record_counts("p", {"2024-01-11": {"a": 15}, "2024-01-12": {"b": 1}})
+        first = store.update_detector("p")
+
+        store.reset_detector("p")
+        assert store.update_detector("p") == first
+        assert store.daily_counts("p", since="2024-01-12") == {"2024-01-12": {"b": 1.0}}
+
+    def test_quiet_days_decay_the_baseline(self, store):
+        store.record_counts("p", {day: {"a": 5} for day in _days(1, 10)})
+        store.update_detector("p")
+
+        # 2024-01-11 .. 2024-01-30 have no reviews at all
+        store.record_counts("p", {"2024-01-31": {"a": 4}})
+        surges = store.update_detector("p")
+
+        assert [(s["day"], s["category"]) for s in surges] == [("2024-01-31", "a")]
+        assert surges[0]["expected"] < 1.0
+
+    def test_days_behind_cursor_skipped_without_warning(self, store, caplog):
+        store.record_counts("p", {day: {"a": 2} for day in _days(1, 10)})
+        store.update_detector("p")
+
+        with caplog.at_level("WARNING"):
+            store.record_counts("p", {"2024-01-10": {"a": 9}, "2024-01-11": {"a": 2}})
+        assert not caplog.records
+
+        assert store.daily_counts("p", since="2024-01-10") == {
+            "2024-01-10": {"a": 2.0}, "2024-01-11": {"a": 2.0},
+        }
+
+    def test_replay_rebuilds_detector_from_stored_counts(self, store):
+        store.record_counts("p", {day: {"a": 2} for day in _days(1, 11)})
+        store.update_detector("p")
+
+        store.record_counts("p", {"2024-01-11": {"a": 15}}, replay=True)
+        surges = store.update_detector("p")
+
+        assert [(s["day"], s["count"]) for s in surges] == [("2024-01-11", 15.0)]
+
+    def test_rerecording_a_day_replaces_it(self, store):
+        store.record_counts("p", {"2024-01-01": {"a": 3, "b": 1}})
+        store.record_counts("p", {"2024-01-01": {"a": 2}})
+
+        assert store.daily_counts("p") == {"2024-01-01": {"a": 2.0}}
+
+    def test_series_are_independent(self, store):
+        store.record_counts("p", {day: {"a": 1} for day in _days(1, 10)})
+        store.update_detector("p")
+
+        store.record_counts("q", {"2024-01-11": {"a": 20}})
+        assert store.update_detector("q") == []
@@ -0,0 +1,44 @@
+from core.utils.compact_categories import decode_categories, decode_category_item
+from core.utils.review_categories import CATEGORY_KEYS
+
+
+class TestDecodeCategoryItem:
+    def test_row_with_brief_issue(self):
+        assert decode_category_item([1, 0, "late"]) == {
+            "review_number": 1,
+            "category": CATEGORY_KEYS[0],
+            "brief_issue": "late",
+        }
+
+    def test_row_without_brief_issue(self):
+        item = decode_category_item([3, CATEGORY_KEYS.index("wrong_item")])
+        assert item == {"review_number": 3, "category": "wrong_item", "brief_issue": ""}
+
+    def test_category_key_string_accepted(self):
+        assert decode_category_item([1, "wrong_item"])["category"] == "wrong_item"
+
+    def test_unknown_code_falls_back_to_other(self):
+        assert decode_category_item([1, 99])["category"] == "other"
+        assert decode_category_item([1, "nonsense"])["category"] == "other"
+
+    def test_malformed_row_is_none(self):
+        assert decode_category_item([1]) is None
+        assert decode_category_item("1,0") is None
+
+    def test_dict_passes_through(self):
+        item = {"review_number": 1, "category": "other", "brief_issue": "x"}
+        assert decode_category_item(item) is item
+
+
+class TestDecodeCategories:
+    def test_expands_compact_rows(self):
+        result = decode_categories({"c": [[1, 0, "late"], [2, 2], [3]]})
+        assert [item["review_number"] for item in result["categories"]] == [1, 2]
+        assert result["categories"][1]["category"] == CATEGORY_KEYS[2]
+
+    def test_standard_format_passes_through(self):
+        parsed = {"categories": [{"review_number": 1, "category": "other", "brief_issue": ""}]}
+        assert decode_categories(parsed) is parsed
+
+    def test_empty_compact_array(self):
+        assert decode_categories({"c": None}) == {"categories": []}
@@ -1,9 +1,17 @@
+import os
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
-from core.data_loader import DataLoader
+from core.data_loader import (
+    DataLoader,
+    compact_ratings,
+    read_csv_fast,
+    window_bounds,
+    window_edges,
+)
 
 
 @pytest.fixture
@@ -88,6 +96,68 @@ class TestSplitByPeriod:
             )
 
 
+class TestWindows:
+    @pytest.fixture
+    def daily_df(self):
+        days = pd.date_range("2024-01-01", periods=10, freq="D")[::-1]
+        return pd.DataFrame({"review_id": range(10), "created_at": days})
+
+    def test_bounds_on_descending_column(self, daily_df):
+        edges = window_edges(pd.Timestamp("2024-01-10"), 3, 2)
+        assert edges[0] == pd.Timestamp("2024-01-04")
+        # [01-04, 01-07) and [01-07, 01-10]
+        assert window_bounds(daily_df["created_at"], edges) == [(4, 7), (0, 4)]
+
+    def test_bounds_on_ascending_column_with_nat(self, daily_df):
+        created_at = pd.concat([
+            daily_df["created_at"][::-1], pd.Series([pd.NaT, pd.NaT])
+        ], ignore_index=True)
+        edges = [pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-05")]
+
+        assert window_bounds(created_at, edges) == [(2, 5)]
+        assert window_bounds(created_at, edges, include_end=False) == [(2, 4)]
+
+    def test_consecutive_windows_match_masks(self, data_loader, daily_df):
+        windows = data_loader.split_consecutive_windows(daily_df, window_days=2, count=5)
+
+        assert [start for start, _ in windows] == list(
+            pd.date_range("2023-12-31", periods=5, freq="2D")
+        )
+        last_day = pd.Timestamp("2024-01-10")
+        for start, frame in windows:
+            end = start + timedelta(days=2)
+            created_at = daily_df["created_at"]
+            in_window = (created_at >= start) & (
+                (created_at < end) | ((end == last_day) & (created_at == end))
+            )
+            assert frame["review_id"].tolist() == daily_df[in_window]["review_id"].tolist()
+
+    def test_unsorted_frame_is_sorted_once(self, data_loader, daily_df):
+        shuffled = daily_df.sample(frac=1, random_state=0)
+        windows = data_loader.split_windows(
+            shuffled, [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-06")], include_end=False
+        )
+
+        assert sorted(windows[0]["review_id"]) == [5, 6, 7, 8, 9]
+
+    def test_split_by_period_returns_slices_without_mask_copies(
+        self, data_loader, sample_reviews_df,
+    ):
+        recent, comparison = data_loader.split_by_period(
+            sample_reviews_df, recent_days=30, comparison_days=60
+        )
+        max_date = sample_reviews_df["created_at"].max()
+        created_at = sample_reviews_df["created_at"]
+
+        assert recent["review_id"].tolist() == sample_reviews_df[
+            created_at >= max_date - timedelta(days=30)
+        ]["review_id"].tolist()
+        assert comparison["review_id"].tolist() == sample_reviews_df[
+            (created_at >= max_date - timedelta(days=60))
+            & (created_at < max_date - timedelta(days=30))
+        ]["review_id"].tolist()
+
+
 # ── load_custom_csv ──
 
 
@@ -106,9 +176,189 @@ class TestLoadCustomCsv:
         with pytest.raises(ValueError, match="Ratings.*Reviews"):
             data_loader.load_custom_csv(str(csv_path))
 
+    def test_ratings_are_int8(self, data_loader, tmp_path):
+        csv_path = tmp_path / "test.csv"
+        csv_path.write_text("Extra,Ratings,Reviews\nx,5,Great\ny,1,Bad\n")
+        result = data_loader.load_custom_csv(str(csv_path))
+        assert result["rating"].dtype == "int8"
+        assert "Extra" not in result.columns
+
     def test_filters_nan_reviews(self, data_loader, tmp_path):
         csv_path = tmp_path / "nan.csv"
         csv_path.write_text("Ratings,Reviews\n5,Good\n1,\n3,Average\n")
         result = data_loader.load_custom_csv(str(csv_path))
         # NaN 리뷰 제거됨
         assert all(result["review_text"].notna())
+
+
+class TestDownloadDataset:
+    @pytest.fixture
+    def downloaded(self, tmp_path):
+        path = tmp_path / "kaggle"
+        path.mkdir()
+        (path / "olist_order_reviews_dataset.csv").write_text("review_id\nr1\n")
+        return path
+
+    def test_download_is_registered_then_reused(self, data_loader, downloaded):
+        with patch("core.data_loader.kagglehub") as mock_kaggle:
+            mock_kaggle.dataset_download.return_value = str(downloaded)
+            first = data_loader.download_dataset()
+            second = data_loader.download_dataset()
+
+        assert mock_kaggle.dataset_download.call_count == 1
+        assert first == second
+        assert os.path.exists(os.path.join(first, "olist_order_reviews_dataset.csv"))
+
+    def test_offline_without_verified_copy_raises(self, data_loader):
+        with patch("core.data_loader.kagglehub") as mock_kaggle:
+            with pytest.raises(FileNotFoundError, match="offline"):
+                data_loader.download_dataset(offline=True)
+
+        mock_kaggle.dataset_download.assert_not_called()
+
+    def test_offline_uses_registered_copy(self, data_loader, downloaded, monkeypatch):
+        with patch("core.data_loader.kagglehub") as mock_kaggle:
+            mock_kaggle.dataset_download.return_value = str(downloaded)
+            registered = data_loader.download_dataset()
+        monkeypatch.setattr("core.config.DATASET_OFFLINE", True)
+
+        with patch("core.data_loader.kagglehub") as mock_kaggle:
+            assert data_loader.download_dataset() == registered
+        mock_kaggle.dataset_download.assert_not_called()
+
+    def test_corrupted_copy_is_downloaded_again(self, data_loader, downloaded):
+        with patch("core.data_loader.kagglehub") as mock_kaggle:
+            mock_kaggle.dataset_download.return_value = str(downloaded)
+            path = data_loader.download_dataset()
+            with open(os.path.join(path, "olist_order_reviews_dataset.csv"), "a",
+                      encoding="utf-8") as f:
+                f.write("r2\n")
+            data_loader.download_dataset()
+
+        assert mock_kaggle.dataset_download.call_count == 2
+
+
+class TestLoadReviewsCache:
+    @pytest.fixture
+    def olist_dir(self, tmp_path):
+        path = tmp_path / "olist"
+        path.mkdir()
+        (path / "olist_order_reviews_dataset.csv").write_text(
+            "review_id,order_id,review_score,review_comment_message\n"
+            "r1,o1,1,Late\nr2,o2,5,\nr3,o3,2,Broken\n"
+        )
+        (path / "olist_orders_dataset.csv").write_text(
+            "order_id,order_purchase_timestamp\n"
+            "o1,2018-01-01 10:00:00\no2,2018-01-02 10:00:00\no3,2018-01-03 10:00:00\n"
+        )
+        return path
+
+    def test_cached_load_matches_fresh_load(self, data_loader, olist_dir, monkeypatch):
+        monkeypatch.setattr("core.config.DATASET_CACHE_ENABLED", True)
+        first = data_loader.load_reviews(str(olist_dir))
+        with patch.object(DataLoader, "_build_olist_reviews") as mock_build:
+            second = data_loader.load_reviews(str(olist_dir))
+
+        mock_build.assert_not_called()
+        pd.testing.assert_frame_equal(first, second)
+        assert first["review_id"].tolist() == ["r3", "r1"]
+
+    def test_disabled_cache_always_rebuilds(self, data_loader, olist_dir, monkeypatch):
+        monkeypatch.setattr("core.config.DATASET_CACHE_ENABLED", False)
+        data_loader.load_reviews(str(olist_dir))
+
+        assert not os.path.exists(os.path.join(data_loader.data_path, "cache", "datasets"))
+
+
+class TestReadCsvFast:
+    def test_usecols_dtype_and_dates(self, tmp_path):
+        csv_path = tmp_path / "reviews.csv"
+        csv_path.write_text("a,text,when,unused\n1,hi,2024-01-02,x\n2,yo,bad,y\n")
+        df = read_csv_fast(
+            str(csv_path), usecols=["text", "when"], dtype={"text": "string"},
+            parse_dates=["when"],
+        )
+
+        assert list(df.columns) == ["text", "when"]
+        assert df["text"].dtype == "string"
+        assert df["when"].iloc[0] == pd.Timestamp("2024-01-02")
+        assert pd.isna(df["when"].iloc[1])
+
+    def test_logs_throughput(self, tmp_path, caplog):
+        csv_path = tmp_path / "reviews.csv"
+        csv_path.write_text("a\n1\n2\n")
+        with caplog.at_level("INFO", logger="core.data_loader"):
+            read_csv_fast(str(csv_path))
+
+        assert "2 rows" in caplog.text
+        assert "MB/s" in caplog.text
+
+
+class TestCompactRatings:
+    def test_whole_numbers_become_int8(self):
+        assert compact_ratings(pd.Series([1, 5, 3])).dtype == "int8"
+        assert compact_ratings(pd.Series(["4", "2.0"])).tolist() == [4, 2]
+
+    def test_fractional_or_missing_stay_float(self):
+        assert compact_ratings(pd.Series([4.5, 1.0])).dtype == "float32"
+        assert compact_ratings(pd.Series([4, None])).dtype == "float32"
+
+
+class TestChunkedLoading:
+    @pytest.fixture
+    def custom_csv(self, tmp_path):
+        rows = [(i % 5 + 1, f"Review {i}" if i % 7 else "") for i in range(50)]
+        path = tmp_path / "big.csv"
+        path.write_text(
+            "Ratings,Reviews\n" + "".join(f"{rating},{text}\n" for rating, text in rows)
+        )
+        return path
+
+    def test_chunks_are_bounded(self, data_loader, custom_csv):
+        chunks = list(data_loader.iter_custom_csv(str(custom_csv), chunk_size=8))
+
+        assert len(chunks) == 7
+        assert all(len(chunk) <= 8 for chunk in chunks)
+
+    def test_streamed_negatives_match_full_load(self, data_loader, custom_csv):
+        full = data_loader.filter_negative_reviews(data_loader.load_custom_csv(str(custom_csv)))
+        negative_df, stats = data_loader.load_negative_reviews_chunked(
+            data_loader.iter_custom_csv(str(custom_csv), chunk_size=8)
+        )
+
+        assert sorted(negative_df["review_id"]) == sorted(full["review_id"])
+        assert (negative_df["rating"] <= 3).all()
+        assert negative_df["review_text"].notna().all()
+        assert negative_df["created_at"].is_monotonic_decreasing
+        assert stats["total_reviews"] == 50 - 8  # 8 blank reviews (i % 7 == 0)
+
+    def test_only_negative_chunks_yielded(self, data_loader, custom_csv):
+        stats = {}
+        chunks = list(data_loader.iter_negative_reviews(
+            data_loader.iter_custom_csv(str(custom_csv), chunk_size=8), threshold=1, stats=stats,
+        ))
+
+        assert all((chunk["rating"] == 1).all() for chunk in chunks)
+        assert stats["first_date"] <= stats["last_date"]
+
+    def test_olist_chunks_match_full_load(self, data_loader, tmp_path):
+        olist = tmp_path / "olist"
+        olist.mkdir()
+        (olist / "olist_order_reviews_dataset.csv").write_text(
+            "review_id,order_id,review_score,review_comment_message\n"
+            + "".join(f"r{i},o{i},{i % 5 + 1},text {i}\n" for i in range(20))
+        )
+        (olist / "olist_orders_dataset.csv").write_text(
+            "order_id,order_purchase_timestamp\n"
+            + "".join(f"o{i},2018-01-{i + 1:02d} 10:00:00\n" for i in range(20))
+        )
+        full = data_loader.filter_negative_reviews(data_loader.load_reviews(str(olist)))
+        negative_df, stats = data_loader.load_negative_reviews_chunked(
+            data_loader.iter_olist_reviews(str(olist), chunk_size=6)
+        )
+
+        pd.testing.assert_frame_equal(
+            negative_df[full.columns].reset_index(drop=True), full.reset_index(drop=True)
+        )
+        assert stats["total_reviews"] == 20
+        assert stats["last_date"] == pd.Timestamp("2018-01-20 10:00:00")
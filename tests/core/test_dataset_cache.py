@@ -0,0 +1,100 @@
+import os
+
+import pandas as pd
+import pytest
+
+from core.utils import dataset_cache
+from core.utils.dataset_cache import load_cached_frame
+
+
+@pytest.fixture(params=["pickle", "feather"])
+def frame_format(request, monkeypatch):
+    if request.param == "feather":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(dataset_cache, "feather", None)
+    return request.param
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    return path
+
+
+def _loader(source, calls):
+    def build():
+        calls.append(1)
+        df = pd.read_csv(source)
+        df["when"] = pd.to_datetime("2024-01-01")
+        return df
+
+    return build
+
+
+def _load(tmp_path, source, calls, version=1):
+    return load_cached_frame(
+        str(tmp_path / "cache"), "frame", [str(source)], _loader(source, calls), version=version
+    )
+
+
+class TestLoadCachedFrame:
+    def test_second_load_reads_cache(self, tmp_path, source, frame_format):
+        calls = []
+        first, first_cached = _load(tmp_path, source, calls)
+        second, second_cached = _load(tmp_path, source, calls)
+
+        assert (first_cached, second_cached) == (False, True)
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert os.path.exists(tmp_path / "cache" / f"frame.{frame_format}")
+
+    @pytest.mark.usefixtures("frame_format")
+    def test_changed_source_rebuilds(self, tmp_path, source):
+        calls = []
+        _load(tmp_path, source, calls)
+        source.write_text("a,b\n1,x\n2,y\n3,z\n")
+        df, cached = _load(tmp_path, source, calls)
+
+        assert not cached
+        assert len(df) == 3
+
+    @pytest.mark.usefixtures("frame_format")
+    def test_touched_source_with_same_content_reuses(self, tmp_path, source):
+        calls = []
+        _load(tmp_path, source, calls)
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert _load(tmp_path, source, calls)[1]
+        assert _load(tmp_path, source, calls)[1]
+        assert len(calls) == 1
+
+    @pytest.mark.usefixtures("frame_format")
+    def test_same_size_different_content_rebuilds(self, tmp_path, source):
+        calls = []
+        _load(tmp_path, source, calls)
+        stat = os.stat(source)
+        source.write_text("a,b\n1,x\n2,z\n")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        df, cached = _load(tmp_path, source, calls)
+        assert not cached
+        assert df["b"].tolist() == ["x", "z"]
+
+    @pytest.mark.usefixtures("frame_format")
+    def test_version_bump_rebuilds(self, tmp_path, source):
+        calls = []
+        _load(tmp_path, source, calls)
+
+        assert not _load(tmp_path, source, calls, version=2)[1]
+
+    def test_corrupt_cache_rebuilds(self, tmp_path, source, frame_format):
+        calls = []
+        _load(tmp_path, source, calls)
+        (tmp_path / "cache" / f"frame.{frame_format}").write_bytes(b"garbage")
+
+        df, cached = _load(tmp_path, source, calls)
+        assert not cached
+        assert len(df) == 2
@@ -0,0 +1,72 @@
+import json
+import os
+
+import pytest
+
+from core.utils.dataset_registry import DatasetRegistry
+
+HANDLE = "owner/dataset"
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    path = tmp_path / "download"
+    (path / "nested").mkdir(parents=True)
+    (path / "a.csv").write_text("x,y\n1,2\n")
+    (path / "nested" / "b.csv").write_text("z\n3\n")
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return DatasetRegistry(str(tmp_path / "datasets"))
+
+
+class TestDatasetRegistry:
+    def test_register_copies_files_with_manifest(self, registry, source_dir):
+        path = registry.register(HANDLE, str(source_dir))
+
+        assert path == registry.files_path(HANDLE)
+        with open(os.path.join(path, "nested", "b.csv"), encoding="utf-8") as f:
+            assert f.read() == "z\n3\n"
+        with open(os.path.join(os.path.dirname(path), "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert set(manifest["files"]) == {"a.csv", os.path.join("nested", "b.csv")}
+        assert registry.verified_path(HANDLE) == path
+
+    def test_unregistered_handle_is_not_verified(self, registry):
+        assert registry.verified_path(HANDLE) is None
+
+    def test_tampered_file_fails_verification(self, registry, source_dir):
+        path = registry.register(HANDLE, str(source_dir))
+        target = os.path.join(path, "a.csv")
+        stat = os.stat(target)
+        with open(target, "w", encoding="utf-8") as f:
+            f.write("x,y\n9,9\n")  # same size, different content
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert registry.verified_path(HANDLE) is None
+
+    def test_missing_file_fails_verification(self, registry, source_dir):
+        path = registry.register(HANDLE, str(source_dir))
+        os.remove(os.path.join(path, "nested", "b.csv"))
+
+        assert not registry.verify(HANDLE)
+
+    def test_touched_file_with_same_content_passes(self, registry, source_dir):
+        path = registry.register(HANDLE, str(source_dir))
+        target = os.path.join(path, "a.csv")
+        stat = os.stat(target)
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert registry.verify(HANDLE)
+        assert registry.verify(HANDLE, deep=True)
+
+    def test_reregister_replaces_copy(self, registry, source_dir):
+        registry.register(HANDLE, str(source_dir))
+        (source_dir / "a.csv").write_text("new\n")
+        path = registry.register(HANDLE, str(source_dir))
+
+        with open(os.path.join(path, "a.csv"), encoding="utf-8") as f:
+            assert f.read() == "new\n"
+        assert registry.verify(HANDLE, deep=True)
@@ -0,0 +1,53 @@
+import pytest
+
+from core.utils.dedup import cluster_near_duplicates, dedup_key, group_duplicates
+
+LONG = "주문한 지 2주가 지났는데 아직도 배송이 안 왔어요 연락도 없네요"
+
+
+class TestDedupKey:
+    def test_ignores_punctuation_whitespace_and_jamo(self):
+        assert dedup_key("배송이 너무 늦어요!!") == dedup_key("배송이너무 늦어요 ㅠㅠ")
+
+    def test_collapses_repeated_characters(self):
+        assert dedup_key("최악이에요오오오오") == dedup_key("최악이에요오오")
+
+    def test_case_and_width_insensitive(self):
+        assert dedup_key("ＢＡＤ Product") == dedup_key("bad product")
+
+
+class TestClusterNearDuplicates:
+    def test_exact_key_matches_share_first_representative(self):
+        texts = ["늦어요", "다른 불만", "늦어요!!!"]
+        assert cluster_near_duplicates(texts) == [0, 1, 0]
+
+    def test_near_duplicate_long_reviews_merged(self):
+        texts = [LONG, "전혀 다른 내용의 리뷰입니다 상품 색상이 사진과 달라요", LONG + " 환불"]
+        assert cluster_near_duplicates(texts) == [0, 1, 0]
+
+    def test_short_texts_need_exact_match(self):
+        assert cluster_near_duplicates(["Review 12", "Review 120"]) == [0, 1]
+
+    def test_threshold_controls_merging(self):
+        texts = [LONG, LONG + " 환불해주세요 빨리요"]
+        assert cluster_near_duplicates(texts, threshold=0.99) == [0, 1]
+
+    def test_is_deterministic(self):
+        texts = [LONG + str(i % 3) for i in range(30)]
+        assert cluster_near_duplicates(texts) == cluster_near_duplicates(texts)
+
+    def test_empty(self):
+        assert cluster_near_duplicates([]) == []
+
+
+class TestGroupDuplicates:
+    def test_members_in_representative_order(self):
+        representatives, members = group_duplicates(["b", "a", "b!", "a?", "c"])
+
+        assert representatives == [0, 1, 4]
+        assert members == [[0, 2], [1, 3], [4]]
+
+    @pytest.mark.parametrize("texts", [["x"], ["x", "y"]])
+    def test_distinct_texts_are_singletons(self, texts):
+        representatives, members = group_duplicates(texts)
+        assert members == [[i] for i in representatives]
@@ -0,0 +1,46 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+from core import config  # pylint: disable=wrong-import-position
+from core.experiments.evaluate import Evaluator  # pylint: disable=wrong-import-position
+
+DELIVERY = ["배송이 너무 늦어요", "배송이 일주일이나 걸렸어요", "배송 지연이 심해요"]
+QUALITY = ["품질이 너무 별로예요", "한 번 쓰고 고장났어요", "품질 불량이에요"]
+
+
+@pytest.fixture
+def ground_truth(tmp_path):
+    path = tmp_path / "evaluation_dataset.csv"
+    pd.DataFrame({
+        "review_text": DELIVERY + QUALITY,
+        "manual_label": ["delivery_delay"] * 3 + ["poor_quality"] * 3,
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+class TestPredictCategories:
+    def test_evaluation_rows_never_seen_by_seeded_classifier(self, ground_truth, monkeypatch):
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_ENABLED", True)
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_SEED_PATH", ground_truth)
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_MIN_SAMPLES", 2)
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_THRESHOLD", 0.0)
+        with patch("core.analyzer.get_client", return_value=MagicMock()):
+            evaluator = Evaluator(ground_truth)
+        reviews = DELIVERY + QUALITY
+        response = json.dumps({"categories": [
+            {"review_number": i, "category": "other", "brief_issue": ""}
+            for i in range(1, len(reviews) + 1)
+        ]})
+
+        with patch("core.analyzer.call_openai_json", return_value=response) as mock_call:
+            predictions = evaluator.predict_categories(reviews)
+
+        assert predictions == ["other"] * len(reviews)
+        assert all(review in mock_call.call_args[0][1] for review in reviews)
+        assert config.LOCAL_CLASSIFIER_ENABLED
@@ -0,0 +1,174 @@
+import json
+import time
+
+import pytest
+from openai import AsyncOpenAI, InternalServerError, OpenAI, RateLimitError
+
+from core.reply_generator import _build_batch_prompt
+from core.utils.fake_openai_server import (
+    FakeOpenAIServer,
+    ReplayResponder,
+    fixed_latency,
+    synthetic_responder,
+)
+from core.utils.llm_recording import load_recordings
+from core.utils.openai_client import (
+    call_openai_json,
+    stream_openai_json_items,
+    stream_openai_json_items_async,
+)
+from core.utils.prompt_templates import (
+    build_compact_prompt,
+    build_zero_shot_prompt,
+    format_reviews,
+)
+from core.utils.review_categories import CATEGORY_KEYS
+
+
+def _client(server):
+    return OpenAI(base_url=server.base_url, api_key="test", max_retries=0)
+
+
+def _body(prompt):
+    return {
+        "model": "m",
+        "messages": [{"role": "system", "content": "s"}, {"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        "response_format": {"type": "json_object"},
+    }
+
+
+class TestSyntheticResponder:
+    def test_categories_cover_every_review(self):
+        prompt = build_zero_shot_prompt(format_reviews(["a", "b", "c"]), 3)
+        result = json.loads(synthetic_responder(_body(prompt)))
+
+        assert [item["review_number"] for item in result["categories"]] == [1, 2, 3]
+        assert all(item["category"] for item in result["categories"])
+
+    def test_is_deterministic(self):
+        body = _body(build_zero_shot_prompt(format_reviews(["late"]), 1))
+        assert synthetic_responder(body) == synthetic_responder(body)
+
+    def test_batch_replies(self):
+        reviews = [{"review_text": "broken", "rating": 1}, {"review_text": "late", "rating": 2}]
+        result = json.loads(synthetic_responder(_body(_build_batch_prompt(reviews))))
+
+        assert [r["review_index"] for r in result["replies"]] == [1, 2]
+
+    def test_compact_categories(self):
+        prompt = build_compact_prompt(format_reviews(["a", "b"]), 2)
+        result = json.loads(synthetic_responder(_body(prompt)))
+
+        assert [row[0] for row in result["c"]] == [1, 2]
+        assert all(0 <= row[1] < len(CATEGORY_KEYS) and row[2] for row in result["c"])
+
+    def test_compact_categories_without_brief_issue(self):
+        prompt = build_compact_prompt(format_reviews(["a", "b"]), 2, brief_issue=False)
+        result = json.loads(synthetic_responder(_body(prompt)))
+
+        assert all(len(row) == 2 for row in result["c"])
+
+    def test_unknown_prompt_returns_empty_object(self):
+        assert synthetic_responder(_body("hello")) == "{}"
+
+
+class TestRecordReplay:
+    def test_recorded_response_is_replayed(self, tmp_path, monkeypatch):
+        record_path = tmp_path / "recordings.jsonl"
+        monkeypatch.setattr("core.config.LLM_RECORD_PATH", str(record_path))
+        with FakeOpenAIServer(lambda body: '{"answer": 42}') as server:
+            call_openai_json(_client(server), "question", max_retries=0)
+
+        assert list(load_recordings(record_path).values()) == ['{"answer": 42}']
+
+        monkeypatch.setattr("core.config.LLM_RECORD_PATH", None)
+        with FakeOpenAIServer(ReplayResponder(record_path)) as server:
+            assert call_openai_json(_client(server), "question") == '{"answer": 42}'
+
+    def test_unrecorded_request_uses_fallback(self, tmp_path):
+        record_path = tmp_path / "recordings.jsonl"
+        record_path.write_text("", encoding="utf-8")
+        responder = ReplayResponder(record_path, fallback=lambda body: '{"fallback": true}')
+
+        assert responder(_body("new")) == '{"fallback": true}'
+
+    def test_unrecorded_request_without_fallback_is_server_error(self, tmp_path):
+        record_path = tmp_path / "recordings.jsonl"
+        record_path.write_text("", encoding="utf-8")
+        with FakeOpenAIServer(ReplayResponder(record_path)) as server:
+            with pytest.raises(InternalServerError):
+                call_openai_json(_client(server), "new", max_retries=0)
+
+
+class TestFaultInjection:
+    def test_error_rate_returns_configured_status(self):
+        with FakeOpenAIServer(error_rate=1.0, error_statuses=(429,)) as server:
+            with pytest.raises(RateLimitError):
+                call_openai_json(_client(server), "p", max_retries=0)
+
+    def test_retries_recover_from_injected_errors(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_BACKOFF_BASE_SECONDS", 0.0)
+        with FakeOpenAIServer(
+            lambda body: '{"ok": true}', error_rate=0.5, error_statuses=(503,), seed=1
+        ) as server:
+            results = [call_openai_json(_client(server), f"p{i}", max_retries=20) for i in range(5)]
+
+        assert results == ['{"ok": true}'] * 5
+
+    def test_latency_is_applied(self):
+        with FakeOpenAIServer(latency=fixed_latency(0.2)) as server:
+            started = time.perf_counter()
+            call_openai_json(_client(server), "p", max_retries=0)
+
+        assert time.perf_counter() - started >= 0.2
+
+    def test_token_latency_scales_with_output(self):
+        with FakeOpenAIServer(lambda body: '{"ok": true}', token_latency=0.05) as server:
+            started = time.perf_counter()
+            call_openai_json(_client(server), "p", max_retries=0)
+
+        assert time.perf_counter() - started >= 0.1
+
+
+class TestStreaming:
+    def test_stream_yields_categories_items(self):
+        prompt = build_zero_shot_prompt(format_reviews(["a", "b", "c"]), 3)
+        with FakeOpenAIServer(synthetic_responder) as server:
+            items = list(stream_openai_json_items(_client(server), prompt, "categories"))
+
+        assert [item["review_number"] for item in items] == [1, 2, 3]
+
+    def test_stream_fills_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", True)
+        monkeypatch.setattr("core.config.LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        prompt = build_zero_shot_prompt(format_reviews(["a"]), 1)
+        with FakeOpenAIServer(synthetic_responder) as server:
+            first = list(stream_openai_json_items(_client(server), prompt, "categories"))
+            second = list(stream_openai_json_items(_client(server), prompt, "categories"))
+            assert len(server.requests) == 1
+
+        assert first == second
+
+    def test_stream_without_array_key_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", True)
+        monkeypatch.setattr("core.config.LLM_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        with FakeOpenAIServer(lambda body: '{"results": [{"category": "a"}]}') as server:
+            with pytest.raises(ValueError, match="categories"):
+                list(stream_openai_json_items(_client(server), "p", "categories"))
+            with pytest.raises(ValueError):
+                list(stream_openai_json_items(_client(server), "p", "categories"))
+            assert len(server.requests) == 2  # the bad response is not cached
+
+    async def test_async_stream(self):
+        prompt = build_zero_shot_prompt(format_reviews(["a", "b"]), 2)
+        with FakeOpenAIServer(synthetic_responder) as server:
+            client = AsyncOpenAI(base_url=server.base_url, api_key="test", max_retries=0)
+            items = [
+                item async for item in stream_openai_json_items_async(
+                    prompt, "categories", client=client
+                )
+            ]
+            await client.close()
+
+        assert len(items) == 2
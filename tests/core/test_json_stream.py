@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from core.utils.json_stream import JSONArrayItemStream
+
+
+def _feed_in_chunks(parser, text, size):
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i:i + size]))
+    return items
+
+
+class TestJSONArrayItemStream:
+    def test_yields_each_item_when_complete(self):
+        parser = JSONArrayItemStream("categories")
+        assert parser.feed('{"categories": [{"review_number": 1, "category": "a"}') == [
+            {"review_number": 1, "category": "a"}
+        ]
+        assert not parser.feed(', {"review_number": 2')
+        assert parser.feed(', "category": "b"}]}') == [{"review_number": 2, "category": "b"}]
+
+    def test_braces_and_quotes_inside_strings(self):
+        doc = {"replies": [{"reply": 'a } b ] c \\" d {', "review_index": 1}]}
+        text = json.dumps(doc, ensure_ascii=False)
+        assert _feed_in_chunks(JSONArrayItemStream("replies"), text, 3) == doc["replies"]
+
+    def test_ignores_other_keys_and_nested_arrays(self):
+        doc = {
+            "note": "categories",
+            "other": [{"x": 1}],
+            "categories": [{"category": "a", "tags": [{"t": 1}]}],
+        }
+        text = "```json\n" + json.dumps(doc) + "\n```"
+        assert _feed_in_chunks(JSONArrayItemStream("categories"), text, 1) == doc["categories"]
+
+    def test_malformed_item_skipped(self):
+        parser = JSONArrayItemStream("categories")
+        items = parser.feed('{"categories": [{"a": 1,}, {"b": 2}]}')
+        assert items == [{"b": 2}]
+
+    def test_array_items(self):
+        text = '{"c": [[1, 0, "a ] b"], [2, 3]]}'
+        assert _feed_in_chunks(JSONArrayItemStream("c"), text, 2) == [[1, 0, "a ] b"], [2, 3]]
+
+    def test_root_closing_without_array_raises(self):
+        parser = JSONArrayItemStream("categories")
+        with pytest.raises(ValueError, match="categories"):
+            parser.feed('{"results": [{"category": "a"}]}')
+
+    def test_close_without_array_raises(self):
+        parser = JSONArrayItemStream("categories")
+        parser.feed('{"results": [')
+        with pytest.raises(ValueError):
+            parser.close()
+
+    def test_close_after_array_passes(self):
+        parser = JSONArrayItemStream("categories")
+        parser.feed('{"categories": []}')
+        parser.close()
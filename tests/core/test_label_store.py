@@ -0,0 +1,86 @@
+from argparse import Namespace
+
+import pytest
+
+from core import config
+from core.utils.cli_helpers import apply_no_cache_argument
+from core.utils.label_store import (
+    ReviewLabelStore,
+    get_label_store,
+    normalize_review_text,
+    review_hash,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = ReviewLabelStore(str(tmp_path / "labels.sqlite3"))
+    yield s
+    s.close()
+
+
+class TestNormalize:
+    def test_whitespace_and_case_insensitive(self):
+        assert review_hash("  배송이  너무\n늦어요 ") == review_hash("배송이 너무 늦어요")
+        assert review_hash("Late Delivery") == review_hash("late delivery")
+
+    def test_fullwidth_normalized(self):
+        assert normalize_review_text("ＡＢＣ") == "abc"
+
+    def test_different_text_different_hash(self):
+        assert review_hash("배송 지연") != review_hash("품질 불량")
+
+
+class TestReviewLabelStore:
+    def test_put_and_get(self, store):
+        store.put_many({"h1": {"category": "delivery_delay", "brief_issue": "늦음"}}, "m")
+        assert store.get_many(["h1", "h2"], "m") == {
+            "h1": {"category": "delivery_delay", "brief_issue": "늦음"}
+        }
+
+    def test_labels_scoped_by_labeler(self, store):
+        store.put_many({"h1": {"category": "other", "brief_issue": ""}}, "model-a")
+        assert store.get_many(["h1"], "model-b") == {}
+
+    def test_get_many_handles_large_batches(self, store):
+        labels = {f"h{i}": {"category": "other", "brief_issue": ""} for i in range(1200)}
+        store.put_many(labels, "m")
+        assert len(store.get_many(list(labels), "m")) == 1200
+
+    def test_labeled_examples_need_stored_text(self, store):
+        store.put_many(
+            {
+                "h1": {"category": "delivery_delay", "brief_issue": ""},
+                "h2": {"category": "other", "brief_issue": ""},
+            },
+            "m",
+            texts={"h1": "배송이 늦어요"},
+        )
+
+        assert store.labeled_examples("m") == [("배송이 늦어요", "delivery_delay")]
+        assert store.count("m") == 1
+        assert store.count("other-model") == 0
+
+    def test_count_labeled(self, store):
+        store.put_many({f"h{i}": {"category": "other", "brief_issue": ""} for i in range(600)}, "m")
+        assert store.count_labeled(["h1", "h1", "h599", "missing"], "m") == 2
+        assert store.count_labeled([f"h{i}" for i in range(700)], "m") == 600
+
+
+class TestNoCacheArgument:
+    @pytest.fixture(autouse=True)
+    def enabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", True)
+        monkeypatch.setattr("core.config.LABEL_STORE_ENABLED", True)
+        monkeypatch.setattr("core.config.LABEL_STORE_PATH", str(tmp_path / "labels.sqlite3"))
+
+    def test_no_cache_bypasses_label_store(self):
+        apply_no_cache_argument(Namespace(no_cache=True))
+
+        assert not config.LLM_CACHE_ENABLED
+        assert get_label_store() is None
+
+    def test_label_store_kept_without_flag(self):
+        apply_no_cache_argument(Namespace(no_cache=False))
+
+        assert get_label_store() is not None
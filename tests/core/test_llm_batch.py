@@ -0,0 +1,97 @@
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from openai import OpenAI
+
+from core.experiments.evaluate_finetuned import FinetunedEvaluator
+from core.utils.fake_openai_server import FakeOpenAIServer
+from core.utils.llm_batch import BatchItemError, batch_request, run_batch
+from core.utils.llm_cache import LLMCache, request_key
+
+
+def _category_responder(body):
+    review = body["messages"][-1]["content"].rsplit("Review:", 1)[-1]
+    if "boom" in review:
+        raise ValueError("synthetic failure")
+    category = "delivery_delay" if "late" in review else "poor_quality"
+    return json.dumps({"category": category})
+
+
+@pytest.fixture
+def server():
+    with FakeOpenAIServer(responder=_category_responder) as s:
+        yield s
+
+
+@pytest.fixture
+def client(server):
+    return OpenAI(base_url=server.base_url, api_key="test", max_retries=0)
+
+
+@pytest.fixture(autouse=True)
+def batch_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("core.config.LLM_BATCH_DIR", str(tmp_path / "batches"))
+    monkeypatch.setattr("core.config.LLM_BATCH_POLL_SECONDS", 0.01)
+    return tmp_path / "batches"
+
+
+class TestRunBatch:
+    def test_maps_results_by_custom_id(self, client, batch_dir):
+        lines = [batch_request("a", "arrived late"), batch_request("b", "it broke")]
+        results = run_batch(client, lines)
+
+        assert json.loads(results.content("a")) == {"category": "delivery_delay"}
+        assert json.loads(results.content("b")) == {"category": "poor_quality"}
+        written = list(batch_dir.glob("*.jsonl"))
+        assert len(written) == 1
+        assert len(written[0].read_text(encoding="utf-8").splitlines()) == 2
+
+    def test_failed_item_raises_on_access(self, client):
+        results = run_batch(
+            client, [batch_request("ok", "late"), batch_request("bad", "boom")],
+        )
+        assert len(results) == 1
+        with pytest.raises(BatchItemError, match="synthetic failure"):
+            results.content("bad")
+
+    def test_cached_requests_not_submitted(self, client, server, tmp_path, monkeypatch):
+        cache = LLMCache(str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr("core.utils.llm_cache.get_cache", lambda use_cache=None: cache)
+        cached_line = batch_request("hit", "already seen")
+        cache.set(request_key(cached_line["body"]), '{"category": "other"}')
+
+        results = run_batch(
+            client, [cached_line, batch_request("miss", "late")]
+        )
+
+        assert results.content("hit") == '{"category": "other"}'
+        assert [r["messages"][-1]["content"] for r in server.requests] == ["late"]
+        # 배치 결과는 캐시에 저장되어 다음 실행에서 재사용
+        assert cache.get(request_key(batch_request("miss", "late")["body"])) is not None
+        cache.close()
+
+    def test_all_cached_skips_upload(self, client, batch_dir, tmp_path, monkeypatch):
+        cache = LLMCache(str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr("core.utils.llm_cache.get_cache", lambda use_cache=None: cache)
+        line = batch_request("hit", "already seen")
+        cache.set(request_key(line["body"]), "{}")
+
+        assert run_batch(client, [line]).content("hit") == "{}"
+        assert not batch_dir.exists()
+        cache.close()
+
+
+class TestFinetunedEvaluatorBatch:
+    def test_batch_predictions_match_rows(self, client):
+        with patch("core.experiments.evaluate_finetuned.get_client", return_value=client):
+            evaluator = FinetunedEvaluator("ft:test")
+        df = pd.DataFrame({"review_text": ["arrived late", "boom", "cheap, it broke"]})
+
+        predictions, failures, _ = evaluator._run_predictions(  # pylint: disable=protected-access
+            df, batch=True
+        )
+
+        assert predictions == ["delivery_delay", None, "poor_quality"]
+        assert failures == [2]
@@ -0,0 +1,93 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.utils import llm_cache
+from core.utils.llm_cache import LLMCache, make_key
+from core.utils.openai_client import call_openai_json
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMCache(str(tmp_path / "cache.sqlite3"), max_bytes=1024, ttl_seconds=60)
+    yield c
+    c.close()
+
+
+class TestMakeKey:
+    def test_same_inputs_same_key(self):
+        assert make_key("m", 0.3, "sys", "p") == make_key("m", 0.3, "sys", "p")
+
+    def test_any_field_changes_key(self):
+        base = make_key("m", 0.3, "sys", "p", {"type": "json_object"})
+        assert make_key("m2", 0.3, "sys", "p", {"type": "json_object"}) != base
+        assert make_key("m", 0.0, "sys", "p", {"type": "json_object"}) != base
+        assert make_key("m", 0.3, "sys2", "p", {"type": "json_object"}) != base
+        assert make_key("m", 0.3, "sys", "p2", {"type": "json_object"}) != base
+        assert make_key("m", 0.3, "sys", "p", None) != base
+
+
+class TestLLMCache:
+    def test_miss_then_hit(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", "value")
+        assert cache.get("k") == "value"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self, cache):
+        cache.set("k", "value")
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_size(self, cache):
+        cache.set("old", "a" * 400)
+        cache.set("recent", "b" * 400)
+        cache.get("old")  # old가 최근 사용됨
+        cache.set("new", "c" * 400)
+        assert cache.get("recent") is None
+        assert cache.get("old") is not None
+        assert cache.stats()["bytes"] <= 1024
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "persist.sqlite3")
+        first = LLMCache(path)
+        first.set("k", "value")
+        first.close()
+        second = LLMCache(path)
+        assert second.get("k") == "value"
+        second.close()
+
+
+class TestCallOpenaiJsonCache:
+    def _client(self):
+        client = MagicMock()
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content='{"ok": true}'))]
+        client.chat.completions.create.return_value = response
+        return client
+
+    def test_second_call_served_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", True)
+        monkeypatch.setattr("core.config.LLM_CACHE_PATH", str(tmp_path / "c.sqlite3"))
+        client = self._client()
+
+        first = call_openai_json(client, "prompt")
+        second = call_openai_json(client, "prompt")
+
+        assert first == second == '{"ok": true}'
+        assert client.chat.completions.create.call_count == 1
+        assert llm_cache.cache_stats()["hits"] == 1
+
+    def test_bypass_forces_fresh_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_CACHE_ENABLED", True)
+        monkeypatch.setattr("core.config.LLM_CACHE_PATH", str(tmp_path / "c.sqlite3"))
+        client = self._client()
+
+        call_openai_json(client, "prompt")
+        call_openai_json(client, "prompt", use_cache=False)
+
+        assert client.chat.completions.create.call_count == 2
@@ -0,0 +1,101 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.utils import llm_metrics
+from core.utils.openai_client import call_openai_json
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    llm_metrics.reset()
+    yield
+    llm_metrics.reset()
+
+
+def _usage(prompt=120, completion=30, cached=100):
+    usage = MagicMock()
+    usage.prompt_tokens = prompt
+    usage.completion_tokens = completion
+    usage.prompt_tokens_details.cached_tokens = cached
+    return usage
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        hist = llm_metrics.Histogram((1, 5, 10))
+        for value in (0.5, 3, 7, 20):
+            hist.observe(value)
+        assert hist.counts == [1, 2, 3]
+        assert hist.count == 4
+        assert hist.total == 30.5
+
+
+class TestRecording:
+    def test_record_call_aggregates_by_site_and_model(self):
+        llm_metrics.record_call("categorize_issues", "m", _usage(), 1.5)
+        llm_metrics.record_call("categorize_issues", "m", _usage(), 0.5)
+        llm_metrics.record_cache_hit("categorize_issues", "m")
+        llm_metrics.record_error("reply_batch", "m")
+
+        rows = {row["call_site"]: row for row in llm_metrics.snapshot()}
+        assert rows["categorize_issues"]["calls"] == 2
+        assert rows["categorize_issues"]["cache_hits"] == 1
+        assert rows["categorize_issues"]["cached_tokens"] == 200
+        assert rows["categorize_issues"]["latency_seconds"]["sum"] == 2.0
+        assert rows["reply_batch"]["errors"] == 1
+
+    def test_missing_usage_recorded_as_zero(self):
+        llm_metrics.record_call(None, "m", None, 0.1)
+        row = llm_metrics.snapshot()[0]
+        assert row["call_site"] == llm_metrics.DEFAULT_CALL_SITE
+        assert row["prompt_tokens"]["sum"] == 0
+
+
+class TestExport:
+    def test_prometheus_format(self):
+        llm_metrics.record_call("rag", "gpt-4o-mini", _usage(), 0.3)
+        text = llm_metrics.render_prometheus({"llm_extra": ("Extra gauge", 7)})
+
+        assert "# TYPE llm_latency_seconds histogram" in text
+        assert 'llm_latency_seconds_bucket{call_site="rag",model="gpt-4o-mini",le="0.5"} 1' in text
+        assert 'llm_latency_seconds_bucket{call_site="rag",model="gpt-4o-mini",le="+Inf"} 1' in text
+        assert 'llm_calls_total{call_site="rag",model="gpt-4o-mini"} 1' in text
+        assert "llm_extra 7" in text
+
+    def test_extra_counters_typed_as_counter(self):
+        text = llm_metrics.render_prometheus(
+            {"llm_extra_bytes": ("Extra gauge", 3)},
+            {"llm_extra_total": ("Extra counter", 5)},
+        )
+
+        assert "# TYPE llm_extra_total counter\nllm_extra_total 5" in text
+        assert "# TYPE llm_extra_bytes gauge\nllm_extra_bytes 3" in text
+
+    def test_label_values_escaped(self):
+        llm_metrics.record_cache_hit('a"b', "m")
+        assert 'call_site="a\\"b"' in llm_metrics.render_prometheus()
+
+    def test_write_run_report(self, tmp_path):
+        llm_metrics.record_call("evaluate", "m", _usage(), 0.2)
+        path = llm_metrics.write_run_report(str(tmp_path / "r" / "usage.json"), {"mode": "x"})
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        assert report["mode"] == "x"
+        assert report["calls"][0]["call_site"] == "evaluate"
+
+
+class TestCallOpenaiJsonInstrumentation:
+    def test_records_call_site(self):
+        client = MagicMock()
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="{}"))]
+        response.usage = _usage(prompt=10, completion=5, cached=0)
+        client.chat.completions.create.return_value = response
+
+        call_openai_json(client, "prompt", model="m", call_site="generate_action_plan")
+
+        row = llm_metrics.snapshot()[0]
+        assert row["call_site"] == "generate_action_plan"
+        assert row["completion_tokens"]["sum"] == 5
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from openai import APIConnectionError, AuthenticationError
+
+from core.utils.llm_retry import (
+    LatencyTracker,
+    backoff_delay,
+    call_with_retry,
+    call_with_retry_async,
+    hedged_call,
+    hedged_call_async,
+)
+from core.utils.openai_client import call_openai_json
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _connection_error():
+    return APIConnectionError(request=_REQUEST)
+
+
+class TestBackoffDelay:
+    def test_bounded_by_exponential_ceiling(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_BACKOFF_BASE_SECONDS", 1.0)
+        monkeypatch.setattr("core.config.LLM_BACKOFF_MAX_SECONDS", 5.0)
+        for attempt, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            assert all(0 <= backoff_delay(attempt) <= ceiling for _ in range(20))
+
+
+class TestCallWithRetry:
+    @patch("core.utils.llm_retry.time.sleep")
+    def test_retries_then_succeeds(self, mock_sleep):
+        fn = MagicMock(side_effect=[_connection_error(), _connection_error(), "ok"])
+        assert call_with_retry(fn, max_retries=3) == "ok"
+        assert fn.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("core.utils.llm_retry.time.sleep")
+    def test_gives_up_after_max_retries(self, _mock_sleep):
+        fn = MagicMock(side_effect=_connection_error())
+        with pytest.raises(APIConnectionError):
+            call_with_retry(fn, max_retries=2)
+        assert fn.call_count == 3
+
+    def test_non_retryable_raises_immediately(self):
+        response = httpx.Response(401, request=_REQUEST)
+        fn = MagicMock(side_effect=AuthenticationError("bad key", response=response, body=None))
+        with pytest.raises(AuthenticationError):
+            call_with_retry(fn, max_retries=3)
+        assert fn.call_count == 1
+
+    async def test_async_retries(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_BACKOFF_BASE_SECONDS", 0.001)
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise _connection_error()
+            return "ok"
+
+        assert await call_with_retry_async(flaky, max_retries=2) == "ok"
+        assert len(calls) == 2
+
+
+class TestLatencyTracker:
+    def test_p95_requires_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record("k", 1.0)
+        assert tracker.p95("k") is None
+        tracker.record("k", 1.0)
+        assert tracker.p95("k") == 1.0
+
+    def test_p95_value(self):
+        tracker = LatencyTracker(min_samples=1)
+        for i in range(1, 101):
+            tracker.record("k", float(i))
+        assert tracker.p95("k") == 96.0
+
+
+class TestHedgedCall:
+    def test_fast_call_not_hedged(self):
+        fn = MagicMock(return_value="ok")
+        assert hedged_call(fn, hedge_after=1.0) == "ok"
+        assert fn.call_count == 1
+
+    def test_slow_call_hedged_and_backup_wins(self):
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2)  # 첫 요청은 멈춤
+                return "slow"
+            return "fast"
+
+        assert hedged_call(fn, hedge_after=0.05) == "fast"
+        release.set()
+        assert len(calls) == 2
+
+    async def test_async_hedge_cancels_loser(self):
+        started = []
+
+        async def fn():
+            started.append(1)
+            if len(started) == 1:
+                await asyncio.sleep(5)
+                return "slow"
+            return "fast"
+
+        began = time.perf_counter()
+        assert await hedged_call_async(fn, hedge_after=0.05) == "fast"
+        assert time.perf_counter() - began < 1
+
+
+class TestCallOpenaiJsonResilience:
+    @patch("core.utils.llm_retry.time.sleep")
+    def test_transient_failure_is_retried(self, _mock_sleep):
+        client = MagicMock()
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="{}"))]
+        client.chat.completions.create.side_effect = [_connection_error(), response]
+
+        assert call_openai_json(client, "prompt") == "{}"
+        assert client.chat.completions.create.call_count == 2
+
+    def test_passes_timeout(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_TIMEOUT_SECONDS", 12.0)
+        client = MagicMock()
+        client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(content="{}"))
+        ]
+        call_openai_json(client, "prompt")
+        assert client.chat.completions.create.call_args.kwargs["timeout"] == 12.0
@@ -0,0 +1,106 @@
+import pandas as pd
+import pytest
+
+from core.utils.label_store import ReviewLabelStore, review_hash
+from core.utils.local_classifier import (
+    LocalClassifier,
+    get_local_classifier,
+    load_seed_examples,
+    training_examples,
+)
+
+DELIVERY = ["배송이 너무 늦어요", "배송이 일주일이나 걸렸어요", "배송 지연이 심해요", "아직도 배송 중이에요"]
+QUALITY = ["품질이 너무 별로예요", "한 번 쓰고 고장났어요", "품질 불량이에요", "재질이 싸구려 같아요"]
+
+
+@pytest.fixture
+def classifier():
+    return LocalClassifier.train(
+        DELIVERY + QUALITY, ["delivery_delay"] * 4 + ["poor_quality"] * 4
+    )
+
+
+@pytest.fixture
+def seed_csv(tmp_path):
+    path = tmp_path / "evaluation_dataset.csv"
+    pd.DataFrame({
+        "review_text": DELIVERY + QUALITY + ["라벨 없음"],
+        "manual_label": ["delivery_delay"] * 4 + ["poor_quality"] * 4 + [" "],
+    }).to_csv(path, index=False)
+    return str(path)
+
+
+class TestLocalClassifier:
+    def test_predicts_obvious_complaints(self, classifier):
+        predictions = classifier.predict(["배송이 늦어서 화나요", "품질이 별로예요"])
+
+        assert [category for category, _ in predictions] == ["delivery_delay", "poor_quality"]
+        assert all(0 < confidence <= 1 for _, confidence in predictions)
+
+    def test_label_confident_respects_threshold(self, classifier):
+        texts = {"h1": "배송이 늦어요", "h2": "품질이 별로"}
+
+        assert classifier.label_confident(texts, threshold=1.01) == {}
+        labels = classifier.label_confident(texts, threshold=0.0)
+        assert labels["h1"] == {"category": "delivery_delay", "brief_issue": "", "source": "local"}
+
+    def test_training_rows_never_labeled(self, classifier):
+        texts = {review_hash(text): text for text in DELIVERY + QUALITY}
+
+        assert not classifier.label_confident(texts, threshold=0.0)
+
+    def test_single_class_not_trainable(self):
+        assert LocalClassifier.train(["a", "b"], ["other", "other"]) is None
+
+
+class TestTrainingData:
+    def test_seed_skips_unlabeled_rows(self, seed_csv):
+        assert len(load_seed_examples(seed_csv)) == 8
+
+    def test_missing_seed_file(self, tmp_path):
+        assert not load_seed_examples(str(tmp_path / "missing.csv"))
+
+    def test_manual_label_overrides_stored_llm_label(self, seed_csv, tmp_path):
+        store = ReviewLabelStore(str(tmp_path / "labels.sqlite3"))
+        text = DELIVERY[0]
+        store.put_many(
+            {review_hash(text): {"category": "other", "brief_issue": ""}}, "m",
+            texts={review_hash(text): text},
+        )
+
+        texts, labels = training_examples(store, "m", seed_path=seed_csv)
+        store.close()
+
+        assert len(texts) == 8
+        assert labels[texts.index(text)] == "delivery_delay"
+
+
+class TestGetLocalClassifier:
+    @pytest.fixture(autouse=True)
+    def enabled(self, monkeypatch, seed_csv):
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_ENABLED", True)
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_SEED_PATH", seed_csv)
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_MIN_SAMPLES", 4)
+        monkeypatch.setattr(
+            "core.utils.local_classifier._shared",
+            {"classifier": None, "key": None, "trained_on": None},
+        )
+
+    def test_trained_once_and_shared(self):
+        first = get_local_classifier(None, "m")
+        assert first is not None
+        assert get_local_classifier(None, "m") is first
+
+    def test_too_few_samples(self, monkeypatch):
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_MIN_SAMPLES", 100)
+        assert get_local_classifier(None, "m") is None
+
+    def test_seed_reviews_left_to_llm(self):
+        texts = {review_hash(text): text for text in DELIVERY + ["배송이 늦어서 화나요"]}
+        labels = get_local_classifier(None, "m").label_confident(texts, threshold=0.0)
+
+        assert list(labels) == [review_hash("배송이 늦어서 화나요")]
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr("core.config.LOCAL_CLASSIFIER_ENABLED", False)
+        assert get_local_classifier(None, "m") is None
@@ -1,6 +1,12 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from core.utils.openai_client import call_openai_json
+from core.utils.openai_client import (
+    aclose_async_client,
+    call_openai_json,
+    call_openai_json_async,
+    get_async_client,
+    get_client,
+)
 
 
 class TestCallOpenaiJson:
@@ -53,3 +59,33 @@ class TestCallOpenaiJson:
         call_kwargs = client.chat.completions.create.call_args
         messages = call_kwargs.kwargs["messages"]
         assert messages[0]["content"] == "Custom system"
+
+
+class TestSharedClients:
+    def test_get_client_returns_shared_instance(self, monkeypatch):
+        monkeypatch.setattr("core.utils.openai_client._clients", {"sync": None})
+        monkeypatch.setattr("core.utils.openai_client.config.OPENAI_API_KEY", "test-key")
+        assert get_client() is get_client()
+
+    async def test_get_async_client_shared_within_loop(self, monkeypatch):
+        monkeypatch.setattr("core.utils.openai_client.config.OPENAI_API_KEY", "test-key")
+        client = get_async_client()
+        assert get_async_client() is client
+        await aclose_async_client()
+        assert get_async_client() is not client
+        await aclose_async_client()
+
+
+class TestCallOpenaiJsonAsync:
+    async def test_returns_message_content(self):
+        client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="async result"))]
+        client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        result = await call_openai_json_async("prompt", client=client)
+
+        assert result == "async result"
+        call_kwargs = client.chat.completions.create.call_args
+        assert call_kwargs.kwargs["response_format"] == {"type": "json_object"}
+        assert call_kwargs.kwargs["messages"][1]["content"] == "prompt"
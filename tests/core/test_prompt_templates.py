@@ -1,4 +1,10 @@
-from core.utils.prompt_templates import format_reviews, build_zero_shot_prompt
+from core.utils.prompt_templates import (
+    build_compact_prompt,
+    build_zero_shot_prompt,
+    format_reviews,
+)
+from core.utils.review_categories import CATEGORY_KEYS
+from core.utils.token_budget import count_tokens
 
 
 class TestFormatReviews:
@@ -8,11 +14,11 @@ class TestFormatReviews:
         assert "2. Review two" in result
         assert "---" in result
 
-    def test_truncation_at_500_chars(self):
+    def test_long_review_truncated_to_token_budget(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_REVIEW_MAX_TOKENS", 20)
         long_text = "A" * 600
         result = format_reviews([long_text])
-        # format_reviews는 text[:500]으로 잘라냄
-        assert len(result.split(". ", 1)[1]) == 500
+        assert count_tokens(result.split(". ", 1)[1]) <= 20
 
     def test_empty_list(self):
         result = format_reviews([])
@@ -37,3 +43,19 @@ class TestBuildZeroShotPrompt:
     def test_contains_reviews_text(self):
         result = build_zero_shot_prompt("MY_REVIEW_TEXT", 1)
         assert "MY_REVIEW_TEXT" in result
+
+
+class TestBuildCompactPrompt:
+    def test_lists_every_category_code(self):
+        result = build_compact_prompt("reviews text", 3)
+        for code, key in enumerate(CATEGORY_KEYS):
+            assert f"{code}={key}" in result
+
+    def test_brief_issue_only_when_requested(self):
+        assert '"brief_issue"]' in build_compact_prompt("reviews text", 3)
+        assert "brief_issue" not in build_compact_prompt("reviews text", 3, brief_issue=False)
+
+    def test_rows_are_positional(self):
+        result = build_compact_prompt("MY_REVIEW_TEXT", 5)
+        assert "MY_REVIEW_TEXT" in result
+        assert '"review_number"' not in result
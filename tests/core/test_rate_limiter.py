@@ -0,0 +1,145 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import APIConnectionError
+
+from core.utils.openai_client import (
+    call_openai_json,
+    stream_openai_json_items,
+    stream_openai_json_items_async,
+)
+from core.utils.rate_limiter import RateLimiter, TokenBucket, estimate_request_tokens
+
+
+def _request(prompt="x" * 200, max_tokens=None):
+    request = {
+        "model": "m",
+        "messages": [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": prompt},
+        ],
+    }
+    if max_tokens:
+        request["max_tokens"] = max_tokens
+    return request
+
+
+class TestEstimateRequestTokens:
+    def test_longer_prompt_costs_more(self):
+        assert estimate_request_tokens(_request("x" * 2000)) > estimate_request_tokens(_request())
+
+    def test_uses_max_tokens_when_given(self):
+        small = estimate_request_tokens(_request(max_tokens=10))
+        large = estimate_request_tokens(_request(max_tokens=500))
+        assert large - small == 490
+
+
+class TestTokenBucket:
+    def test_no_wait_within_capacity(self):
+        bucket = TokenBucket(60)
+        assert bucket.reserve(60, bucket.updated) == 0.0
+
+    def test_wait_proportional_to_deficit(self):
+        bucket = TokenBucket(60)  # 1/sec
+        bucket.reserve(60, bucket.updated)
+        assert bucket.reserve(3, bucket.updated) == 3.0
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(60)
+        start = bucket.updated
+        bucket.reserve(60, start)
+        assert bucket.reserve(5, start + 5) == 0.0
+
+
+class TestRateLimiter:
+    def test_rpm_bucket_throttles(self):
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=10_000)
+        with patch("core.utils.rate_limiter.time.sleep") as mock_sleep:
+            limiter.acquire(10)
+            limiter.acquire(10)
+            limiter.acquire(10)
+        mock_sleep.assert_called_once()
+        assert 29 < mock_sleep.call_args[0][0] <= 30
+        stats = limiter.stats()
+        assert stats["acquired"] == 3
+        assert stats["waited"] == 1
+        assert stats["wait_seconds_max"] > 29
+
+    def test_reconcile_refunds_overestimate(self):
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+        limiter.acquire(1000)
+        limiter.reconcile(1000, 100)
+        with patch("core.utils.rate_limiter.time.sleep") as mock_sleep:
+            limiter.acquire(800)
+        mock_sleep.assert_not_called()
+
+    async def test_acquire_async_does_not_block_loop(self):
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=10_000)
+        limiter.acquire(1)
+        assert await limiter.acquire_async(1) == 0.0
+
+
+class TestCallOpenaiJsonRateLimit:
+    def test_acquires_and_reconciles(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_RATE_LIMIT_ENABLED", True)
+        client = MagicMock()
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="{}"))]
+        response.usage.total_tokens = 42
+        client.chat.completions.create.return_value = response
+        limiter = MagicMock()
+
+        with patch("core.utils.openai_client.get_rate_limiter", return_value=limiter):
+            call_openai_json(client, "prompt")
+
+        estimate = limiter.acquire.call_args[0][0]
+        limiter.reconcile.assert_called_once_with(estimate, 42)
+
+
+class TestStreamRateLimit:
+    @pytest.fixture
+    def limiter(self, monkeypatch):
+        monkeypatch.setattr("core.config.LLM_RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr("core.config.LLM_BACKOFF_BASE_SECONDS", 0.0)
+        limiter = MagicMock()
+        limiter.acquire_async = AsyncMock()
+        with patch("core.utils.openai_client.get_rate_limiter", return_value=limiter):
+            yield limiter
+
+    @staticmethod
+    def _chunks():
+        delta = MagicMock(content='{"items": [{"a": 1}]}')
+        return [MagicMock(choices=[MagicMock(delta=delta)], usage=None)]
+
+    @staticmethod
+    def _connection_error():
+        return APIConnectionError(request=httpx.Request("POST", "http://test"))
+
+    def test_each_retry_acquires(self, limiter):
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [self._connection_error(), self._chunks()]
+
+        items = list(stream_openai_json_items(client, "prompt", "items", max_retries=1))
+
+        assert items == [{"a": 1}]
+        assert limiter.acquire.call_count == 2
+
+    async def test_each_async_retry_acquires(self, limiter):
+        async def chunks():
+            for chunk in self._chunks():
+                yield chunk
+
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[self._connection_error(), chunks()]
+        )
+
+        items = [
+            item async for item in stream_openai_json_items_async(
+                "prompt", "items", client=client, max_retries=1
+            )
+        ]
+
+        assert items == [{"a": 1}]
+        assert limiter.acquire_async.await_count == 2
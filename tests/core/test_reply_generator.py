@@ -142,6 +142,33 @@ class TestGenerateBatch:
         assert results[0]["reply"] == "배송 지연 답변"
         assert results[1]["reply"] == "품질 불량 답변"
 
+    def test_near_duplicates_share_one_reply(self, mock_call, mock_client):
+        mock_call.return_value = MOCK_BATCH_RESPONSE
+        mock_client.return_value = MagicMock()
+
+        reviews = [
+            {"review_text": "배송 늦음!!", "rating": 2},
+            {"review_text": "품질 불량", "rating": 1},
+            {"review_text": "배송 늦음 ㅠㅠ", "rating": 2},
+        ]
+        results = ReplyGenerator().generate_batch(reviews)
+
+        assert "2개의" in mock_call.call_args[0][1]
+        assert [(r["review_index"], r["reply"]) for r in results] == [
+            (1, "배송 지연 답변"), (2, "품질 불량 답변"), (3, "배송 지연 답변"),
+        ]
+
+    def test_duplicates_with_different_rating_not_collapsed(self, mock_call, mock_client):
+        mock_call.return_value = MOCK_BATCH_RESPONSE
+        mock_client.return_value = MagicMock()
+
+        ReplyGenerator().generate_batch([
+            {"review_text": "배송 늦음", "rating": 2},
+            {"review_text": "배송 늦음", "rating": 1},
+        ])
+
+        assert "2개의" in mock_call.call_args[0][1]
+
     def test_empty_input(self, mock_call, mock_client):
         mock_client.return_value = MagicMock()
 
@@ -150,3 +177,53 @@ class TestGenerateBatch:
 
         assert not results
         mock_call.assert_not_called()
+
+
+@patch("core.reply_generator.get_client")
+@patch("core.reply_generator.call_openai_json_async")
+class TestGenerateAsync:
+    async def test_single_returns_parsed_reply(self, mock_call, mock_client):
+        mock_call.return_value = MOCK_SINGLE_RESPONSE
+        mock_client.return_value = MagicMock()
+
+        result = await ReplyGenerator().generate_single_async("배송이 늦었어요", 2)
+
+        assert result["tone"] == "공감+사과+안내"
+
+    async def test_batch_offsets_review_index_per_chunk(self, mock_call, mock_client):
+        mock_call.return_value = MOCK_BATCH_RESPONSE
+        mock_client.return_value = MagicMock()
+
+        reviews = [{"review_text": f"리뷰 {i}", "rating": 1} for i in range(12)]
+        results = await ReplyGenerator().generate_batch_async(reviews)
+
+        assert mock_call.call_count == 2
+        assert [r["review_index"] for r in results] == [1, 2, 11, 12]
+
+
+class TestStreamBatchAsync:
+    async def test_yields_offset_replies_from_every_chunk(self):
+        async def fake_stream(prompt, array_key, **_kwargs):
+            assert array_key == "replies"
+            for index in (1, 2):
+                yield {"review_index": index, "reply": prompt[:10]}
+
+        reviews = [{"review_text": f"리뷰 {i}", "rating": 1} for i in range(12)]
+        with patch("core.reply_generator.get_client"), patch(
+            "core.reply_generator.stream_openai_json_items_async", fake_stream
+        ):
+            results = [r async for r in ReplyGenerator().stream_batch_async(reviews)]
+
+        assert sorted(r["review_index"] for r in results) == [1, 2, 11, 12]
+
+    async def test_fans_out_to_duplicates(self):
+        async def fake_stream(*_args, **_kwargs):
+            yield {"review_index": 1, "reply": "답변"}
+
+        reviews = [{"review_text": "늦음", "rating": 1}, {"review_text": "늦음!", "rating": 1}]
+        with patch("core.reply_generator.get_client"), patch(
+            "core.reply_generator.stream_openai_json_items_async", fake_stream
+        ):
+            results = [r async for r in ReplyGenerator().stream_batch_async(reviews)]
+
+        assert [r["review_index"] for r in results] == [1, 2]
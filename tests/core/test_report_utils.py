@@ -1,4 +1,4 @@
-from core.report_utils import print_top_issues, print_emerging_issues
+from core.report_utils import print_emerging_issues, print_surges, print_top_issues
 
 
 class TestPrintTopIssues:
@@ -60,3 +60,19 @@ class TestPrintEmergingIssues:
         )
         output = capsys.readouterr().out
         assert "특이사항 없음" in output
+
+
+class TestPrintSurges:
+    def test_prints_p_value(self, capsys):
+        print_surges(
+            [{"day": "2024-01-11", "category": "delivery_delay", "count": 15.0,
+              "expected": 2.0, "z_score": 9.2, "p_value": 1.2e-8, "cusum": 8.7}],
+            header="Surges",
+        )
+        output = capsys.readouterr().out
+        assert "Delivery Delay (2024-01-11)" in output
+        assert "p=1.2e-08" in output
+
+    def test_prints_nothing_without_surges(self, capsys):
+        print_surges([], header="Surges")
+        assert capsys.readouterr().out == ""
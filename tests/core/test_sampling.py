@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from core.utils.sampling import (
+    POPULATION_KEY,
+    STRATUM_KEY,
+    assign_strata,
+    attach_strata,
+    estimate_category_totals,
+    stratified_sample,
+)
+
+
+@pytest.fixture
+def population_df():
+    base = datetime(2024, 6, 1)
+    rows = 1000
+    return pd.DataFrame({
+        "review_text": ["x" * (10 + i % 50) for i in range(rows)],
+        "rating": [1 if i < 800 else 3 for i in range(rows)],
+        "created_at": [base - timedelta(hours=i) for i in range(rows)],
+    })
+
+
+class TestStratifiedSample:
+    def test_sample_size_and_population(self, population_df):
+        sample, population = stratified_sample(population_df, 100, seed=0)
+
+        assert len(sample) == 100
+        assert sample.index.is_unique
+        assert sum(population.values()) == len(population_df)
+
+    def test_allocation_is_proportional_to_rating(self, population_df):
+        sample, _ = stratified_sample(population_df, 100, seed=0)
+        assert (sample["rating"] == 1).sum() == pytest.approx(80, abs=3)
+
+    def test_every_stratum_represented(self, population_df):
+        sample, population = stratified_sample(population_df, 100, seed=0)
+        assert set(sample[STRATUM_KEY]) == set(population)
+
+    def test_order_keys_make_sample_stable_across_windows(self, population_df):
+        keys = [f"{(i * 7919) % 1000:04d}" for i in range(len(population_df))]
+        first, _ = stratified_sample(population_df, 100, order_keys=keys)
+        again, _ = stratified_sample(population_df, 100, order_keys=keys)
+        assert list(first.index) == list(again.index)
+
+        window = population_df.iloc[:900]
+        shifted, _ = stratified_sample(window, 100, order_keys=keys[:900])
+        assert len(set(shifted.index) & set(first.index)) >= 70
+
+    def test_small_frame_returned_whole(self, population_df):
+        small = population_df.head(10)
+        sample, _ = stratified_sample(small, 50)
+        assert len(sample) == 10
+
+    def test_strata_without_date_column(self):
+        df = pd.DataFrame({"review_text": ["a", "bb", "ccc"], "rating": [1, 2, 2]})
+        assert assign_strata(df).str.startswith("r").all()
+
+
+class TestEstimateCategoryTotals:
+    def test_census_uses_raw_counts(self, sample_categorization):
+        estimates, size = estimate_category_totals(sample_categorization)
+
+        assert size == 10
+        assert estimates["delivery_delay"] == {"estimate": 4, "ci_low": 4, "ci_high": 4}
+
+    def test_scales_to_population_with_interval(self):
+        categorization = {"categories": [
+            {"review_number": i, "category": "a" if i <= 3 else "b", "brief_issue": ""}
+            for i in range(1, 11)
+        ]}
+        attach_strata(categorization, ["s"] * 10, {"s": 100})
+
+        estimates, size = estimate_category_totals(categorization)
+
+        assert size == 100
+        assert estimates["a"]["estimate"] == pytest.approx(30)
+        assert estimates["a"]["ci_low"] < 30 < estimates["a"]["ci_high"]
+        assert categorization[POPULATION_KEY] == {"s": 100}
+
+    def test_strata_are_weighted_separately(self):
+        categorization = {"categories": [
+            {"review_number": 1, "category": "a"},
+            {"review_number": 2, "category": "b"},
+        ]}
+        attach_strata(categorization, ["big", "small"], {"big": 90, "small": 10})
+
+        estimates, _ = estimate_category_totals(categorization)
+
+        assert estimates["a"]["estimate"] == 90
+        assert estimates["b"]["estimate"] == 10
+
+    def test_unsampled_strata_scaled_in(self):
+        categorization = {"categories": [{"review_number": 1, "category": "a"}]}
+        attach_strata(categorization, ["seen"], {"seen": 40, "unseen": 60})
+
+        estimates, size = estimate_category_totals(categorization)
+
+        assert size == 100
+        assert estimates["a"]["estimate"] == 100
@@ -0,0 +1,50 @@
+from core.utils.token_budget import count_tokens, pack_reviews, truncate_to_tokens
+
+
+class TestTruncateToTokens:
+    def test_short_text_unchanged(self):
+        assert truncate_to_tokens("Arrived late.", 50) == "Arrived late."
+
+    def test_cuts_at_sentence_boundary(self):
+        text = "Arrived late. " * 5 + "The box was crushed and the product inside was broken."
+        result = truncate_to_tokens(text, count_tokens("Arrived late. " * 3))
+
+        assert result.endswith("late.")
+        assert count_tokens(result) <= count_tokens("Arrived late. " * 3)
+
+    def test_hard_cut_without_sentence_boundary(self):
+        result = truncate_to_tokens("A" * 600, 20)
+        assert 0 < count_tokens(result) <= 20
+
+
+class TestPackReviews:
+    def test_output_budget_limits_batch_size(self):
+        batches = list(pack_reviews(
+            [f"review {i}" for i in range(10)],
+            output_budget=40 * 4,
+            output_tokens_per_review=40,
+        ))
+
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert batches[1].indices == [4, 5, 6, 7]
+
+    def test_input_budget_counts_overhead(self):
+        review = "x" * 40
+        per_review = count_tokens(review) + 4
+        batches = list(pack_reviews(
+            [review] * 6, overhead_tokens=100, input_budget=100 + per_review * 3,
+        ))
+
+        assert [len(b) for b in batches] == [3, 3]
+        assert batches[0].input_tokens == 100 + per_review * 3
+
+    def test_oversized_review_still_gets_own_batch(self):
+        batches = list(pack_reviews(["a", "b"], overhead_tokens=1000, input_budget=10))
+        assert [len(b) for b in batches] == [1, 1]
+
+    def test_long_reviews_truncated(self):
+        batch = next(pack_reviews(["A" * 2000], review_max_tokens=30))
+        assert count_tokens(batch.reviews[0]) <= 30
+
+    def test_empty_input_yields_nothing(self):
+        assert not list(pack_reviews([]))